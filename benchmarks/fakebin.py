@@ -0,0 +1,135 @@
+"""
+Scripted stand-in for wg, wg-quick, ip, nft, iptables-save and friends.
+
+Invoked as `fakebin.py <tool> [args...]` through the wrappers that
+benchmarks/run.py puts on PATH. Behaviour is controlled by environment:
+
+    WGUI_FAKE_STATE        directory holding the "up" interfaces
+    WGUI_FAKE_LATENCY_MS   sleep before every invocation
+    WGUI_FAKE_INTERFACES   number of extra interfaces/routes to report
+    WGUI_FAKE_PEERS        peers per interface in `wg show <if> dump`
+    WGUI_FAKE_NFT_RULES    rules in `nft list ruleset` / `iptables-save`
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+STATE = Path(os.environ.get("WGUI_FAKE_STATE", "/tmp/wgui-fake-state"))
+LATENCY = float(os.environ.get("WGUI_FAKE_LATENCY_MS", "0")) / 1000
+INTERFACES = int(os.environ.get("WGUI_FAKE_INTERFACES", "0"))
+PEERS = int(os.environ.get("WGUI_FAKE_PEERS", "1"))
+NFT_RULES = int(os.environ.get("WGUI_FAKE_NFT_RULES", "0"))
+
+
+def up_interfaces():
+    extra = [f"wgfake{i}" for i in range(INTERFACES)]
+    if STATE.exists():
+        extra += sorted(p.name for p in STATE.iterdir())
+    return extra
+
+
+def wg(args):
+    if args[:2] == ["show", "interfaces"]:
+        print(" ".join(up_interfaces()))
+    elif len(args) >= 3 and args[0] == "show" and args[2] == "dump":
+        if args[1] not in up_interfaces():
+            return 1
+        now = int(time.time())
+        print("cHJpdmF0ZQ==\tcHVibGlj\t51820\toff")
+        for i in range(PEERS):
+            print(f"peer{i}=\t(none)\t198.51.100.{i % 250 + 1}:51820\t10.0.{i // 250}.{i % 250}/32"
+                  f"\t{now - 5}\t{i * 1024}\t{i * 2048}\t25")
+    elif len(args) >= 3 and args[0] == "show":
+        if args[1] not in up_interfaces():
+            return 1
+        for i in range(PEERS):
+            print(f"peer{i}=\t{int(time.time()) - 5}")
+    elif args[:1] == ["set"]:
+        pass
+    return 0
+
+
+def wg_quick(args):
+    if len(args) != 2:
+        return 1
+    name = Path(args[1]).stem
+    STATE.mkdir(parents=True, exist_ok=True)
+    if args[0] == "up":
+        (STATE / name).touch()
+    elif args[0] == "down":
+        (STATE / name).unlink(missing_ok=True)
+    return 0
+
+
+def ip(args):
+    out = sys.stdout
+    obj = args[0] if args else ""
+    for i, name in enumerate(["lo", "eth0"] + up_interfaces()):
+        if obj == "route":
+            out.write(f"10.{i // 256}.{i % 256}.0/24 dev {name} proto kernel scope link\n")
+        elif obj == "rule":
+            out.write(f"{32000 - i}:\tfrom all lookup {100 + i}\n")
+        elif obj == "addr":
+            out.write(f"{i + 1}: {name}: <POINTOPOINT,NOARP,UP,LOWER_UP> mtu 1420 state UNKNOWN\n"
+                      f"    inet 10.{i // 256}.{i % 256}.1/24 scope global {name}\n")
+        elif obj == "link":
+            out.write(f"{i + 1}: {name}: <POINTOPOINT,NOARP,UP,LOWER_UP> mtu 1420 state UNKNOWN\n"
+                      f"    link/none\n")
+    return 0
+
+
+def nft(args):
+    if args[:2] == ["list", "ruleset"]:
+        out = sys.stdout
+        out.write("table inet filter {\n\tchain input {\n\t\ttype filter hook input priority 0;\n")
+        for i in range(NFT_RULES):
+            out.write(f"\t\tip saddr 10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256} tcp dport {i % 65535 + 1} accept\n")
+        out.write("\t}\n}\n")
+    elif args[:1] == ["-f"]:
+        source = sys.stdin if args[1:] == ["-"] else open(args[1])
+        source.read()
+    return 0
+
+
+def iptables_save(args):
+    out = sys.stdout
+    out.write("*filter\n:INPUT ACCEPT [0:0]\n:FORWARD ACCEPT [0:0]\n:OUTPUT ACCEPT [0:0]\n")
+    for i in range(NFT_RULES):
+        out.write(f"-A INPUT -s 10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}/32 -p tcp --dport {i % 65535 + 1} -j ACCEPT\n")
+    out.write("COMMIT\n")
+    return 0
+
+
+def consume_stdin(args):
+    sys.stdin.read()
+    return 0
+
+
+def noop(args):
+    return 0
+
+
+TOOLS = {
+    "wg": wg,
+    "wg-quick": wg_quick,
+    "ip": ip,
+    "nft": nft,
+    "iptables-save": iptables_save,
+    "iptables-restore": consume_stdin,
+    "ip6tables-restore": consume_stdin,
+    "resolvectl": noop,
+    "resolvconf": consume_stdin,
+    "lsmod": noop,
+}
+
+
+def main():
+    if LATENCY:
+        time.sleep(LATENCY)
+    tool = sys.argv[1]
+    return TOOLS[tool](sys.argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+Reproducible benchmarks for WireGuard GUI.
+
+Puts scripted fake wg/wg-quick/ip/nft/iptables-save binaries (see
+fakebin.py) on PATH, points the profile directory at a scratch dir and
+times the real backend and UI code against them.
+
+Usage:
+    python -m benchmarks.run                      # run everything, print results
+    python -m benchmarks.run --only status_refresh,profile_listing
+    python -m benchmarks.run --save               # store benchmarks/baselines/baseline.json
+    python -m benchmarks.run --compare            # fail if slower than the stored baseline
+
+Timings depend on the machine, so no baseline is committed: run --save
+once on a machine (e.g. on the base branch) before using --compare there.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "baseline.json"
+FAKE_TOOLS = ["wg", "wg-quick", "ip", "nft", "iptables-save", "iptables-restore",
+              "ip6tables-restore", "resolvectl", "resolvconf", "lsmod"]
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark. The function receives the context and returns the callable to time."""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+class Context:
+    def __init__(self, workdir: Path, args):
+        self.workdir = workdir
+        self.args = args
+        self.bin_dir = workdir / "bin"
+        self.state_dir = workdir / "state"
+        self.config_home = workdir / "config"
+        self.root = workdir / "root"
+
+    def install(self):
+        """Create the fake toolchain and point PATH/XDG dirs at the scratch dir."""
+        self.bin_dir.mkdir()
+        for tool in FAKE_TOOLS:
+            wrapper = self.bin_dir / tool
+            wrapper.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{BENCH_DIR / "fakebin.py"}" {tool} "$@"\n')
+            wrapper.chmod(0o755)
+
+        os.environ["PATH"] = f"{self.bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        os.environ["XDG_CONFIG_HOME"] = str(self.config_home)
+        os.environ["XDG_DATA_HOME"] = str(self.workdir / "data")
+        os.environ["WGUI_FAKE_STATE"] = str(self.state_dir)
+        os.environ["WGUI_FAKE_LATENCY_MS"] = str(self.args.latency_ms)
+        os.environ["WGUI_FAKE_INTERFACES"] = str(self.args.interfaces)
+        os.environ["WGUI_FAKE_PEERS"] = str(self.args.peers)
+        os.environ["WGUI_FAKE_NFT_RULES"] = str(self.args.nft_rules)
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+        # A small /etc tree for backup and restore
+        nm = self.root / "etc" / "NetworkManager" / "system-connections"
+        nm.mkdir(parents=True)
+        for i in range(50):
+            (nm / f"conn{i}.nmconnection").write_text(f"[connection]\nid=conn{i}\ntype=ethernet\n")
+        (self.root / "etc" / "systemd" / "network").mkdir(parents=True)
+        (self.root / "etc" / "resolv.conf").write_text("nameserver 192.0.2.53\n")
+
+    def write_profiles(self, count: int):
+        from src.utils.paths import get_profiles_dir
+        profiles_dir = get_profiles_dir()
+        existing = len(list(profiles_dir.glob("*.conf")))
+        for i in range(existing, count):
+            (profiles_dir / f"tunnel{i:05d}.conf").write_text(
+                "[Interface]\nPrivateKey = cHJpdmF0ZQ==\nAddress = 10.0.0.2/32\n\n"
+                f"[Peer]\nPublicKey = peer{i}=\nEndpoint = 127.0.0.1:51820\nAllowedIPs = 0.0.0.0/0\n"
+            )
+        return profiles_dir
+
+    def qt_app(self):
+        from PySide6.QtWidgets import QApplication
+        from src.ui.theme import theme_manager
+        app = QApplication.instance() or QApplication([])
+        # Like the app: the theme is in place before any window is built
+        theme_manager.apply("dark", app)
+        return app
+
+    def main_window(self):
+        from src.ui.main_window import MainWindow
+        from src.backend.wireguard import WireGuardService
+        from src.backend.profiles import ProfileManager
+        from src.backend.settings import SettingsManager
+        from src.backend.backup import NetworkBackupManager
+        return MainWindow(WireGuardService(), ProfileManager(), SettingsManager(),
+                          NetworkBackupManager(str(self.workdir / "ui-backups"), str(self.root)))
+
+
+@benchmark("status_refresh")
+def bench_status_refresh(ctx):
+    from src.backend.wireguard import WireGuardService
+    from src.backend.runner import runner
+    profiles_dir = ctx.write_profiles(1)
+    service = WireGuardService()
+    service.connect(str(profiles_dir / "tunnel00000.conf"))
+
+    def run():
+        # Measure the uncached path; repeated polls within the TTL are free
+        runner.invalidate()
+        service.get_status("tunnel00000")
+        service.get_peers("tunnel00000")
+    return run
+
+
+@benchmark("connect_disconnect")
+def bench_connect_disconnect(ctx):
+    from src.backend.wireguard import WireGuardService
+    path = str(ctx.write_profiles(1) / "tunnel00000.conf")
+    service = WireGuardService()
+
+    def run():
+        service.connect(path)
+        service.disconnect(path)
+    return run
+
+
+@benchmark("profile_listing")
+def bench_profile_listing(ctx):
+    from src.backend.profiles import ProfileManager
+    ctx.write_profiles(ctx.args.profiles)
+    manager = ProfileManager()
+    return manager.list_profiles
+
+
+@benchmark("backup_create")
+def bench_backup_create(ctx):
+    from src.backend.backup import NetworkBackupManager
+    runs = iter(range(1_000_000))
+
+    def run():
+        # Backup dirs are named per minute, so each run gets its own base
+        manager = NetworkBackupManager(str(ctx.workdir / "backups" / str(next(runs))), str(ctx.root))
+        assert manager.create_backup() is not None
+    return run
+
+
+@benchmark("backup_restore")
+def bench_backup_restore(ctx):
+    from src.backend.backup import NetworkBackupManager
+    manager = NetworkBackupManager(str(ctx.workdir / "restore-source"), str(ctx.root))
+    backup_dir = manager.create_backup()
+
+    def run():
+        assert manager.restore_backup(backup_dir)
+    return run
+
+
+@benchmark("ui_main_window")
+def bench_ui_main_window(ctx):
+    ctx.qt_app()
+    ctx.write_profiles(ctx.args.profiles)
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from src.ui.main_window import MainWindow
+    from src.backend.wireguard import WireGuardService
+    from src.backend.profiles import ProfileManager
+    from src.backend.settings import SettingsManager
+    from src.backend.backup import NetworkBackupManager
+    services = (WireGuardService(), ProfileManager(), SettingsManager(),
+                NetworkBackupManager(str(ctx.workdir / "ui-backups"), str(ctx.root)))
+
+    def run():
+        window = MainWindow(*services)
+        window.deleteLater()
+        # Without an event loop deferred deletes pile up and slow down
+        # every later app-wide update
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    return run
+
+
+@benchmark("ui_profile_population")
+def bench_ui_profile_population(ctx):
+    ctx.qt_app()
+    ctx.write_profiles(ctx.args.profiles)
+    return ctx.main_window().refresh_profiles
+
+
+@benchmark("ui_theme_switch")
+def bench_ui_theme_switch(ctx):
+    app = ctx.qt_app()
+    ctx.write_profiles(ctx.args.profiles)
+    from src.ui.theme import theme_manager
+    window = ctx.main_window()
+    window.show()
+    app.processEvents()
+    themes = iter(["light", "dark"] * 1_000_000)
+
+    def run(window=window):
+        # `window` is bound here so it stays alive; include its repaint
+        theme_manager.apply(next(themes), app)
+        app.processEvents()
+    return run
+
+
+# Registered last: the profiles it writes would skew the listing benchmarks
+@benchmark("provision_peers")
+def bench_provision_peers(ctx):
+    from src.backend.profiles import ProfileManager
+    from src.backend.provisioning import PeerProvisioner
+    runs = iter(range(1_000_000))
+    provisioner = PeerProvisioner(ProfileManager(), ctx.workdir / "servers")
+
+    def run():
+        # A fresh server (and pool) per run; a /16 holds the default 1000 peers
+        provisioner.provision(f"bench{next(runs)}", ctx.args.provision, "c2VydmVy",
+                              "vpn.example.com:51820", "10.200.0.0/16")
+    return run
+
+
+def time_benchmark(func, repeat: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "runs": repeat,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta: float) -> list:
+    """Return (name, baseline_median, current_median) for every regression."""
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+        delta = current["median"] - previous["median"]
+        if delta > min_delta and current["median"] > previous["median"] * (1 + tolerance):
+            regressions.append((name, previous["median"], current["median"]))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="WireGuard GUI benchmarks")
+    parser.add_argument("--only", help="comma separated benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--interfaces", type=int, default=100)
+    parser.add_argument("--peers", type=int, default=50)
+    parser.add_argument("--nft-rules", type=int, default=50000)
+    parser.add_argument("--profiles", type=int, default=10000)
+    parser.add_argument("--provision", type=int, default=1000, help="peers per provisioning run")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, type=Path,
+                        help="store results as a baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, type=Path,
+                        help="compare against a baseline and exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown before a regression is reported")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    sys.path.insert(0, str(BENCH_DIR.parent))
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "params": {k: getattr(args, k) for k in ("interfaces", "peers", "nft_rules", "profiles", "provision", "latency_ms")},
+        },
+        "benchmarks": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="wgui-bench-") as tmp:
+        ctx = Context(Path(tmp), args)
+        ctx.install()
+        for name in names:
+            func = BENCHMARKS[name](ctx)
+            result = time_benchmark(func, args.repeat, args.warmup)
+            results["benchmarks"][name] = result
+            print(f"{name:<24} median {result['median'] * 1000:10.2f} ms   min {result['min'] * 1000:10.2f} ms")
+
+    for path in filter(None, (args.output, args.save)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"Results written to {path}")
+
+    if args.compare:
+        if not args.compare.exists():
+            print(f"No baseline at {args.compare}; record one on this machine with --save first",
+                  file=sys.stderr)
+            return 2
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms / 1000)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,21 +4,31 @@ import datetime
 import logging
 from pathlib import Path
 from typing import List, Optional
+from src.utils.metrics import metrics
+from src.backend.runner import runner
 
 logger = logging.getLogger(__name__)
 
 class NetworkBackupManager:
-    def __init__(self, backup_base_dir: str = "/root/network-backups"):
+    def __init__(self, backup_base_dir: str = "/root/network-backups", system_root: str = "/"):
         # The script uses /root/network-backups, but strictly speaking
         # hardcoding /root/ inside python might be rigid.
         # However, following the script logic:
         self.backup_base = Path(backup_base_dir)
+        # Prefix for the /etc paths that are backed up and restored
+        # (only changed for benchmarks and tests)
+        self.system_root = Path(system_root)
+        self.etc = self.system_root / "etc"
 
     def create_backup(self) -> Optional[Path]:
         """
         Creates a backup of network configurations.
         Returns the path to the backup directory if successful, None otherwise.
         """
+        with metrics.span("backup_create"):
+            return self._create_backup()
+
+    def _create_backup(self) -> Optional[Path]:
         if not self.backup_base.exists():
             try:
                 self.backup_base.mkdir(parents=True, exist_ok=True)
@@ -42,10 +52,11 @@ class NetworkBackupManager:
             s = Path(src)
             if s.exists():
                 try:
-                    if s.is_dir():
-                        shutil.copytree(s, dst_dir / s.name, symlinks=True)
-                    else:
-                        shutil.copy2(s, dst_dir / s.name)
+                    with metrics.span("backup_step", step=f"copy {s}"):
+                        if s.is_dir():
+                            shutil.copytree(s, dst_dir / s.name, symlinks=True)
+                        else:
+                            shutil.copy2(s, dst_dir / s.name)
                 except Exception as e:
                     logger.warning(f"Failed to copy {s}: {e}")
 
@@ -53,19 +64,19 @@ class NetworkBackupManager:
         def run_save(cmd, out_file):
             try:
                 with open(out_file, "w") as f:
-                    subprocess.run(cmd, stdout=f, stderr=subprocess.DEVNULL, shell=False, check=False)
+                    runner.run(cmd, stdout=f, stderr=subprocess.DEVNULL, shell=False, check=False)
             except Exception as e:
                 logger.warning(f"Failed to run {' '.join(cmd)}: {e}")
 
         # Files/Dirs to copy
-        copy_safe("/etc/NetworkManager", backup_dir)
-        copy_safe("/etc/systemd/network", backup_dir)
+        copy_safe(self.etc / "NetworkManager", backup_dir)
+        copy_safe(self.etc / "systemd" / "network", backup_dir)
 
         # resolv.conf (copy-safe doesn't handle rename easily, so manual)
         try:
-            if Path("/etc/resolv.conf").exists():
+            if (self.etc / "resolv.conf").exists():
                  # Use copy (dereference symlinks per script `cp -L`)
-                 shutil.copy("/etc/resolv.conf", backup_dir / "resolv.conf", follow_symlinks=True)
+                 shutil.copy(self.etc / "resolv.conf", backup_dir / "resolv.conf", follow_symlinks=True)
         except Exception as e:
             logger.warning(f"Failed to copy resolv.conf: {e}")
 
@@ -97,30 +108,39 @@ class NetworkBackupManager:
 
         logger.info(f"Restoring backup from {backup_dir}")
 
+        with metrics.span("backup_restore"):
+            return self._restore_backup(backup_dir)
+
+    def _restore_backup(self, backup_dir: Path) -> bool:
         try:
             # Restore Directories
             nm_src = backup_dir / "NetworkManager"
             if nm_src.exists():
                 # We typically want to overwrite. shutil.copytree with dirs_exist_ok=True (Py3.8+)
-                shutil.copytree(nm_src, "/etc/NetworkManager", dirs_exist_ok=True)
+                with metrics.span("restore_step", step="copy /etc/NetworkManager"):
+                    shutil.copytree(nm_src, self.etc / "NetworkManager", dirs_exist_ok=True)
 
             sysd_src = backup_dir / "network"
             if sysd_src.exists():
-                shutil.copytree(sysd_src, "/etc/systemd/network", dirs_exist_ok=True)
+                with metrics.span("restore_step", step="copy /etc/systemd/network"):
+                    shutil.copytree(sysd_src, self.etc / "systemd" / "network", dirs_exist_ok=True)
 
             resolv_src = backup_dir / "resolv.conf"
             if resolv_src.exists():
-                shutil.copy2(resolv_src, "/etc/resolv.conf")
+                with metrics.span("restore_step", step="copy /etc/resolv.conf"):
+                    shutil.copy2(resolv_src, self.etc / "resolv.conf")
 
             # Restore Rules
             iptables_src = backup_dir / "iptables.rules"
             if iptables_src.exists():
+                cmd = ["iptables-restore"]
                 with open(iptables_src, "r") as f:
-                    subprocess.run(["iptables-restore"], stdin=f, check=False)
+                    runner.run(cmd, stdin=f, check=False)
 
             nft_src = backup_dir / "nftables.rules"
             if nft_src.exists():
-                 subprocess.run(["nft", "-f", str(nft_src)], check=False)
+                 cmd = ["nft", "-f", str(nft_src)]
+                 runner.run(cmd, check=False)
 
             return True
 
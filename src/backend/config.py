@@ -0,0 +1,77 @@
+import socket
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def parse_config(text: str) -> Dict:
+    """
+    Parse a wg-quick style config.
+    Returns {"interface": {key: value}, "peers": [{key: value}, ...]}.
+    Keys keep their original spelling (e.g. 'PublicKey', 'Endpoint').
+    """
+    config = {"interface": {}, "peers": []}
+    section = None
+    for raw_line in text.splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            name = line[1:-1].strip().lower()
+            if name == "interface":
+                section = config["interface"]
+            elif name == "peer":
+                section = {}
+                config["peers"].append(section)
+            else:
+                section = None
+            continue
+        if section is None or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key, value = key.strip(), value.strip()
+        # Repeated keys (Address, DNS, AllowedIPs) are merged like wg-quick does
+        if key in section:
+            section[key] = f"{section[key]}, {value}"
+        else:
+            section[key] = value
+    return config
+
+def read_config(path: str) -> Optional[Dict]:
+    """Read and parse a config file. Returns None if it can't be read."""
+    try:
+        return parse_config(Path(path).read_text())
+    except OSError as e:
+        logger.error(f"Failed to read config {path}: {e}")
+        return None
+
+def split_endpoint(endpoint: str) -> Tuple[str, int]:
+    """Split 'host:port' or '[v6addr]:port' into (host, port)."""
+    host, _, port = endpoint.strip().rpartition(":")
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1]
+    return host, int(port)
+
+def resolve_endpoint(endpoint: str) -> List[Tuple[str, int]]:
+    """
+    Resolve an Endpoint value to a list of (address, port) tuples.
+    Returns an empty list if the name can't be resolved.
+    """
+    try:
+        host, port = split_endpoint(endpoint)
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)
+    except (ValueError, OSError) as e:
+        logger.warning(f"Could not resolve endpoint {endpoint}: {e}")
+        return []
+    seen = []
+    for _family, _type, _proto, _canon, sockaddr in infos:
+        addr = (sockaddr[0], sockaddr[1])
+        if addr not in seen:
+            seen.append(addr)
+    return seen
+
+def format_endpoint(address: str, port: int) -> str:
+    if ":" in address:
+        return f"[{address}]:{port}"
+    return f"{address}:{port}"
@@ -0,0 +1,323 @@
+import ipaddress
+import socket
+import socketserver
+import struct
+import subprocess
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from src.utils.metrics import metrics
+from src.backend.runner import runner
+
+logger = logging.getLogger(__name__)
+
+# Loopback address the stub listens on. Avoids 127.0.0.53, which belongs
+# to systemd-resolved.
+STUB_ADDRESS = "127.0.0.153"
+STUB_PORT = 53
+
+UPSTREAM_TIMEOUT = 2.0
+MAX_CACHE_ENTRIES = 2048
+MAX_TTL = 86400
+# Used when a negative answer carries no SOA record (RFC 2308 section 5)
+DEFAULT_NEGATIVE_TTL = 60
+
+HEADER = struct.Struct("!HHHHHH")
+RR_FIXED = struct.Struct("!HHIH")
+
+TYPE_SOA = 6
+TYPE_OPT = 41
+RCODE_NOERROR = 0
+RCODE_NXDOMAIN = 3
+FLAG_TC = 0x0200
+
+
+def _skip_name(data: bytes, offset: int) -> int:
+    """Return the offset just past a (possibly compressed) domain name."""
+    while True:
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            return offset + 2
+        if length == 0:
+            return offset + 1
+        offset += length + 1
+
+
+def parse_question(packet: bytes) -> Optional[Tuple[bytes, int]]:
+    """
+    Extract the cache key (lowercased qname + qtype + qclass) of a
+    single-question DNS message and the offset where the question ends.
+    """
+    if len(packet) < HEADER.size:
+        return None
+    _id, _flags, qdcount, _an, _ns, _ar = HEADER.unpack_from(packet)
+    if qdcount != 1:
+        return None
+    try:
+        end = _skip_name(packet, HEADER.size) + 4
+    except IndexError:
+        return None
+    if end > len(packet):
+        return None
+    return packet[HEADER.size:end].lower(), end
+
+
+def parse_ttls(packet: bytes, question_end: int) -> Tuple[Optional[int], List[int]]:
+    """
+    Walk the resource records of a response.
+    Returns the TTL to cache it for (None if it must not be cached) and the
+    offsets of every TTL field, so a cached copy can have them rewritten.
+    """
+    _id, flags, _qd, ancount, nscount, arcount = HEADER.unpack_from(packet)
+    rcode = flags & 0x000F
+    if flags & FLAG_TC or rcode not in (RCODE_NOERROR, RCODE_NXDOMAIN):
+        return None, []
+
+    offsets = []
+    answer_ttls = []
+    negative_ttl = None
+    offset = question_end
+    try:
+        for index in range(ancount + nscount + arcount):
+            offset = _skip_name(packet, offset)
+            rtype, _rclass, ttl, rdlength = RR_FIXED.unpack_from(packet, offset)
+            if rtype != TYPE_OPT:
+                # The OPT pseudo-record uses this field for flags, not a TTL
+                offsets.append(offset + 4)
+                if index < ancount:
+                    answer_ttls.append(ttl)
+                elif index < ancount + nscount and rtype == TYPE_SOA and rdlength >= 20:
+                    minimum = struct.unpack_from("!I", packet, offset + RR_FIXED.size + rdlength - 4)[0]
+                    negative_ttl = min(ttl, minimum)
+            offset += RR_FIXED.size + rdlength
+    except (IndexError, struct.error):
+        return None, []
+
+    if answer_ttls:
+        return min(min(answer_ttls), MAX_TTL), offsets
+    return (negative_ttl if negative_ttl is not None else DEFAULT_NEGATIVE_TTL), offsets
+
+
+class DnsCache:
+    """LRU cache of raw DNS responses that honours record TTLs."""
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes, query_id: int, now: Optional[float] = None) -> Optional[bytes]:
+        """Return the cached response for key rewritten for query_id, or None."""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        expires, stored, packet, offsets = entry
+
+        response = bytearray(packet)
+        struct.pack_into("!H", response, 0, query_id)
+        elapsed = int(now - stored)
+        if elapsed:
+            for offset in offsets:
+                ttl = struct.unpack_from("!I", response, offset)[0]
+                struct.pack_into("!I", response, offset, max(ttl - elapsed, 0))
+        return bytes(response)
+
+    def put(self, key: bytes, packet: bytes, ttl: int, offsets: List[int], now: Optional[float] = None):
+        if ttl <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            self.entries[key] = (now + ttl, now, packet, offsets)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class _StubHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        query, sock = self.request
+        response = self.server.resolver.resolve(query)
+        if response:
+            sock.sendto(response, self.client_address)
+
+
+class _StubServer(socketserver.ThreadingMixIn, socketserver.UDPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubResolver:
+    """
+    Caching DNS forwarder bound to loopback. Queries are answered from the
+    cache when possible and otherwise forwarded to the upstream servers
+    in order until one replies.
+    """
+    def __init__(self, upstreams: List[str], address: str = STUB_ADDRESS, port: int = STUB_PORT,
+                 cache: Optional[DnsCache] = None):
+        self.upstreams = [self._upstream_addr(u) for u in upstreams]
+        self.address = address
+        self.port = port
+        self.cache = cache or DnsCache()
+        self.server = None
+        self.thread = None
+
+    @staticmethod
+    def _upstream_addr(upstream: str) -> Tuple[str, int]:
+        if upstream.startswith("[") and "]:" in upstream:
+            host, port = upstream[1:].split("]:")
+            return host, int(port)
+        if upstream.count(":") == 1:
+            host, port = upstream.split(":")
+            return host, int(port)
+        return upstream, 53
+
+    def start(self) -> bool:
+        try:
+            self.server = _StubServer((self.address, self.port), _StubHandler)
+        except OSError as e:
+            logger.error(f"Could not start DNS stub on {self.address}:{self.port}: {e}")
+            return False
+        self.server.resolver = self
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name="dns-stub", daemon=True)
+        self.thread.start()
+        logger.info(f"DNS stub listening on {self.address}:{self.port}, upstreams {self.upstreams}")
+        return True
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            self.thread = None
+        self.cache.clear()
+
+    def resolve(self, query: bytes) -> Optional[bytes]:
+        question = parse_question(query)
+        if question is None:
+            return self.forward(query)
+        key, question_end = question
+        query_id = struct.unpack_from("!H", query)[0]
+
+        cached = self.cache.get(key, query_id)
+        if cached is not None:
+            metrics.inc("dns_queries", result="hit")
+            return cached
+
+        metrics.inc("dns_queries", result="miss")
+        with metrics.span("dns_upstream"):
+            response = self.forward(query)
+        if response is not None and len(response) >= HEADER.size:
+            ttl, offsets = parse_ttls(response, question_end)
+            if ttl is not None:
+                self.cache.put(key, response, ttl, offsets)
+        return response
+
+    def forward(self, query: bytes) -> Optional[bytes]:
+        for host, port in self.upstreams:
+            family = socket.AF_INET6 if ":" in host else socket.AF_INET
+            with socket.socket(family, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(UPSTREAM_TIMEOUT)
+                try:
+                    sock.connect((host, port))
+                    sock.send(query)
+                    while True:
+                        response = sock.recv(65535)
+                        # Ignore stray datagrams that don't answer this query
+                        if response[:2] == query[:2]:
+                            return response
+                except OSError as e:
+                    logger.warning(f"DNS upstream {host}:{port} failed: {e}")
+        return None
+
+
+def parse_dns_servers(value: str) -> List[str]:
+    """
+    Extract server addresses from a DNS setting. Accepts the comma or space
+    separated form used by wg-quick, where non-address entries are search domains.
+    """
+    servers = []
+    for item in value.replace(",", " ").split():
+        try:
+            ipaddress.ip_address(item.strip("[]"))
+        except ValueError:
+            continue
+        servers.append(item)
+    return servers
+
+
+def parse_dns_domains(value: str) -> List[str]:
+    """The search domains in a wg-quick DNS setting (its non-address entries)."""
+    servers = parse_dns_servers(value)
+    return [item for item in value.replace(",", " ").split() if item not in servers]
+
+
+def use_stub_for_interface(interface: str, address: str = STUB_ADDRESS) -> bool:
+    """Point the system resolver for this tunnel at the stub."""
+    resolvectl = runner.which("resolvectl")
+    resolvconf = runner.which("resolvconf")
+    try:
+        if resolvectl:
+            for cmd in ([resolvectl, "dns", interface, address], [resolvectl, "domain", interface, "~."]):
+                runner.run(cmd, check=True, capture_output=True)
+            return True
+        if resolvconf:
+            # Same record name wg-quick uses, so `wg-quick down` removes it
+            cmd = [resolvconf, "-a", f"tun.{interface}", "-m", "0", "-x"]
+            runner.run(cmd, input=f"nameserver {address}\n", text=True, check=True, capture_output=True)
+            return True
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to switch DNS for {interface} to the stub: {e.stderr}")
+        return False
+    logger.warning("Neither resolvectl nor resolvconf found; DNS stub not applied.")
+    return False
+
+
+def set_interface_dns(interface: str, servers: List[str], domains: List[str] = ()) -> bool:
+    """
+    Give the tunnel these resolvers and search domains the way wg-quick
+    does, replacing the stub. Without servers the tunnel's DNS settings
+    are removed, as wg-quick leaves them for a config without DNS.
+    """
+    resolvectl = runner.which("resolvectl")
+    resolvconf = runner.which("resolvconf")
+    try:
+        if resolvectl:
+            if not servers:
+                cmds = [[resolvectl, "revert", interface]]
+            else:
+                cmds = [[resolvectl, "dns", interface, *servers],
+                        [resolvectl, "domain", interface, *(domains or [""])]]
+            for cmd in cmds:
+                runner.run(cmd, check=True, capture_output=True)
+            return True
+        if resolvconf:
+            if not servers:
+                runner.run([resolvconf, "-d", f"tun.{interface}", "-f"], check=True, capture_output=True)
+                return True
+            # What wg-quick itself feeds resolvconf
+            record = "".join(f"nameserver {server}\n" for server in servers)
+            if domains:
+                record += f"search {' '.join(domains)}\n"
+            cmd = [resolvconf, "-a", f"tun.{interface}", "-m", "0", "-x"]
+            runner.run(cmd, input=record, text=True, check=True, capture_output=True)
+            return True
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to set DNS for {interface}: {e.stderr}")
+        return False
+    logger.warning("Neither resolvectl nor resolvconf found; tunnel DNS not changed.")
+    return False
@@ -0,0 +1,234 @@
+import queue
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.utils.paths import get_config_dir
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Writes are queued and committed in batches of at most this many, at
+# least every FLUSH_INTERVAL seconds
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 2.0
+PRUNE_INTERVAL = 3600
+
+# Rollup table -> (bucket width in seconds, retention in seconds)
+ROLLUPS = {
+    "traffic_minute": (60, 7 * 86400),
+    "traffic_hour": (3600, 90 * 86400),
+    "traffic_day": (86400, 2 * 365 * 86400),
+}
+SAMPLE_RETENTION = 86400
+SESSION_RETENTION = 2 * 365 * 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL,
+    rx INTEGER NOT NULL DEFAULT 0,
+    tx INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_profile_started ON sessions (profile, started);
+CREATE TABLE IF NOT EXISTS samples (
+    profile TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    rx INTEGER NOT NULL,
+    tx INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_profile_ts ON samples (profile, ts);
+""" + "".join(f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    profile TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    rx INTEGER NOT NULL,
+    tx INTEGER NOT NULL,
+    PRIMARY KEY (profile, bucket)
+) WITHOUT ROWID;
+""" for table in ROLLUPS)
+
+_STOP = object()
+
+
+class HistoryStore:
+    """
+    Connection history and traffic counters in SQLite (WAL mode).
+
+    Callers only enqueue; a background writer commits in batches. Counter
+    samples are turned into deltas and added to minute/hour/day rollups at
+    write time, and old rows are pruned per table, so the database stays
+    bounded and range queries read a handful of indexed rollup rows.
+    """
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else get_config_dir() / "history.db"
+        self.queue = queue.Queue()
+        self.read_lock = threading.Lock()
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+        self.reader = self._connect(check_same_thread=False)
+
+        # Writer-thread state
+        self.last_counters: Dict[str, Tuple[int, int]] = {}
+        self.open_sessions: Dict[str, int] = {}
+        self.last_prune = 0.0
+
+        self.writer = threading.Thread(target=self._writer_loop, name="history-writer", daemon=True)
+        self.writer.start()
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # Producer API (any thread, never blocks on disk)
+
+    def start_session(self, profile: str, ts: Optional[float] = None):
+        self.queue.put(("start", profile, ts or time.time()))
+
+    def end_session(self, profile: str, ts: Optional[float] = None):
+        self.queue.put(("end", profile, ts or time.time()))
+
+    def record_sample(self, profile: str, rx: int, tx: int, ts: Optional[float] = None):
+        """Record cumulative transfer counters for a tunnel."""
+        self.queue.put(("sample", profile, int(ts or time.time()), rx, tx))
+
+    def prune(self, now: Optional[float] = None):
+        self.queue.put(("prune", now or time.time()))
+
+    def flush(self):
+        """Block until everything queued so far is committed."""
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(_STOP)
+        self.writer.join()
+        self.reader.close()
+
+    # Queries
+
+    def traffic(self, profile: str, days: int = 30, resolution: str = "traffic_day",
+                now: Optional[float] = None) -> List[Tuple[int, int, int]]:
+        """Return (bucket_start, rx, tx) rows for the last `days` days."""
+        if resolution not in ROLLUPS:
+            raise ValueError(f"Unknown resolution {resolution}")
+        since = int((now or time.time()) - days * 86400)
+        with self.read_lock:
+            return self.reader.execute(
+                f"SELECT bucket, rx, tx FROM {resolution} WHERE profile = ? AND bucket >= ? ORDER BY bucket",
+                (profile, since - since % ROLLUPS[resolution][0])
+            ).fetchall()
+
+    def total_traffic(self, profile: str, days: int = 30, now: Optional[float] = None) -> Tuple[int, int]:
+        rows = self.traffic(profile, days, now=now)
+        return sum(r[1] for r in rows), sum(r[2] for r in rows)
+
+    def sessions(self, profile: Optional[str] = None, limit: int = 50) -> List[Tuple]:
+        """Return recent (profile, started, ended, rx, tx) sessions, newest first."""
+        query = "SELECT profile, started, ended, rx, tx FROM sessions"
+        params = ()
+        if profile is not None:
+            query += " WHERE profile = ?"
+            params = (profile,)
+        with self.read_lock:
+            return self.reader.execute(query + " ORDER BY started DESC LIMIT ?", params + (limit,)).fetchall()
+
+    # Writer thread
+
+    def _writer_loop(self):
+        conn = self._connect()
+        stop = False
+        while not stop:
+            try:
+                batch = [self.queue.get(timeout=FLUSH_INTERVAL)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if _STOP in batch:
+                stop = True
+                batch = [op for op in batch if op is not _STOP]
+            try:
+                if batch:
+                    with metrics.span("history_write"), conn:
+                        self._apply(conn, batch)
+                if time.time() - self.last_prune > PRUNE_INTERVAL:
+                    with conn:
+                        self._prune(conn, time.time())
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write history: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self.queue.task_done()
+        conn.close()
+
+    def _apply(self, conn: sqlite3.Connection, batch: list):
+        samples = []
+        rollups = {table: {} for table in ROLLUPS}
+        prune_at = None
+
+        for op in batch:
+            kind, profile = op[0], op[1]
+            if kind == "start":
+                cur = conn.execute("INSERT INTO sessions (profile, started) VALUES (?, ?)", (profile, op[2]))
+                self.open_sessions[profile] = cur.lastrowid
+                # A new interface counts from zero
+                self.last_counters[profile] = (0, 0)
+            elif kind == "end":
+                session_id = self.open_sessions.pop(profile, None)
+                if session_id is not None:
+                    conn.execute("UPDATE sessions SET ended = ? WHERE id = ?", (op[2], session_id))
+                self.last_counters.pop(profile, None)
+            elif kind == "sample":
+                _, profile, ts, rx, tx = op
+                samples.append((profile, ts, rx, tx))
+                # Without a known baseline (e.g. first sample after a restart
+                # with the tunnel still up) this sample only sets one
+                prev_rx, prev_tx = self.last_counters.get(profile, (rx, tx))
+                # Counters restart from zero when the interface is recreated
+                d_rx = rx - prev_rx if rx >= prev_rx else rx
+                d_tx = tx - prev_tx if tx >= prev_tx else tx
+                self.last_counters[profile] = (rx, tx)
+                if not (d_rx or d_tx):
+                    continue
+                for table, (width, _retention) in ROLLUPS.items():
+                    key = (profile, ts - ts % width)
+                    acc = rollups[table].get(key, (0, 0))
+                    rollups[table][key] = (acc[0] + d_rx, acc[1] + d_tx)
+                session_id = self.open_sessions.get(profile)
+                if session_id is not None:
+                    conn.execute("UPDATE sessions SET rx = rx + ?, tx = tx + ? WHERE id = ?",
+                                 (d_rx, d_tx, session_id))
+            elif kind == "prune":
+                # Applied after this batch's rows are written
+                prune_at = op[1]
+
+        if samples:
+            conn.executemany("INSERT INTO samples (profile, ts, rx, tx) VALUES (?, ?, ?, ?)", samples)
+        for table, rows in rollups.items():
+            if rows:
+                conn.executemany(
+                    f"INSERT INTO {table} (profile, bucket, rx, tx) VALUES (?, ?, ?, ?) "
+                    f"ON CONFLICT (profile, bucket) DO UPDATE SET rx = rx + excluded.rx, tx = tx + excluded.tx",
+                    [(p, b, rx, tx) for (p, b), (rx, tx) in rows.items()]
+                )
+        if prune_at is not None:
+            self._prune(conn, prune_at)
+
+    def _prune(self, conn: sqlite3.Connection, now: float):
+        conn.execute("DELETE FROM samples WHERE ts < ?", (int(now - SAMPLE_RETENTION),))
+        for table, (_width, retention) in ROLLUPS.items():
+            conn.execute(f"DELETE FROM {table} WHERE bucket < ?", (int(now - retention),))
+        conn.execute("DELETE FROM sessions WHERE started < ?", (now - SESSION_RETENTION,))
+        self.last_prune = time.time()
@@ -0,0 +1,181 @@
+import subprocess
+import logging
+from typing import Iterable, List, Tuple
+from src.backend.config import read_config, resolve_endpoint
+from src.backend.runner import runner
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "wgui_killswitch"
+CHAIN_NAME = "WGUI_KILLSWITCH"
+
+class KillSwitch:
+    """
+    Blocks all outgoing traffic except through the tunnel, loopback and
+    to the tunnel's own endpoints. Rules are loaded as a single nftables
+    transaction, falling back to iptables-restore when nft is missing.
+    """
+    def __init__(self):
+        self.nft_path = runner.which("nft")
+        self.iptables_restore_path = runner.which("iptables-restore")
+        self.ip6tables_restore_path = runner.which("ip6tables-restore")
+        self.backend = None
+
+    @staticmethod
+    def build_nft_ruleset(interface: str, endpoints: Iterable[Tuple[str, int]],
+                          allowed_interfaces: Iterable[str] = ("lo",)) -> str:
+        """
+        Render the kill switch as one nft script. The leading
+        'table' + 'delete table' pair makes loading it replace any previous
+        version within the same transaction.
+        """
+        ifaces = sorted(set(allowed_interfaces) | {interface})
+        v4 = sorted({f"{addr} . {port}" for addr, port in endpoints if ":" not in addr})
+        v6 = sorted({f"{addr} . {port}" for addr, port in endpoints if ":" in addr})
+
+        def elements(items):
+            if not items:
+                return ""
+            return f"\n        elements = {{ {', '.join(items)} }}"
+
+        iface_items = [f'"{name}"' for name in ifaces]
+        return (
+            f"table inet {TABLE_NAME}\n"
+            f"delete table inet {TABLE_NAME}\n"
+            f"table inet {TABLE_NAME} {{\n"
+            f"    set allowed_ifaces {{\n"
+            f"        type ifname{elements(iface_items)}\n"
+            f"    }}\n"
+            f"    set endpoints_v4 {{\n"
+            f"        type ipv4_addr . inet_service{elements(v4)}\n"
+            f"    }}\n"
+            f"    set endpoints_v6 {{\n"
+            f"        type ipv6_addr . inet_service{elements(v6)}\n"
+            f"    }}\n"
+            f"    chain output {{\n"
+            f"        type filter hook output priority 0; policy drop;\n"
+            f"        oifname @allowed_ifaces accept\n"
+            f"        ip daddr . udp dport @endpoints_v4 accept\n"
+            f"        ip6 daddr . udp dport @endpoints_v6 accept\n"
+            f"    }}\n"
+            f"}}\n"
+        )
+
+    @staticmethod
+    def build_iptables_rules(interface: str, endpoints: Iterable[Tuple[str, int]],
+                             allowed_interfaces: Iterable[str] = ("lo",), ipv6: bool = False) -> str:
+        """Render the kill switch as an iptables-restore --noflush script."""
+        ifaces = sorted(set(allowed_interfaces) | {interface})
+        lines = ["*filter", f":{CHAIN_NAME} - [0:0]"]
+        lines += [f"-A {CHAIN_NAME} -o {name} -j ACCEPT" for name in ifaces]
+        for addr, port in sorted(set(endpoints)):
+            if (":" in addr) == ipv6:
+                lines.append(f"-A {CHAIN_NAME} -d {addr} -p udp --dport {port} -j ACCEPT")
+        lines += [f"-A {CHAIN_NAME} -j DROP", f"-I OUTPUT 1 -j {CHAIN_NAME}", "COMMIT", ""]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _teardown_iptables_rules() -> str:
+        return "\n".join([
+            "*filter", f"-D OUTPUT -j {CHAIN_NAME}", f"-F {CHAIN_NAME}", f"-X {CHAIN_NAME}", "COMMIT", ""
+        ])
+
+    def get_endpoints(self, config_path: str) -> List[Tuple[str, int]]:
+        """
+        Resolve every peer Endpoint in the config to (address, port) pairs.
+        Empty if any of them does not resolve, since a partial set would
+        block traffic to that peer.
+        """
+        config = read_config(config_path)
+        if config is None:
+            return []
+        endpoints = []
+        for peer in config["peers"]:
+            if peer.get("Endpoint"):
+                addresses = resolve_endpoint(peer["Endpoint"])
+                if not addresses:
+                    logger.warning(f"Could not resolve endpoint {peer['Endpoint']}")
+                    return []
+                endpoints.extend(addresses)
+        return endpoints
+
+    def enable(self, interface: str, config_path: str,
+               allowed_interfaces: Iterable[str] = ("lo",)) -> bool:
+        """
+        Load (or atomically replace) the kill switch for a tunnel. Without
+        resolved endpoints nothing is loaded, as the rules would cut the
+        tunnel off from its peers; rules already in place stay.
+        """
+        endpoints = self.get_endpoints(config_path)
+        if not endpoints:
+            logger.error(f"No resolvable peer endpoints for {interface}; kill switch not loaded")
+            return False
+
+        if self.nft_path:
+            ruleset = self.build_nft_ruleset(interface, endpoints, allowed_interfaces)
+            if self._restore([self.nft_path, "-f", "-"], ruleset):
+                self.backend = "nft"
+                logger.info(f"Kill switch enabled for {interface} (nftables)")
+                return True
+            if not self.iptables_restore_path:
+                return False
+            logger.warning("Loading the nftables kill switch failed, falling back to iptables")
+
+        if self.iptables_restore_path:
+            # iptables has no table replace; drop any previous chain first
+            self.disable()
+            ok = self._restore([self.iptables_restore_path, "--noflush"],
+                               self.build_iptables_rules(interface, endpoints, allowed_interfaces))
+            if ok and self.ip6tables_restore_path:
+                ok = self._restore([self.ip6tables_restore_path, "--noflush"],
+                                   self.build_iptables_rules(interface, endpoints, allowed_interfaces, ipv6=True))
+            self.backend = "iptables"
+            if ok:
+                logger.info(f"Kill switch enabled for {interface} (iptables)")
+            return ok
+
+        logger.error("Neither nft nor iptables-restore found; kill switch unavailable.")
+        return False
+
+    def disable(self) -> bool:
+        """
+        Remove the kill switch in a single transaction. Safe to call when
+        none is loaded; if it is not known which backend loaded it (e.g. an
+        earlier run did), both are cleared.
+        """
+        backend, self.backend = self.backend, None
+        if not (self.nft_path or self.iptables_restore_path or self.ip6tables_restore_path):
+            return False
+
+        ok = True
+        if self.nft_path and backend in ("nft", None):
+            # 'table' first so deleting a missing table is not an error
+            ok = self._restore([self.nft_path, "-f", "-"],
+                               f"table inet {TABLE_NAME}\ndelete table inet {TABLE_NAME}\n")
+        if backend == "iptables" or (backend is None and not self.nft_path):
+            for path in (self.iptables_restore_path, self.ip6tables_restore_path):
+                if path:
+                    ok = self._restore([path, "--noflush"], self._teardown_iptables_rules(), quiet=True) and ok
+        elif backend is None:
+            # Leftover chain from an iptables fallback; usually there is none
+            for path in (self.iptables_restore_path, self.ip6tables_restore_path):
+                if path:
+                    self._restore([path, "--noflush"], self._teardown_iptables_rules(), quiet=True)
+        if ok:
+            logger.info("Kill switch disabled")
+        return ok
+
+    def is_active(self) -> bool:
+        return self.backend is not None
+
+    def _restore(self, cmd: List[str], script: str, quiet: bool = False) -> bool:
+        try:
+            runner.run(cmd, input=script, text=True, check=True, capture_output=True)
+            return True
+        except subprocess.CalledProcessError as e:
+            if not quiet:
+                logger.error(f"Failed to run {' '.join(cmd)}: {e.stderr}")
+            return False
+        except OSError as e:
+            logger.error(f"Failed to run {' '.join(cmd)}: {e}")
+            return False
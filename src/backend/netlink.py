@@ -0,0 +1,241 @@
+import socket
+import struct
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict
+
+logger = logging.getLogger(__name__)
+
+# Message types (linux/netlink.h, linux/rtnetlink.h)
+NLMSG_NOOP = 1
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_NEWADDR = 20
+RTM_DELADDR = 21
+RTM_NEWROUTE = 24
+RTM_DELROUTE = 25
+
+# Multicast groups
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV4_ROUTE = 0x40
+RTMGRP_IPV6_IFADDR = 0x100
+RTMGRP_IPV6_ROUTE = 0x400
+
+# Attribute types
+IFLA_IFNAME = 3
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_LABEL = 3
+RTA_DST = 1
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_TABLE = 15
+
+RT_TABLE_MAIN = 254
+
+IFF_UP = 0x1
+IFF_RUNNING = 0x40
+
+# Route flags (linux/route.h), as shown in /proc/net/*route
+RTF_UP = 0x1
+RTF_REJECT = 0x200
+PROC_ROUTE = "/proc/net/route"
+PROC_IPV6_ROUTE = "/proc/net/ipv6_route"
+
+NLMSGHDR = struct.Struct("=IHHII")
+IFINFOMSG = struct.Struct("=BxHiII")
+IFADDRMSG = struct.Struct("=BBBBi")
+RTMSG = struct.Struct("=BBBBBBBBI")
+RTATTR = struct.Struct("=HH")
+
+LINK_TYPES = {RTM_NEWLINK: "link_up", RTM_DELLINK: "link_removed"}
+ADDR_TYPES = {RTM_NEWADDR: "addr_added", RTM_DELADDR: "addr_removed"}
+ROUTE_TYPES = {RTM_NEWROUTE: "route_added", RTM_DELROUTE: "route_removed"}
+
+
+@dataclass
+class NetlinkEvent:
+    """A decoded rtnetlink notification."""
+    kind: str
+    index: int = 0
+    ifname: Optional[str] = None
+    up: bool = False
+    family: int = 0
+    address: Optional[str] = None
+    prefixlen: int = 0
+    gateway: Optional[str] = None
+    table: int = 0
+    attrs: Dict[int, bytes] = field(default_factory=dict, repr=False)
+
+    @property
+    def is_default_route(self) -> bool:
+        return self.kind.startswith("route_") and self.prefixlen == 0
+
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def _parse_attrs(data: bytes, offset: int, end: int) -> Dict[int, bytes]:
+    attrs = {}
+    while offset + RTATTR.size <= end:
+        rta_len, rta_type = RTATTR.unpack_from(data, offset)
+        if rta_len < RTATTR.size or offset + rta_len > end:
+            break
+        attrs[rta_type & 0x3FFF] = data[offset + RTATTR.size:offset + rta_len]
+        offset += _align(rta_len)
+    return attrs
+
+
+def _ntop(family: int, raw: Optional[bytes]) -> Optional[str]:
+    if raw is None:
+        return None
+    try:
+        return socket.inet_ntop(family, raw)
+    except (ValueError, OSError):
+        return None
+
+
+def _cstr(raw: Optional[bytes]) -> Optional[str]:
+    if raw is None:
+        return None
+    return raw.split(b"\0", 1)[0].decode(errors="replace")
+
+
+def parse_messages(data: bytes) -> List[NetlinkEvent]:
+    """
+    Decode a buffer read from an rtnetlink socket into events.
+    Unknown, truncated and control messages are skipped.
+    """
+    events = []
+    offset = 0
+    while offset + NLMSGHDR.size <= len(data):
+        msg_len, msg_type, _flags, _seq, _pid = NLMSGHDR.unpack_from(data, offset)
+        if msg_len < NLMSGHDR.size or offset + msg_len > len(data):
+            break
+        body = offset + NLMSGHDR.size
+        end = offset + msg_len
+
+        if msg_type in LINK_TYPES and body + IFINFOMSG.size <= end:
+            family, _type, index, flags, _change = IFINFOMSG.unpack_from(data, body)
+            attrs = _parse_attrs(data, body + IFINFOMSG.size, end)
+            up = msg_type == RTM_NEWLINK and bool(flags & IFF_UP)
+            kind = LINK_TYPES[msg_type] if msg_type == RTM_DELLINK or up else "link_down"
+            events.append(NetlinkEvent(
+                kind=kind, index=index, ifname=_cstr(attrs.get(IFLA_IFNAME)),
+                up=up, family=family, attrs=attrs
+            ))
+        elif msg_type in ADDR_TYPES and body + IFADDRMSG.size <= end:
+            family, prefixlen, _flags, _scope, index = IFADDRMSG.unpack_from(data, body)
+            attrs = _parse_attrs(data, body + IFADDRMSG.size, end)
+            address = _ntop(family, attrs.get(IFA_LOCAL, attrs.get(IFA_ADDRESS)))
+            events.append(NetlinkEvent(
+                kind=ADDR_TYPES[msg_type], index=index, ifname=_cstr(attrs.get(IFA_LABEL)),
+                family=family, address=address, prefixlen=prefixlen, attrs=attrs
+            ))
+        elif msg_type in ROUTE_TYPES and body + RTMSG.size <= end:
+            family, dst_len, _src_len, _tos, table, _proto, _scope, _type, _flags = RTMSG.unpack_from(data, body)
+            attrs = _parse_attrs(data, body + RTMSG.size, end)
+            oif = attrs.get(RTA_OIF)
+            # RTA_TABLE carries the full id for tables above 255
+            if RTA_TABLE in attrs and len(attrs[RTA_TABLE]) >= 4:
+                table = struct.unpack("=I", attrs[RTA_TABLE][:4])[0]
+            events.append(NetlinkEvent(
+                kind=ROUTE_TYPES[msg_type],
+                index=struct.unpack("=i", oif[:4])[0] if oif and len(oif) >= 4 else 0,
+                family=family, address=_ntop(family, attrs.get(RTA_DST)), prefixlen=dst_len,
+                gateway=_ntop(family, attrs.get(RTA_GATEWAY)), table=table, attrs=attrs
+            ))
+
+        offset += _align(msg_len)
+    return events
+
+
+def default_route_interfaces() -> List[str]:
+    """
+    Interfaces that currently have a usable IPv4 or IPv6 default route,
+    read from /proc (IPv4: main table only; IPv6: all tables).
+    """
+    interfaces = []
+    try:
+        with open(PROC_ROUTE) as f:
+            for line in f.read().splitlines()[1:]:
+                fields = line.split()
+                if len(fields) >= 8 and fields[1] == "00000000" and fields[7] == "00000000" \
+                        and int(fields[3], 16) & RTF_UP:
+                    interfaces.append(fields[0])
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(PROC_IPV6_ROUTE) as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 10 and fields[1] == "00" and fields[0] == "0" * 32 \
+                        and not int(fields[8], 16) & RTF_REJECT and fields[9] != "lo":
+                    interfaces.append(fields[9])
+    except (OSError, ValueError):
+        pass
+    return interfaces
+
+
+class NetlinkMonitor:
+    """
+    Listens to rtnetlink multicast groups for link, address and route changes.
+    The socket is non-blocking; callers wait on fileno() (e.g. with a
+    QSocketNotifier) and call read_events() when it becomes readable.
+    """
+    GROUPS = (RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV6_IFADDR |
+              RTMGRP_IPV4_ROUTE | RTMGRP_IPV6_ROUTE)
+
+    def __init__(self, groups: int = GROUPS):
+        self.groups = groups
+        self.sock = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(socket, "AF_NETLINK")
+
+    def open(self) -> bool:
+        """Open and bind the netlink socket. Returns False if unavailable."""
+        if not self.is_supported():
+            return False
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, self.groups))
+            sock.setblocking(False)
+        except OSError as e:
+            logger.warning(f"Could not open rtnetlink socket: {e}")
+            return False
+        self.sock = sock
+        return True
+
+    def fileno(self) -> int:
+        return self.sock.fileno() if self.sock else -1
+
+    def read_events(self) -> List[NetlinkEvent]:
+        """Drain all pending datagrams and return the decoded events."""
+        events = []
+        if self.sock is None:
+            return events
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                # ENOBUFS means we overran the receive buffer; state must be re-read.
+                logger.warning(f"rtnetlink receive error: {e}")
+                events.append(NetlinkEvent(kind="overrun"))
+                break
+            if not data:
+                break
+            events.extend(parse_messages(data))
+        return events
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
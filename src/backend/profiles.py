@@ -2,7 +2,7 @@ import os
 import shutil
 import platform
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.utils.paths import get_profiles_dir
 
 class ProfileManager:
@@ -42,6 +42,35 @@ class ProfileManager:
         except Exception:
             return False
 
+    def create_profiles(self, profiles: Dict[str, str]) -> bool:
+        """
+        Create several profiles at once. Every file is written to a temporary
+        name first and only renamed into place once all writes succeeded. If
+        a rename fails, the profiles already renamed are removed again.
+        """
+        staged = []
+        renamed = []
+        try:
+            for name, content in profiles.items():
+                tmp = self.profiles_dir / f".{name}.conf.tmp"
+                with open(tmp, "w") as f:
+                    f.write(content)
+                self._secure_file(tmp)
+                staged.append((tmp, self.get_profile_path(name)))
+            for tmp, dest in staged:
+                existed = dest.exists()
+                os.replace(tmp, dest)
+                if not existed:
+                    renamed.append(dest)
+            return True
+        except Exception:
+            for tmp, _dest in staged:
+                if tmp.exists():
+                    tmp.unlink()
+            for dest in renamed:
+                dest.unlink(missing_ok=True)
+            return False
+
     def delete_profile(self, name: str) -> bool:
         """Delete a profile."""
         path = self.get_profile_path(name)
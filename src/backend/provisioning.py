@@ -0,0 +1,261 @@
+import base64
+import ipaddress
+import json
+import os
+import re
+import secrets
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from src.utils.paths import get_config_dir
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Largest pool we keep a bitmap for (a /104 in IPv6 terms, 2 MiB of bits)
+MAX_POOL_SIZE = 2 ** 24
+
+# Profile names become interface names (at most 15 characters on Linux)
+PROFILE_NAME_RE = re.compile(r"^[a-zA-Z0-9_=+.-]{1,15}$")
+
+
+def public_key(private_key: str) -> str:
+    """Derive the base64 public key for a base64 WireGuard private key."""
+    key = X25519PrivateKey.from_private_bytes(base64.b64decode(private_key))
+    return base64.b64encode(key.public_key().public_bytes_raw()).decode()
+
+
+def generate_keypair() -> Tuple[str, str]:
+    """Return a new (private_key, public_key) pair, base64 encoded like `wg genkey`."""
+    raw = bytearray(secrets.token_bytes(32))
+    # Clamp like `wg genkey` so the stored key is already canonical
+    raw[0] &= 248
+    raw[31] = (raw[31] & 127) | 64
+    private = base64.b64encode(bytes(raw)).decode()
+    return private, public_key(private)
+
+
+def generate_keypairs(count: int) -> List[Tuple[str, str]]:
+    """Generate keypairs in-process, avoiding two `wg` forks per peer."""
+    with metrics.span("provision_keygen"):
+        return [generate_keypair() for _ in range(count)]
+
+
+def generate_preshared_key() -> str:
+    return base64.b64encode(secrets.token_bytes(32)).decode()
+
+
+def write_atomic(path: Path, content: str, mode: int = 0o600):
+    """Write a file via a temporary sibling and rename it into place."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class AddressPool:
+    """
+    Bitmap allocator for host addresses in a network.
+
+    One bit per address; allocate() and free() are O(1) (amortized) thanks
+    to a stack of freed slots plus a high-water mark of never-used ones.
+    Only the bitmap is persisted.
+    """
+    def __init__(self, network: str, reserved: Optional[List[str]] = None):
+        self.network = ipaddress.ip_network(network, strict=False)
+        self.size = self.network.num_addresses
+        if self.size > MAX_POOL_SIZE:
+            raise ValueError(f"{self.network} is too large for an address pool")
+        self.bitmap = bytearray((self.size + 7) // 8)
+        self.free_slots: List[int] = []
+        self.next_slot = 0
+        self.used = 0
+
+        # Network and broadcast addresses are never handed out
+        self._mark(0)
+        if self.network.version == 4 and self.size > 2:
+            self._mark(self.size - 1)
+        for address in reserved or []:
+            self.reserve(address)
+
+    def _slot(self, address: str) -> int:
+        slot = int(ipaddress.ip_address(address)) - int(self.network.network_address)
+        if not 0 <= slot < self.size:
+            raise ValueError(f"{address} is not in {self.network}")
+        return slot
+
+    def _is_set(self, slot: int) -> bool:
+        return bool(self.bitmap[slot >> 3] & (1 << (slot & 7)))
+
+    def _mark(self, slot: int):
+        if not self._is_set(slot):
+            self.bitmap[slot >> 3] |= 1 << (slot & 7)
+            self.used += 1
+
+    def allocate(self) -> str:
+        """Allocate the next free address. Raises ValueError when exhausted."""
+        while self.free_slots:
+            slot = self.free_slots.pop()
+            if not self._is_set(slot):
+                break
+        else:
+            while self.next_slot < self.size and self._is_set(self.next_slot):
+                self.next_slot += 1
+            if self.next_slot >= self.size:
+                raise ValueError(f"Address pool {self.network} is exhausted")
+            slot = self.next_slot
+        self._mark(slot)
+        return str(self.network.network_address + slot)
+
+    def reserve(self, address: str):
+        """Mark an address as used without allocating it (e.g. the server's own)."""
+        self._mark(self._slot(address))
+
+    def free(self, address: str):
+        slot = self._slot(address)
+        if self._is_set(slot):
+            self.bitmap[slot >> 3] &= ~(1 << (slot & 7))
+            self.used -= 1
+            self.free_slots.append(slot)
+
+    def is_allocated(self, address: str) -> bool:
+        return self._is_set(self._slot(address))
+
+    @property
+    def available(self) -> int:
+        return self.size - self.used
+
+    def to_dict(self) -> Dict:
+        return {
+            "network": str(self.network),
+            "bitmap": base64.b64encode(bytes(self.bitmap)).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AddressPool":
+        pool = cls(data["network"])
+        pool.bitmap = bytearray(base64.b64decode(data["bitmap"]))
+        pool.used = sum(bin(byte).count("1") for byte in pool.bitmap)
+        # allocate() skips set bits while advancing the high-water mark, so
+        # holes left by freed addresses are found again without a free stack
+        pool.next_slot = 0
+        pool.free_slots = []
+        return pool
+
+    def save(self, path: Path):
+        write_atomic(path, json.dumps(self.to_dict(), indent=4))
+
+    @classmethod
+    def load(cls, path: Path) -> "AddressPool":
+        return cls.from_dict(json.loads(path.read_text()))
+
+
+class PeerProvisioner:
+    """
+    Mints client peers for a WireGuard server in bulk.
+
+    For each peer a keypair and preshared key are generated, an address is
+    allocated from the server's persistent pool, a client profile is
+    written to the profiles dir and a [Peer] block is appended to the
+    server's peer list. The pool is saved before any file refers to its
+    addresses, and files are staged under temporary names and renamed into
+    place. A failure can leak addresses (they stay marked as used) but
+    never hands one out twice, and removes the client profiles it wrote.
+    """
+    def __init__(self, profile_manager, state_dir: Optional[Path] = None):
+        self.profile_manager = profile_manager
+        self.state_dir = state_dir or (get_config_dir() / "servers")
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def pool_path(self, server: str) -> Path:
+        return self.state_dir / f"{server}.pool.json"
+
+    def peers_path(self, server: str) -> Path:
+        return self.state_dir / f"{server}.peers.conf"
+
+    def load_pool(self, server: str, network: str, server_address: Optional[str] = None) -> AddressPool:
+        path = self.pool_path(server)
+        if path.exists():
+            pool = AddressPool.load(path)
+            if str(pool.network) != str(ipaddress.ip_network(network, strict=False)):
+                raise ValueError(f"Server {server} already uses pool {pool.network}")
+            return pool
+        pool = AddressPool(network)
+        # The server conventionally takes the first host address
+        pool.reserve(server_address or str(pool.network.network_address + 1))
+        return pool
+
+    def provision(self, server: str, count: int, server_public_key: str, endpoint: str,
+                  network: str, dns: str = "", allowed_ips: str = "0.0.0.0/0, ::/0",
+                  prefix: Optional[str] = None, keepalive: int = 25) -> List[str]:
+        """
+        Create `count` client profiles for `server`.
+        Returns the new profile names.
+        """
+        if not server or "/" in server or server.startswith("."):
+            raise ValueError(f"Invalid server name: {server!r}")
+        if not server_public_key or not endpoint:
+            raise ValueError("Server public key and endpoint are required")
+
+        with metrics.span("provision", server=server):
+            pool = self.load_pool(server, network)
+            if count > pool.available:
+                raise ValueError(f"Only {pool.available} addresses left in {pool.network}")
+
+            prefix = prefix or f"{server}-"
+            existing = set(self.profile_manager.list_profiles())
+            # Indexes only skip names already taken, so none goes past this one
+            taken = sum(1 for name in existing if name.startswith(prefix))
+            longest = f"{prefix}{taken + count:04d}"
+            if not PROFILE_NAME_RE.match(longest):
+                raise ValueError(f"Profile names like {longest!r} are not valid interface names "
+                                 f"(at most 15 letters, digits or _=+.-); use a shorter server name or prefix")
+            keypairs = generate_keypairs(count)
+            host_prefix = pool.network.max_prefixlen
+
+            profiles = {}
+            server_blocks = []
+            index = 1
+            for private, public in keypairs:
+                while f"{prefix}{index:04d}" in existing:
+                    index += 1
+                name = f"{prefix}{index:04d}"
+                existing.add(name)
+                address = f"{pool.allocate()}/{host_prefix}"
+                psk = generate_preshared_key()
+
+                interface = [f"PrivateKey = {private}", f"Address = {address}"]
+                if dns:
+                    interface.append(f"DNS = {dns}")
+                profiles[name] = "\n".join(
+                    ["[Interface]", *interface, "",
+                     "[Peer]", f"PublicKey = {server_public_key}", f"PresharedKey = {psk}",
+                     f"Endpoint = {endpoint}", f"AllowedIPs = {allowed_ips}",
+                     f"PersistentKeepalive = {keepalive}", ""]
+                )
+                server_blocks.append(
+                    f"[Peer]\n# {name}\nPublicKey = {public}\nPresharedKey = {psk}\nAllowedIPs = {address}\n"
+                )
+
+            peers_path = self.peers_path(server)
+            previous = peers_path.read_text() if peers_path.exists() else ""
+            separator = "\n" if previous and not previous.endswith("\n\n") else ""
+
+            # Saved first: if a write below fails the addresses are lost,
+            # rather than free while a profile still holds them
+            pool.save(self.pool_path(server))
+            if not self.profile_manager.create_profiles(profiles):
+                raise OSError("Failed to write client profiles")
+            try:
+                write_atomic(peers_path, previous + separator + "\n".join(server_blocks))
+            except OSError:
+                for name in profiles:
+                    self.profile_manager.delete_profile(name)
+                raise
+
+        logger.info(f"Provisioned {count} peers for {server} ({pool.available} addresses left)")
+        return list(profiles)
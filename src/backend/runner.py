@@ -0,0 +1,132 @@
+import os
+import shutil
+import subprocess
+import threading
+import time
+import logging
+from typing import Dict, List, Optional
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Binaries whose invocations must not overlap (wg-quick edits routes, DNS and
+# firewall state non-atomically)
+DEFAULT_LIMITS = {"wg-quick": 1}
+
+
+class _Call:
+    """An in-flight command shared by every caller asking for the same thing."""
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class CommandRunner:
+    """
+    Single place where external commands are executed.
+
+    - coalesce=True: concurrent identical read-only commands share one
+      execution (single-flight); followers get the leader's result.
+    - cache_ttl: additionally reuse a coalesced result for this many
+      seconds. Any non-coalesced (i.e. possibly mutating) command drops
+      the cache.
+    - which(): resolved binary paths are cached for the process lifetime.
+    - set_limit(): cap concurrent executions per binary.
+    """
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.lock = threading.Lock()
+        self.inflight: Dict[tuple, _Call] = {}
+        self.cache: Dict[tuple, tuple] = {}
+        self.binaries: Dict[str, str] = {}
+        # Bumped on invalidation so results started before it aren't cached
+        self.generation = 0
+        self.limits: Dict[str, threading.BoundedSemaphore] = {}
+        for binary, limit in (DEFAULT_LIMITS if limits is None else limits).items():
+            self.set_limit(binary, limit)
+
+    def which(self, name: str) -> Optional[str]:
+        """shutil.which with found paths cached. Misses are not, so tools installed later are found."""
+        try:
+            return self.binaries[name]
+        except KeyError:
+            path = shutil.which(name)
+            if path is not None:
+                self.binaries[name] = path
+            return path
+
+    def set_limit(self, binary: str, limit: int):
+        """Allow at most `limit` concurrent runs of `binary` (matched by basename)."""
+        self.limits[binary] = threading.BoundedSemaphore(limit)
+
+    def clear_cache(self):
+        """Forget resolved binaries and cached results."""
+        with self.lock:
+            self.binaries.clear()
+            self.cache.clear()
+
+    def invalidate(self):
+        """Drop cached command results."""
+        with self.lock:
+            self.generation += 1
+            self.cache.clear()
+
+    def run(self, cmd: List[str], *, coalesce: bool = False, cache_ttl: float = 0.0,
+            **kwargs) -> subprocess.CompletedProcess:
+        """
+        Run a command; keyword arguments are passed to subprocess.run.
+        Only use coalesce/cache_ttl for read-only commands whose output is
+        captured, since followers receive the leader's CompletedProcess.
+        """
+        if not coalesce:
+            try:
+                return self._execute(cmd, kwargs)
+            finally:
+                self.invalidate()
+
+        key = (tuple(cmd), tuple(sorted(kwargs.items())))
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                metrics.inc("command_cache_hits")
+                return cached[1]
+            call = self.inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self.inflight[key] = _Call()
+                generation = self.generation
+
+        if not leader:
+            metrics.inc("command_coalesced")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._execute(cmd, kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.inflight[key]
+                if cache_ttl > 0 and call.error is None and generation == self.generation:
+                    self.cache[key] = (time.monotonic() + cache_ttl, call.result)
+            call.event.set()
+
+    def _execute(self, cmd: List[str], kwargs: dict) -> subprocess.CompletedProcess:
+        limit = self.limits.get(os.path.basename(str(cmd[0])))
+        if limit is None:
+            with metrics.command_span(cmd):
+                return subprocess.run(cmd, **kwargs)
+        with limit, metrics.command_span(cmd):
+            return subprocess.run(cmd, **kwargs)
+
+
+# One runner per process, so coalescing, the result cache and the
+# per-binary limits apply across all callers
+runner = CommandRunner()
@@ -9,8 +9,13 @@ class SettingsManager:
         self.default_settings = {
             "start_on_boot": False,
             "kill_switch": False,
+            "roaming": True,
             "dns_override": "",
-            "language": "en_US"
+            "dns_cache": True,
+            "language": None,  # follow the system locale until one is picked
+            "theme": "dark",
+            "metrics_enabled": False,
+            "metrics_port": 0
         }
         self.settings = self.load_settings()
 
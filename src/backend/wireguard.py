@@ -1,19 +1,44 @@
-import shutil
 import subprocess
 import platform
 import logging
+import time
 from typing import List, Optional, Dict
+from src.backend.config import read_config, resolve_endpoint, format_endpoint
+from src.utils.metrics import metrics
+from src.backend.runner import runner
 
 logger = logging.getLogger(__name__)
 
+# A session older than this without a fresh handshake is considered dead
+# (WireGuard's REJECT_AFTER_TIME).
+HANDSHAKE_STALE_SECONDS = 180
+# WireGuard only starts a handshake for a session older than REKEY_AFTER_TIME,
+# and gives one REKEY_TIMEOUT to complete.
+REKEY_AFTER_TIME = 120
+REKEY_TIMEOUT = 5
+
+# Keepalive interval used to nudge peers without PersistentKeepalive into a
+# handshake after roaming.
+ROAM_KICK_KEEPALIVE = "25"
+
+# Read-only `wg show` output is shared between callers for this long, so the
+# tray, detail view and monitors polling at once cost a single fork.
+STATUS_CACHE_TTL = 0.5
+
 class WireGuardService:
     def __init__(self):
-        self.wg_path = shutil.which("wg")
-        self.wg_quick_path = shutil.which("wg-quick")
+        self.wg_path = runner.which("wg")
+        self.wg_quick_path = runner.which("wg-quick")
         self.os_type = platform.system()
+        # Last seen transfer_tx per (interface, peer), to tell idle peers
+        # from ones we are sending to
+        self.last_tx: Dict[tuple, int] = {}
 
     def is_installed(self) -> bool:
         """Check if WireGuard tools are installed."""
+        # Look again for tools that were missing, they may have been installed since
+        self.wg_path = self.wg_path or runner.which("wg")
+        self.wg_quick_path = self.wg_quick_path or runner.which("wg-quick")
         return self.wg_path is not None and self.wg_quick_path is not None
 
     def get_status(self, interface: str) -> Dict[str, str]:
@@ -24,23 +49,25 @@ class WireGuardService:
         if not self.is_installed():
             return {"status": "error", "message": "WireGuard not installed"}
 
+        with metrics.span("status_poll"):
+            return self._get_status(interface)
+
+    def _get_status(self, interface: str) -> Dict[str, str]:
         # This is a simplification. Real implementation parses `wg show` output.
         # For now, we check if the interface exists in the output of `wg show interfaces`
         try:
             # Check if interface is up
-            result = subprocess.run(
-                [self.wg_path, "show", "interfaces"],
-                capture_output=True, text=True, check=False
-            )
+            cmd = [self.wg_path, "show", "interfaces"]
+            result = runner.run(cmd, coalesce=True, cache_ttl=STATUS_CACHE_TTL,
+                                capture_output=True, text=True, check=False)
             if result.returncode != 0:
                  return {"status": "disconnected"}
 
             if interface in result.stdout.split():
                  # Get details
-                 details = subprocess.run(
-                     [self.wg_path, "show", interface, "latest-handshakes"],
-                     capture_output=True, text=True
-                 )
+                 cmd = [self.wg_path, "show", interface, "latest-handshakes"]
+                 details = runner.run(cmd, coalesce=True, cache_ttl=STATUS_CACHE_TTL,
+                                      capture_output=True, text=True)
                  # Parse details... for now return basic connected
                  return {"status": "connected"}
             else:
@@ -58,7 +85,7 @@ class WireGuardService:
         try:
             cmd = [self.wg_quick_path, "up", config_path]
             logger.info(f"Running: {' '.join(cmd)}")
-            subprocess.run(cmd, check=True, capture_output=True)
+            runner.run(cmd, check=True, capture_output=True)
             return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to connect: {e.stderr}")
@@ -72,8 +99,134 @@ class WireGuardService:
         try:
             cmd = [self.wg_quick_path, "down", config_path]
             logger.info(f"Running: {' '.join(cmd)}")
-            subprocess.run(cmd, check=True, capture_output=True)
+            runner.run(cmd, check=True, capture_output=True)
             return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to disconnect: {e.stderr}")
             return False
+
+    def get_peers(self, interface: str) -> List[Dict]:
+        """
+        Get live peer state from `wg show <interface> dump`.
+        Returns a list of dicts with 'public_key', 'endpoint', 'latest_handshake',
+        'transfer_rx', 'transfer_tx' and 'persistent_keepalive'.
+        """
+        if not self.is_installed():
+            return []
+
+        cmd = [self.wg_path, "show", interface, "dump"]
+        try:
+            result = runner.run(cmd, coalesce=True, cache_ttl=STATUS_CACHE_TTL,
+                                capture_output=True, text=True, check=False)
+        except Exception as e:
+            logger.error(f"Error reading peers for {interface}: {e}")
+            return []
+        if result.returncode != 0:
+            return []
+
+        peers = []
+        # First line describes the interface itself
+        for line in result.stdout.splitlines()[1:]:
+            fields = line.split("\t")
+            if len(fields) < 8:
+                continue
+            peers.append({
+                "public_key": fields[0],
+                "endpoint": None if fields[2] == "(none)" else fields[2],
+                "latest_handshake": int(fields[4]),
+                "transfer_rx": int(fields[5]),
+                "transfer_tx": int(fields[6]),
+                "persistent_keepalive": 0 if fields[7] == "off" else int(fields[7]),
+            })
+        return peers
+
+    def is_handshake_stale(self, interface: str, max_age: int = HANDSHAKE_STALE_SECONDS) -> bool:
+        """
+        True if any peer with an endpoint has no handshake newer than max_age
+        although it should: it has PersistentKeepalive, or data was sent to it
+        since the previous check. Idle peers without keepalive never
+        handshake, so they are not reported.
+        """
+        now = time.time()
+        stale = False
+        for peer in self.get_peers(interface):
+            key = (interface, peer["public_key"])
+            sending = peer["transfer_tx"] > self.last_tx.get(key, peer["transfer_tx"])
+            self.last_tx[key] = peer["transfer_tx"]
+            if peer["endpoint"] and now - peer["latest_handshake"] > max_age \
+                    and (peer["persistent_keepalive"] or sending):
+                stale = True
+        return stale
+
+    def peers_reachable(self, interface: str, since: float, rx_before: Dict[str, int]) -> bool:
+        """
+        False if a peer with an endpoint has shown no sign of life since a
+        roam at `since`: no handshake after it, no more bytes received than
+        recorded in rx_before (public key -> transfer_rx), and a session
+        old enough that the roam's keepalive must have started a handshake.
+        An idle peer on a younger session sends nothing back, so it is
+        given the benefit of the doubt.
+        """
+        peers = self.get_peers(interface)
+        if not peers:
+            return False
+        for peer in peers:
+            if not peer["endpoint"] or peer["latest_handshake"] >= int(since):
+                continue
+            if peer["transfer_rx"] > rx_before.get(peer["public_key"], 0):
+                continue
+            if since - peer["latest_handshake"] > REKEY_AFTER_TIME + REKEY_TIMEOUT:
+                return False
+        return True
+
+    def roam(self, interface: str, config_path: str) -> bool:
+        """
+        Refresh peer endpoints in place after a network change.
+        Re-resolves each configured Endpoint and applies it via `wg set`,
+        leaving routes and DNS untouched. A peer whose Endpoint does not
+        resolve right now (DNS may still go through the old network) keeps
+        its current one. Setting an endpoint does not start a handshake, so
+        each peer's keepalive is then switched from off to on, which makes
+        the kernel send one right away. Peers without PersistentKeepalive
+        get it only for that one packet.
+        Returns False if `wg set` failed for any peer, in which case the
+        caller should fall back to a full reconnect.
+        """
+        if not self.is_installed():
+            return False
+
+        config = read_config(config_path)
+        if config is None:
+            return False
+
+        ok = True
+        for peer in config["peers"]:
+            public_key = peer.get("PublicKey")
+            endpoint = peer.get("Endpoint")
+            if not public_key or not endpoint:
+                continue
+
+            set_peer = [self.wg_path, "set", interface, "peer", public_key]
+            addresses = resolve_endpoint(endpoint)
+            if addresses:
+                set_endpoint = ["endpoint", format_endpoint(*addresses[0])]
+            else:
+                logger.warning(f"Could not resolve {endpoint}, keeping the current endpoint")
+                set_endpoint = []
+            keepalive = peer.get("PersistentKeepalive", "off")
+            kick_only = keepalive in ("off", "0")
+            cmds = [
+                set_peer + set_endpoint + ["persistent-keepalive", "off"],
+                set_peer + ["persistent-keepalive", ROAM_KICK_KEEPALIVE if kick_only else keepalive],
+            ]
+            if kick_only:
+                cmds.append(set_peer + ["persistent-keepalive", "off"])
+
+            try:
+                for cmd in cmds:
+                    logger.info(f"Running: {' '.join(cmd)}")
+                    runner.run(cmd, check=True, capture_output=True)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Failed to update endpoint for {interface}: {e.stderr}")
+                ok = False
+        return ok
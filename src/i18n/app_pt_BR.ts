@@ -0,0 +1,387 @@
+<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1" language="pt_BR">
+<context>
+    <name>DiagnosticsView</name>
+    <message>
+        <location filename="../ui/main_window.py" line="553"/>
+        <source>Diagnostics</source>
+        <translation>Diagnóstico</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="554"/>
+        <source>Refresh</source>
+        <translation>Atualizar</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="555"/>
+        <source>Reset</source>
+        <translation>Redefinir</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="561"/>
+        <source>Metrics collection is disabled. Enable it in Settings.</source>
+        <translation>A coleta de métricas está desativada. Ative-a nas Configurações.</translation>
+    </message>
+</context>
+<context>
+    <name>MainWindow</name>
+    <message>
+        <location filename="../ui/main_window.py" line="119"/>
+        <source>WireGuard GUI</source>
+        <translation>WireGuard GUI</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="120"/>
+        <source>PROFILES</source>
+        <translation>PERFIS</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="121"/>
+        <source>+ Add Tunnel</source>
+        <translation>+ Adicionar Túnel</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="122"/>
+        <source>Import from File...</source>
+        <translation>Importar de Arquivo...</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="123"/>
+        <source>Provision Peers...</source>
+        <translation>Provisionar Peers...</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="124"/>
+        <source>⚙ Settings</source>
+        <translation>⚙ Configurações</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="125"/>
+        <source>⏱ Diagnostics</source>
+        <translation>⏱ Diagnóstico</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="126"/>
+        <source>Select a tunnel to view details</source>
+        <translation>Selecione um túnel para ver os detalhes</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="158"/>
+        <source>Import Tunnel</source>
+        <translation>Importar Túnel</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="158"/>
+        <source>WireGuard Config (*.conf)</source>
+        <translation>Configuração WireGuard (*.conf)</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="164"/>
+        <source>Import Error</source>
+        <translation>Erro de Importação</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="164"/>
+        <source>Failed to import {0}</source>
+        <translation>Falha ao importar {0}</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="172"/>
+        <source>Provisioning peers...</source>
+        <translation>Provisionando peers...</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="203"/>
+        <source>Provisioning Error</source>
+        <translation>Erro de Provisionamento</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="196"/>
+        <source>Provisioning</source>
+        <translation>Provisionamento</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="197"/>
+        <source>Created {0} client profiles.
+Server [Peer] blocks written to:
+{1}</source>
+        <translation>{0} perfis de cliente criados.
+Blocos [Peer] do servidor gravados em:
+{1}</translation>
+    </message>
+</context>
+<context>
+    <name>ProfileDetailView</name>
+    <message>
+        <location filename="../ui/main_window.py" line="264"/>
+        <source>Profile Name</source>
+        <translation>Nome do Perfil</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="265"/>
+        <source>Connect</source>
+        <translation>Conectar</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="266"/>
+        <source>Disconnect</source>
+        <translation>Desconectar</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="272"/>
+        <source>Connected</source>
+        <translation>Conectado</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="273"/>
+        <source>Connecting</source>
+        <translation>Conectando</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="274"/>
+        <source>Disconnected</source>
+        <translation>Desconectado</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="275"/>
+        <source>Disconnecting</source>
+        <translation>Desconectando</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="276"/>
+        <source>Error</source>
+        <translation>Erro</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="278"/>
+        <source>Status: {0}</source>
+        <translation>Status: {0}</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="281"/>
+        <source>Data: {0} received, {1} sent</source>
+        <translation>Dados: {0} recebidos, {1} enviados</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="283"/>
+        <source>Last {0} days: {1} received, {2} sent</source>
+        <translation>Últimos {0} dias: {1} recebidos, {2} enviados</translation>
+    </message>
+</context>
+<context>
+    <name>ProvisionDialog</name>
+    <message>
+        <location filename="../ui/main_window.py" line="333"/>
+        <source>Provision Peers</source>
+        <translation>Provisionar Peers</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="337"/>
+        <source>e.g. wg-hub</source>
+        <translation>ex.: wg-hub</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="338"/>
+        <source>Server name</source>
+        <translation>Nome do servidor</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="341"/>
+        <source>Server public key</source>
+        <translation>Chave pública do servidor</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="345"/>
+        <source>Endpoint</source>
+        <translation>Endpoint</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="348"/>
+        <source>Client address pool</source>
+        <translation>Faixa de endereços dos clientes</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="351"/>
+        <source>DNS</source>
+        <translation>DNS</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="354"/>
+        <source>Allowed IPs</source>
+        <translation>IPs permitidos</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="359"/>
+        <source>Number of peers</source>
+        <translation>Número de peers</translation>
+    </message>
+</context>
+<context>
+    <name>SettingsView</name>
+    <message>
+        <location filename="../ui/main_window.py" line="468"/>
+        <source>Settings</source>
+        <translation>Configurações</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="469"/>
+        <source>Language</source>
+        <translation>Idioma</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="470"/>
+        <source>Theme</source>
+        <translation>Tema</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="471"/>
+        <source>Dark</source>
+        <translation>Escuro</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="471"/>
+        <source>Light</source>
+        <translation>Claro</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="475"/>
+        <source>Start on Boot</source>
+        <translation>Iniciar com o Sistema</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="476"/>
+        <source>Kill Switch (Block traffic if VPN drops)</source>
+        <translation>Kill Switch (Bloquear o tráfego se a VPN cair)</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="477"/>
+        <source>Seamless Roaming (Refresh endpoints on network change)</source>
+        <translation>Roaming Contínuo (Atualizar endpoints ao mudar de rede)</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="478"/>
+        <source>Cache DNS lookups while connected</source>
+        <translation>Armazenar consultas DNS em cache enquanto conectado</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="479"/>
+        <source>DNS Override (comma separated, empty to use the tunnel&apos;s DNS)</source>
+        <translation>Substituir DNS (separados por vírgula, vazio para usar o DNS do túnel)</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="480"/>
+        <source>e.g. 1.1.1.1, 9.9.9.9</source>
+        <translation>ex.: 1.1.1.1, 9.9.9.9</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="481"/>
+        <source>Collect performance metrics (see Diagnostics)</source>
+        <translation>Coletar métricas de desempenho (veja Diagnóstico)</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="482"/>
+        <source>Network Backup &amp; Restore</source>
+        <translation>Backup e Restauração de Rede</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="483"/>
+        <source>Create Network Backup</source>
+        <translation>Criar Backup de Rede</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="484"/>
+        <source>Restore Last Backup</source>
+        <translation>Restaurar Último Backup</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="507"/>
+        <source>Backup</source>
+        <translation>Backup</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="507"/>
+        <source>Backup created at:
+{0}</source>
+        <translation>Backup criado em:
+{0}</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="509"/>
+        <source>Backup Error</source>
+        <translation>Erro de Backup</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="509"/>
+        <source>Failed to create backup. Check logs/permissions.</source>
+        <translation>Falha ao criar o backup. Verifique os logs/permissões.</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="514"/>
+        <location filename="../ui/main_window.py" line="519"/>
+        <location filename="../ui/main_window.py" line="523"/>
+        <source>Restore</source>
+        <translation>Restaurar</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="514"/>
+        <source>No backups found.</source>
+        <translation>Nenhum backup encontrado.</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="519"/>
+        <source>Restore backup from {0}?
+This will overwrite current network settings.</source>
+        <translation>Restaurar o backup de {0}?
+Isso substituirá as configurações de rede atuais.</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="523"/>
+        <source>Restore successful. Please restart networking or reboot.</source>
+        <translation>Restauração concluída. Reinicie a rede ou o computador.</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="525"/>
+        <source>Restore Error</source>
+        <translation>Erro de Restauração</translation>
+    </message>
+    <message>
+        <location filename="../ui/main_window.py" line="525"/>
+        <source>Failed to restore backup.</source>
+        <translation>Falha ao restaurar o backup.</translation>
+    </message>
+</context>
+<context>
+    <name>SystemTray</name>
+    <message>
+        <location filename="../ui/tray.py" line="46"/>
+        <source>Show Window</source>
+        <translation>Mostrar Janela</translation>
+    </message>
+    <message>
+        <location filename="../ui/tray.py" line="47"/>
+        <source>Quit</source>
+        <translation>Sair</translation>
+    </message>
+    <message>
+        <location filename="../ui/tray.py" line="52"/>
+        <source>WireGuard GUI: Connected to {0}</source>
+        <translation>WireGuard GUI: Conectado a {0}</translation>
+    </message>
+    <message>
+        <location filename="../ui/tray.py" line="53"/>
+        <source>Connected: {0}</source>
+        <translation>Conectado: {0}</translation>
+    </message>
+    <message>
+        <location filename="../ui/tray.py" line="55"/>
+        <source>WireGuard GUI: Disconnected</source>
+        <translation>WireGuard GUI: Desconectado</translation>
+    </message>
+    <message>
+        <location filename="../ui/tray.py" line="56"/>
+        <source>Disconnected</source>
+        <translation>Desconectado</translation>
+    </message>
+</context>
+</TS>
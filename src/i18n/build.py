@@ -0,0 +1,51 @@
+"""
+Compile translations into the Qt resource module translations_rc.py.
+
+Usage:
+    python -m src.i18n.build                  # app_*.ts -> .qm -> translations_rc.py
+    python -m src.i18n.build --update         # refresh the .ts files from the UI sources first
+    python -m src.i18n.build --update --add de_DE
+
+Needs the PySide6 tools (pyside6-lupdate, pyside6-lrelease, pyside6-rcc).
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+I18N_DIR = Path(__file__).resolve().parent
+SOURCES = [I18N_DIR.parent / "ui" / "main_window.py", I18N_DIR.parent / "ui" / "tray.py"]
+OUTPUT = I18N_DIR / "translations_rc.py"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the translation resource bundle")
+    parser.add_argument("--update", action="store_true", help="extract strings into the .ts files first")
+    parser.add_argument("--add", action="append", default=[], metavar="LOCALE",
+                        help="start a new translation (with --update)")
+    args = parser.parse_args(argv)
+
+    ts_files = sorted(I18N_DIR.glob("app_*.ts"))
+    ts_files += [I18N_DIR / f"app_{locale}.ts" for locale in args.add]
+    if args.update:
+        subprocess.run(["pyside6-lupdate", *map(str, SOURCES), "-ts", *map(str, ts_files)], check=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entries = []
+        for ts in ts_files:
+            qm = Path(tmp) / ts.with_suffix(".qm").name
+            subprocess.run(["pyside6-lrelease", str(ts), "-qm", str(qm)], check=True)
+            entries.append(f"        <file>{qm.name}</file>")
+        qrc = Path(tmp) / "translations.qrc"
+        qrc.write_text(
+            '<!DOCTYPE RCC>\n<RCC version="1.0">\n    <qresource prefix="/i18n">\n'
+            + "\n".join(entries) + "\n    </qresource>\n</RCC>\n"
+        )
+        subprocess.run(["pyside6-rcc", str(qrc), "-o", str(OUTPUT)], check=True)
+    print(f"Wrote {OUTPUT} ({len(ts_files)} translations)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
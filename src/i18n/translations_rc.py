@@ -0,0 +1,513 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x1d\x9b\
+<\
+\xb8d\x18\xca\xef\x9c\x95\xcd!\x1c\xbf`\xa1\xbd\xdd\xa7\
+\x00\x00\x00\x05pt_BRB\x00\x00\x028\x00\x00\
+I3\x00\x00\x0b\xe7\x00\x04\xa8\x8b\x00\x00\x11n\x00\x05\
+\x8c\x04\x00\x00\x19\xdd\x00L\x99b\x00\x00\x09\xba\x00R\
+\xfd\xf4\x00\x00\x13\xa8\x00X\xc9\xc4\x00\x00\x01\x5c\x00Z\
+\xec5\x00\x00\x18\xc3\x00\xac$4\x00\x00\x18k\x01!\
+u\xbe\x00\x00\x14I\x017E=\x00\x00\x0em\x01Z\
+M\xa9\x00\x00\x18\xf1\x01q\xd9\xf4\x00\x00\x09\xed\x01\xad\
+\xe4\xbd\x00\x00\x01\xe4\x01\xfb0\xd4\x00\x00\x09#\x01\xfb\
+0\xd4\x00\x00\x19\x9a\x02F?\x09\x00\x00\x0fv\x02y\
+Qs\x00\x00\x07L\x03H\xef\xf2\x00\x00\x033\x03\x9b\
+\xff\xee\x00\x00\x11\x9f\x03\xbf\xd5\xd0\x00\x00\x10&\x04\x87\
+\xa2\xc0\x00\x00\x0d\xf1\x04\xb7\x5c\x94\x00\x00\x0c\x14\x04\xbe\
+\x0a\x17\x00\x00\x08\x13\x05 XC\x00\x00\x00\x00\x05K\
+\xe0\xd4\x00\x00\x07\xd2\x05\x82(\x9d\x00\x00\x02\xd6\x05\x87\
+\xbd\xf7\x00\x00\x1a\x08\x05\x8f\xd7d\x00\x00\x0e\xce\x05\xd1\
+\xbc\x22\x00\x00\x04\xfd\x05\xfd=\x8c\x00\x00\x03\x82\x06\x02\
+)\xbc\x00\x00\x0br\x06N\xd0\xc3\x00\x00\x05\xbc\x06\x86\
+uC\x00\x00\x0c\xa1\x06\x8e\xd2y\x00\x00\x06\xbe\x06\xcb\
+;\xa2\x00\x00\x0e$\x07\x09\xaa\xe4\x00\x00\x08W\x07\x0e\
+\x1b5\x00\x00\x0a\x92\x07:\xe5\xf3\x00\x00\x04(\x07T\
+In\x00\x00\x04[\x07pN\xdc\x00\x00\x01\x97\x07\x90\
+\xc4\xd5\x00\x00\x13\xd8\x07\xb2u\xb2\x00\x00\x0d\xac\x08 \
+\xb3#\x00\x00\x07\x04\x08<\xb5N\x00\x00\x00E\x08N\
+\xb2\xf5\x00\x00\x13s\x08\xbd\x8c\xc8\x00\x00\x01\x1f\x08\xca\
+\xb6\xd5\x00\x00\x14\xad\x09a\x8d]\x00\x00\x1aN\x09\xdc\
+\xf0\x8e\x00\x00\x15\x9d\x09\xdf\xf8\xae\x00\x00\x12\x5c\x09\xfd\
+\x1f\xbe\x00\x00\x05\x5c\x0aa\xfb4\x00\x00\x08\xdd\x0ab\
+W~\x00\x00\x03\xca\x0aeK\xe4\x00\x00\x07\x95\x0b\x12\
+\x87\xa9\x00\x00\x17c\x0b\x1f\xbep\x00\x00\x15;\x0b\xfa\
+\xa8\x03\x00\x00\x0cP\x0c \x8f\xf5\x00\x00\x0c\xf6\x0c6\
+\xd6\xcd\x00\x00\x0a\xe0\x0c\x9d#G\x00\x00\x04\xb4\x0c\xaf\
+\x93\x09\x00\x00\x12\xce\x0c\xbb\x01s\x00\x00\x18(\x0d(\
+\xc0}\x00\x00\x19Q\x0dk\xde^\x00\x00\x16\x9c\x0d\xfe\
+}\x13\x00\x00\x0b'\x0e\xeb\xe3\x99\x00\x00\x0dE\x0f\x09\
+.\xe9\x00\x00\x06H\x0fKXI\x00\x00\x10\x84\x0f\x86\
+/\xb2\x00\x00\x14\xe7\x0f\xb3\x0aW\x00\x00\x09m\x0f\xc9\
+N\x94\x00\x00\x1a\xc8i\x00\x00\x1b8\x03\x00\x00\x00\x16\
+\x00D\x00i\x00a\x00g\x00n\x00\xf3\x00s\x00t\
+\x00i\x00c\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0b\
+Diagnostics\x07\x00\x00\x00\x0f\
+DiagnosticsView\x01\
+\x03\x00\x00\x00\x80\x00A\x00 \x00c\x00o\x00l\x00\
+e\x00t\x00a\x00 \x00d\x00e\x00 \x00m\x00\
+\xe9\x00t\x00r\x00i\x00c\x00a\x00s\x00 \x00\
+e\x00s\x00t\x00\xe1\x00 \x00d\x00e\x00s\x00\
+a\x00t\x00i\x00v\x00a\x00d\x00a\x00.\x00\
+ \x00A\x00t\x00i\x00v\x00e\x00-\x00a\x00\
+ \x00n\x00a\x00s\x00 \x00C\x00o\x00n\x00\
+f\x00i\x00g\x00u\x00r\x00a\x00\xe7\x00\xf5\x00\
+e\x00s\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x006M\
+etrics collectio\
+n is disabled. E\
+nable it in Sett\
+ings.\x07\x00\x00\x00\x0fDiagno\
+sticsView\x01\x03\x00\x00\x00\x12\x00\
+A\x00t\x00u\x00a\x00l\x00i\x00z\x00a\x00\
+r\x08\x00\x00\x00\x00\x06\x00\x00\x00\x07Refre\
+sh\x07\x00\x00\x00\x0fDiagnosti\
+csView\x01\x03\x00\x00\x00\x12\x00R\x00e\
+\x00d\x00e\x00f\x00i\x00n\x00i\x00r\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x05Reset\x07\x00\x00\
+\x00\x0fDiagnosticsVie\
+w\x01\x03\x00\x00\x00\x22\x00+\x00 \x00A\x00d\x00\
+i\x00c\x00i\x00o\x00n\x00a\x00r\x00 \x00\
+T\x00\xfa\x00n\x00e\x00l\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x0c+ Add Tunnel\x07\
+\x00\x00\x00\x0aMainWindow\x01\x03\
+\x00\x00\x00\x92\x00{\x000\x00}\x00 \x00p\x00e\
+\x00r\x00f\x00i\x00s\x00 \x00d\x00e\x00 \
+\x00c\x00l\x00i\x00e\x00n\x00t\x00e\x00 \
+\x00c\x00r\x00i\x00a\x00d\x00o\x00s\x00.\
+\x00\x0a\x00B\x00l\x00o\x00c\x00o\x00s\x00 \
+\x00[\x00P\x00e\x00e\x00r\x00]\x00 \x00d\
+\x00o\x00 \x00s\x00e\x00r\x00v\x00i\x00d\
+\x00o\x00r\x00 \x00g\x00r\x00a\x00v\x00a\
+\x00d\x00o\x00s\x00 \x00e\x00m\x00:\x00\x0a\
+\x00{\x001\x00}\x08\x00\x00\x00\x00\x06\x00\x00\x00A\
+Created {0} clie\
+nt profiles.\x0aSer\
+ver [Peer] block\
+s written to:\x0a{1\
+}\x07\x00\x00\x00\x0aMainWindow\
+\x01\x03\x00\x00\x00*\x00F\x00a\x00l\x00h\x00a\
+\x00 \x00a\x00o\x00 \x00i\x00m\x00p\x00o\
+\x00r\x00t\x00a\x00r\x00 \x00{\x000\x00}\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x14Failed\
+ to import {0}\x07\x00\
+\x00\x00\x0aMainWindow\x01\x03\x00\
+\x00\x00$\x00E\x00r\x00r\x00o\x00 \x00d\x00\
+e\x00 \x00I\x00m\x00p\x00o\x00r\x00t\x00\
+a\x00\xe7\x00\xe3\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x0cImport Error\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x1c\x00I\x00m\x00p\x00o\x00r\x00t\x00a\
+\x00r\x00 \x00T\x00\xfa\x00n\x00e\x00l\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x0dImport T\
+unnel\x07\x00\x00\x00\x0aMainWi\
+ndow\x01\x03\x00\x00\x00,\x00I\x00m\x00p\
+\x00o\x00r\x00t\x00a\x00r\x00 \x00d\x00e\
+\x00 \x00A\x00r\x00q\x00u\x00i\x00v\x00o\
+\x00.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x13\
+Import from File\
+...\x07\x00\x00\x00\x0aMainWind\
+ow\x01\x03\x00\x00\x00\x0c\x00P\x00E\x00R\x00F\
+\x00I\x00S\x08\x00\x00\x00\x00\x06\x00\x00\x00\x08PR\
+OFILES\x07\x00\x00\x00\x0aMainW\
+indow\x01\x03\x00\x00\x00(\x00P\x00r\x00\
+o\x00v\x00i\x00s\x00i\x00o\x00n\x00a\x00\
+r\x00 \x00P\x00e\x00e\x00r\x00s\x00.\x00\
+.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x12Pro\
+vision Peers...\x07\
+\x00\x00\x00\x0aMainWindow\x01\x03\
+\x00\x00\x00\x1e\x00P\x00r\x00o\x00v\x00i\x00s\
+\x00i\x00o\x00n\x00a\x00m\x00e\x00n\x00t\
+\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0cProv\
+isioning\x07\x00\x00\x00\x0aMai\
+nWindow\x01\x03\x00\x00\x00.\x00E\x00\
+r\x00r\x00o\x00 \x00d\x00e\x00 \x00P\x00\
+r\x00o\x00v\x00i\x00s\x00i\x00o\x00n\x00\
+a\x00m\x00e\x00n\x00t\x00o\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x12Provisionin\
+g Error\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00,\x00P\x00r\
+\x00o\x00v\x00i\x00s\x00i\x00o\x00n\x00a\
+\x00n\x00d\x00o\x00 \x00p\x00e\x00e\x00r\
+\x00s\x00.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x15Provisioning p\
+eers...\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00N\x00S\x00e\
+\x00l\x00e\x00c\x00i\x00o\x00n\x00e\x00 \
+\x00u\x00m\x00 \x00t\x00\xfa\x00n\x00e\x00l\
+\x00 \x00p\x00a\x00r\x00a\x00 \x00v\x00e\
+\x00r\x00 \x00o\x00s\x00 \x00d\x00e\x00t\
+\x00a\x00l\x00h\x00e\x00s\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x1fSelect a tun\
+nel to view deta\
+ils\x07\x00\x00\x00\x0aMainWind\
+ow\x01\x03\x00\x00\x00>\x00C\x00o\x00n\x00f\
+\x00i\x00g\x00u\x00r\x00a\x00\xe7\x00\xe3\x00o\
+\x00 \x00W\x00i\x00r\x00e\x00G\x00u\x00a\
+\x00r\x00d\x00 \x00(\x00*\x00.\x00c\x00o\
+\x00n\x00f\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x19\
+WireGuard Config\
+ (*.conf)\x07\x00\x00\x00\x0aMa\
+inWindow\x01\x03\x00\x00\x00\x1a\x00W\
+\x00i\x00r\x00e\x00G\x00u\x00a\x00r\x00d\
+\x00 \x00G\x00U\x00I\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x0dWireGuard GUI\x07\
+\x00\x00\x00\x0aMainWindow\x01\x03\
+\x00\x00\x00\x1a#\xf1\x00 \x00D\x00i\x00a\x00g\
+\x00n\x00\xf3\x00s\x00t\x00i\x00c\x00o\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x0f\xe2\x8f\xb1 Diag\
+nostics\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00\x1e&\x99\x00 \
+\x00C\x00o\x00n\x00f\x00i\x00g\x00u\x00r\
+\x00a\x00\xe7\x00\xf5\x00e\x00s\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x0c\xe2\x9a\x99 Settings\
+\x07\x00\x00\x00\x0aMainWindow\x01\
+\x03\x00\x00\x00\x10\x00C\x00o\x00n\x00e\x00c\x00\
+t\x00a\x00r\x08\x00\x00\x00\x00\x06\x00\x00\x00\x07C\
+onnect\x07\x00\x00\x00\x11Profi\
+leDetailView\x01\x03\x00\x00\
+\x00\x12\x00C\x00o\x00n\x00e\x00c\x00t\x00a\
+\x00d\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Co\
+nnected\x07\x00\x00\x00\x11Prof\
+ileDetailView\x01\x03\x00\
+\x00\x00\x14\x00C\x00o\x00n\x00e\x00c\x00t\x00\
+a\x00n\x00d\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x0aConnecting\x07\x00\x00\x00\x11\
+ProfileDetailVie\
+w\x01\x03\x00\x00\x00D\x00D\x00a\x00d\x00o\x00\
+s\x00:\x00 \x00{\x000\x00}\x00 \x00r\x00\
+e\x00c\x00e\x00b\x00i\x00d\x00o\x00s\x00\
+,\x00 \x00{\x001\x00}\x00 \x00e\x00n\x00\
+v\x00i\x00a\x00d\x00o\x00s\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x1cData: {0} r\
+eceived, {1} sen\
+t\x07\x00\x00\x00\x11ProfileDet\
+ailView\x01\x03\x00\x00\x00\x16\x00D\x00\
+e\x00s\x00c\x00o\x00n\x00e\x00c\x00t\x00\
+a\x00r\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0aDis\
+connect\x07\x00\x00\x00\x11Prof\
+ileDetailView\x01\x03\x00\
+\x00\x00\x18\x00D\x00e\x00s\x00c\x00o\x00n\x00\
+e\x00c\x00t\x00a\x00d\x00o\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x0cDisconnecte\
+d\x07\x00\x00\x00\x11ProfileDet\
+ailView\x01\x03\x00\x00\x00\x1a\x00D\x00\
+e\x00s\x00c\x00o\x00n\x00e\x00c\x00t\x00\
+a\x00n\x00d\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x0dDisconnecting\x07\x00\
+\x00\x00\x11ProfileDetail\
+View\x01\x03\x00\x00\x00\x08\x00E\x00r\x00r\
+\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05Erro\
+r\x07\x00\x00\x00\x11ProfileDet\
+ailView\x01\x03\x00\x00\x00Z\x00\xda\x00\
+l\x00t\x00i\x00m\x00o\x00s\x00 \x00{\x00\
+0\x00}\x00 \x00d\x00i\x00a\x00s\x00:\x00\
+ \x00{\x001\x00}\x00 \x00r\x00e\x00c\x00\
+e\x00b\x00i\x00d\x00o\x00s\x00,\x00 \x00\
+{\x002\x00}\x00 \x00e\x00n\x00v\x00i\x00\
+a\x00d\x00o\x00s\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+%Last {0} days: \
+{1} received, {2\
+} sent\x07\x00\x00\x00\x11Profi\
+leDetailView\x01\x03\x00\x00\
+\x00\x1c\x00N\x00o\x00m\x00e\x00 \x00d\x00o\
+\x00 \x00P\x00e\x00r\x00f\x00i\x00l\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x0cProfile \
+Name\x07\x00\x00\x00\x11Profile\
+DetailView\x01\x03\x00\x00\x00\x16\
+\x00S\x00t\x00a\x00t\x00u\x00s\x00:\x00 \
+\x00{\x000\x00}\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0b\
+Status: {0}\x07\x00\x00\x00\x11\
+ProfileDetailVie\
+w\x01\x03\x00\x00\x00\x1c\x00I\x00P\x00s\x00 \x00\
+p\x00e\x00r\x00m\x00i\x00t\x00i\x00d\x00\
+o\x00s\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bAll\
+owed IPs\x07\x00\x00\x00\x0fPro\
+visionDialog\x01\x03\x00\x00\
+\x00>\x00F\x00a\x00i\x00x\x00a\x00 \x00d\
+\x00e\x00 \x00e\x00n\x00d\x00e\x00r\x00e\
+\x00\xe7\x00o\x00s\x00 \x00d\x00o\x00s\x00 \
+\x00c\x00l\x00i\x00e\x00n\x00t\x00e\x00s\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x13Client\
+ address pool\x07\x00\x00\
+\x00\x0fProvisionDialo\
+g\x01\x03\x00\x00\x00\x06\x00D\x00N\x00S\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x03DNS\x07\x00\x00\x00\x0fP\
+rovisionDialog\x01\x03\
+\x00\x00\x00\x10\x00E\x00n\x00d\x00p\x00o\x00i\
+\x00n\x00t\x08\x00\x00\x00\x00\x06\x00\x00\x00\x08En\
+dpoint\x07\x00\x00\x00\x0fProvi\
+sionDialog\x01\x03\x00\x00\x00\x1e\
+\x00N\x00\xfa\x00m\x00e\x00r\x00o\x00 \x00d\
+\x00e\x00 \x00p\x00e\x00e\x00r\x00s\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x0fNumber o\
+f peers\x07\x00\x00\x00\x0fProv\
+isionDialog\x01\x03\x00\x00\x00\
+\x22\x00P\x00r\x00o\x00v\x00i\x00s\x00i\x00\
+o\x00n\x00a\x00r\x00 \x00P\x00e\x00e\x00\
+r\x00s\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0fPro\
+vision Peers\x07\x00\x00\x00\
+\x0fProvisionDialog\
+\x01\x03\x00\x00\x00 \x00N\x00o\x00m\x00e\x00 \
+\x00d\x00o\x00 \x00s\x00e\x00r\x00v\x00i\
+\x00d\x00o\x00r\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0b\
+Server name\x07\x00\x00\x00\x0f\
+ProvisionDialog\x01\
+\x03\x00\x00\x002\x00C\x00h\x00a\x00v\x00e\x00\
+ \x00p\x00\xfa\x00b\x00l\x00i\x00c\x00a\x00\
+ \x00d\x00o\x00 \x00s\x00e\x00r\x00v\x00\
+i\x00d\x00o\x00r\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x11Server public k\
+ey\x07\x00\x00\x00\x0fProvision\
+Dialog\x01\x03\x00\x00\x00\x16\x00e\x00x\
+\x00.\x00:\x00 \x00w\x00g\x00-\x00h\x00u\
+\x00b\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0be.g.\
+ wg-hub\x07\x00\x00\x00\x0fProv\
+isionDialog\x01\x03\x00\x00\x00\
+\x0c\x00B\x00a\x00c\x00k\x00u\x00p\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x06Backup\x07\x00\x00\
+\x00\x0cSettingsView\x01\x03\
+\x00\x00\x00\x1c\x00E\x00r\x00r\x00o\x00 \x00d\
+\x00e\x00 \x00B\x00a\x00c\x00k\x00u\x00p\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0cBackup\
+ Error\x07\x00\x00\x00\x0cSetti\
+ngsView\x01\x03\x00\x00\x00*\x00B\x00\
+a\x00c\x00k\x00u\x00p\x00 \x00c\x00r\x00\
+i\x00a\x00d\x00o\x00 \x00e\x00m\x00:\x00\
+\x0a\x00{\x000\x00}\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x16Backup created \
+at:\x0a{0}\x07\x00\x00\x00\x0cSett\
+ingsView\x01\x03\x00\x00\x00f\x00A\
+\x00r\x00m\x00a\x00z\x00e\x00n\x00a\x00r\
+\x00 \x00c\x00o\x00n\x00s\x00u\x00l\x00t\
+\x00a\x00s\x00 \x00D\x00N\x00S\x00 \x00e\
+\x00m\x00 \x00c\x00a\x00c\x00h\x00e\x00 \
+\x00e\x00n\x00q\x00u\x00a\x00n\x00t\x00o\
+\x00 \x00c\x00o\x00n\x00e\x00c\x00t\x00a\
+\x00d\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00!Ca\
+che DNS lookups \
+while connected\x07\
+\x00\x00\x00\x0cSettingsView\
+\x01\x03\x00\x00\x00b\x00C\x00o\x00l\x00e\x00t\
+\x00a\x00r\x00 \x00m\x00\xe9\x00t\x00r\x00i\
+\x00c\x00a\x00s\x00 \x00d\x00e\x00 \x00d\
+\x00e\x00s\x00e\x00m\x00p\x00e\x00n\x00h\
+\x00o\x00 \x00(\x00v\x00e\x00j\x00a\x00 \
+\x00D\x00i\x00a\x00g\x00n\x00\xf3\x00s\x00t\
+\x00i\x00c\x00o\x00)\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00-Collect perfor\
+mance metrics (s\
+ee Diagnostics)\x07\
+\x00\x00\x00\x0cSettingsView\
+\x01\x03\x00\x00\x00(\x00C\x00r\x00i\x00a\x00r\
+\x00 \x00B\x00a\x00c\x00k\x00u\x00p\x00 \
+\x00d\x00e\x00 \x00R\x00e\x00d\x00e\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x15Create N\
+etwork Backup\x07\x00\x00\
+\x00\x0cSettingsView\x01\x03\
+\x00\x00\x00\x8c\x00S\x00u\x00b\x00s\x00t\x00i\
+\x00t\x00u\x00i\x00r\x00 \x00D\x00N\x00S\
+\x00 \x00(\x00s\x00e\x00p\x00a\x00r\x00a\
+\x00d\x00o\x00s\x00 \x00p\x00o\x00r\x00 \
+\x00v\x00\xed\x00r\x00g\x00u\x00l\x00a\x00,\
+\x00 \x00v\x00a\x00z\x00i\x00o\x00 \x00p\
+\x00a\x00r\x00a\x00 \x00u\x00s\x00a\x00r\
+\x00 \x00o\x00 \x00D\x00N\x00S\x00 \x00d\
+\x00o\x00 \x00t\x00\xfa\x00n\x00e\x00l\x00)\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00=DNS Ov\
+erride (comma se\
+parated, empty t\
+o use the tunnel\
+'s DNS)\x07\x00\x00\x00\x0cSett\
+ingsView\x01\x03\x00\x00\x00\x0c\x00E\
+\x00s\x00c\x00u\x00r\x00o\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x04Dark\x07\x00\x00\x00\x0cSet\
+tingsView\x01\x03\x00\x00\x00l\x00\
+F\x00a\x00l\x00h\x00a\x00 \x00a\x00o\x00\
+ \x00c\x00r\x00i\x00a\x00r\x00 \x00o\x00\
+ \x00b\x00a\x00c\x00k\x00u\x00p\x00.\x00\
+ \x00V\x00e\x00r\x00i\x00f\x00i\x00q\x00\
+u\x00e\x00 \x00o\x00s\x00 \x00l\x00o\x00\
+g\x00s\x00/\x00p\x00e\x00r\x00m\x00i\x00\
+s\x00s\x00\xf5\x00e\x00s\x00.\x08\x00\x00\x00\x00\
+\x06\x00\x00\x000Failed to c\
+reate backup. Ch\
+eck logs/permiss\
+ions.\x07\x00\x00\x00\x0cSettin\
+gsView\x01\x03\x00\x00\x008\x00F\x00a\
+\x00l\x00h\x00a\x00 \x00a\x00o\x00 \x00r\
+\x00e\x00s\x00t\x00a\x00u\x00r\x00a\x00r\
+\x00 \x00o\x00 \x00b\x00a\x00c\x00k\x00u\
+\x00p\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x19Fa\
+iled to restore \
+backup.\x07\x00\x00\x00\x0cSett\
+ingsView\x01\x03\x00\x00\x00\x5c\x00K\
+\x00i\x00l\x00l\x00 \x00S\x00w\x00i\x00t\
+\x00c\x00h\x00 \x00(\x00B\x00l\x00o\x00q\
+\x00u\x00e\x00a\x00r\x00 \x00o\x00 \x00t\
+\x00r\x00\xe1\x00f\x00e\x00g\x00o\x00 \x00s\
+\x00e\x00 \x00a\x00 \x00V\x00P\x00N\x00 \
+\x00c\x00a\x00i\x00r\x00)\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00(Kill Switch \
+(Block traffic i\
+f VPN drops)\x07\x00\x00\x00\
+\x0cSettingsView\x01\x03\x00\
+\x00\x00\x0c\x00I\x00d\x00i\x00o\x00m\x00a\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x08Languag\
+e\x07\x00\x00\x00\x0cSettingsVi\
+ew\x01\x03\x00\x00\x00\x0a\x00C\x00l\x00a\x00r\
+\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05Ligh\
+t\x07\x00\x00\x00\x0cSettingsVi\
+ew\x01\x03\x00\x00\x008\x00B\x00a\x00c\x00k\
+\x00u\x00p\x00 \x00e\x00 \x00R\x00e\x00s\
+\x00t\x00a\x00u\x00r\x00a\x00\xe7\x00\xe3\x00o\
+\x00 \x00d\x00e\x00 \x00R\x00e\x00d\x00e\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x18Networ\
+k Backup & Resto\
+re\x07\x00\x00\x00\x0cSettingsV\
+iew\x01\x03\x00\x00\x002\x00N\x00e\x00n\x00\
+h\x00u\x00m\x00 \x00b\x00a\x00c\x00k\x00\
+u\x00p\x00 \x00e\x00n\x00c\x00o\x00n\x00\
+t\x00r\x00a\x00d\x00o\x00.\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x11No backups \
+found.\x07\x00\x00\x00\x0cSetti\
+ngsView\x01\x03\x00\x00\x00\x12\x00R\x00\
+e\x00s\x00t\x00a\x00u\x00r\x00a\x00r\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x07Restore\
+\x07\x00\x00\x00\x0cSettingsVie\
+w\x01\x03\x00\x00\x00&\x00E\x00r\x00r\x00o\x00\
+ \x00d\x00e\x00 \x00R\x00e\x00s\x00t\x00\
+a\x00u\x00r\x00a\x00\xe7\x00\xe3\x00o\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x0dRestore E\
+rror\x07\x00\x00\x00\x0cSetting\
+sView\x01\x03\x00\x00\x00.\x00R\x00e\x00\
+s\x00t\x00a\x00u\x00r\x00a\x00r\x00 \x00\
+\xda\x00l\x00t\x00i\x00m\x00o\x00 \x00B\x00\
+a\x00c\x00k\x00u\x00p\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x13Restore Last \
+Backup\x07\x00\x00\x00\x0cSetti\
+ngsView\x01\x03\x00\x00\x00\x98\x00R\x00\
+e\x00s\x00t\x00a\x00u\x00r\x00a\x00r\x00\
+ \x00o\x00 \x00b\x00a\x00c\x00k\x00u\x00\
+p\x00 \x00d\x00e\x00 \x00{\x000\x00}\x00\
+?\x00\x0a\x00I\x00s\x00s\x00o\x00 \x00s\x00\
+u\x00b\x00s\x00t\x00i\x00t\x00u\x00i\x00\
+r\x00\xe1\x00 \x00a\x00s\x00 \x00c\x00o\x00\
+n\x00f\x00i\x00g\x00u\x00r\x00a\x00\xe7\x00\
+\xf5\x00e\x00s\x00 \x00d\x00e\x00 \x00r\x00\
+e\x00d\x00e\x00 \x00a\x00t\x00u\x00a\x00\
+i\x00s\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00FR\
+estore backup fr\
+om {0}?\x0aThis wil\
+l overwrite curr\
+ent network sett\
+ings.\x07\x00\x00\x00\x0cSettin\
+gsView\x01\x03\x00\x00\x00n\x00R\x00e\
+\x00s\x00t\x00a\x00u\x00r\x00a\x00\xe7\x00\xe3\
+\x00o\x00 \x00c\x00o\x00n\x00c\x00l\x00u\
+\x00\xed\x00d\x00a\x00.\x00 \x00R\x00e\x00i\
+\x00n\x00i\x00c\x00i\x00e\x00 \x00a\x00 \
+\x00r\x00e\x00d\x00e\x00 \x00o\x00u\x00 \
+\x00o\x00 \x00c\x00o\x00m\x00p\x00u\x00t\
+\x00a\x00d\x00o\x00r\x00.\x08\x00\x00\x00\x00\x06\
+\x00\x00\x008Restore succ\
+essful. Please r\
+estart networkin\
+g or reboot.\x07\x00\x00\x00\
+\x0cSettingsView\x01\x03\x00\
+\x00\x00n\x00R\x00o\x00a\x00m\x00i\x00n\x00\
+g\x00 \x00C\x00o\x00n\x00t\x00\xed\x00n\x00\
+u\x00o\x00 \x00(\x00A\x00t\x00u\x00a\x00\
+l\x00i\x00z\x00a\x00r\x00 \x00e\x00n\x00\
+d\x00p\x00o\x00i\x00n\x00t\x00s\x00 \x00\
+a\x00o\x00 \x00m\x00u\x00d\x00a\x00r\x00\
+ \x00d\x00e\x00 \x00r\x00e\x00d\x00e\x00\
+)\x08\x00\x00\x00\x00\x06\x00\x00\x006Seaml\
+ess Roaming (Ref\
+resh endpoints o\
+n network change\
+)\x07\x00\x00\x00\x0cSettingsVi\
+ew\x01\x03\x00\x00\x00\x1a\x00C\x00o\x00n\x00f\
+\x00i\x00g\x00u\x00r\x00a\x00\xe7\x00\xf5\x00e\
+\x00s\x08\x00\x00\x00\x00\x06\x00\x00\x00\x08Sett\
+ings\x07\x00\x00\x00\x0cSetting\
+sView\x01\x03\x00\x00\x00*\x00I\x00n\x00\
+i\x00c\x00i\x00a\x00r\x00 \x00c\x00o\x00\
+m\x00 \x00o\x00 \x00S\x00i\x00s\x00t\x00\
+e\x00m\x00a\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0dS\
+tart on Boot\x07\x00\x00\x00\
+\x0cSettingsView\x01\x03\x00\
+\x00\x00\x08\x00T\x00e\x00m\x00a\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x05Theme\x07\x00\x00\x00\x0cS\
+ettingsView\x01\x03\x00\x00\x00\
+*\x00e\x00x\x00.\x00:\x00 \x001\x00.\x00\
+1\x00.\x001\x00.\x001\x00,\x00 \x009\x00\
+.\x009\x00.\x009\x00.\x009\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x15e.g. 1.1.1.\
+1, 9.9.9.9\x07\x00\x00\x00\x0cS\
+ettingsView\x01\x03\x00\x00\x00\
+\x1c\x00C\x00o\x00n\x00e\x00c\x00t\x00a\x00\
+d\x00o\x00:\x00 \x00{\x000\x00}\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x0eConnected\
+: {0}\x07\x00\x00\x00\x0aSystem\
+Tray\x01\x03\x00\x00\x00\x18\x00D\x00e\x00s\
+\x00c\x00o\x00n\x00e\x00c\x00t\x00a\x00d\
+\x00o\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0cDisc\
+onnected\x07\x00\x00\x00\x0aSys\
+temTray\x01\x03\x00\x00\x00\x08\x00S\x00\
+a\x00i\x00r\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04Q\
+uit\x07\x00\x00\x00\x0aSystemTr\
+ay\x01\x03\x00\x00\x00\x1c\x00M\x00o\x00s\x00t\
+\x00r\x00a\x00r\x00 \x00J\x00a\x00n\x00e\
+\x00l\x00a\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bSh\
+ow Window\x07\x00\x00\x00\x0aSy\
+stemTray\x01\x03\x00\x00\x00<\x00W\
+\x00i\x00r\x00e\x00G\x00u\x00a\x00r\x00d\
+\x00 \x00G\x00U\x00I\x00:\x00 \x00C\x00o\
+\x00n\x00e\x00c\x00t\x00a\x00d\x00o\x00 \
+\x00a\x00 \x00{\x000\x00}\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x1fWireGuard GU\
+I: Connected to \
+{0}\x07\x00\x00\x00\x0aSystemTr\
+ay\x01\x03\x00\x00\x006\x00W\x00i\x00r\x00e\
+\x00G\x00u\x00a\x00r\x00d\x00 \x00G\x00U\
+\x00I\x00:\x00 \x00D\x00e\x00s\x00c\x00o\
+\x00n\x00e\x00c\x00t\x00a\x00d\x00o\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x1bWireGuar\
+d GUI: Disconnec\
+ted\x07\x00\x00\x00\x0aSystemTr\
+ay\x01\x88\x00\x00\x00\x02\x03\x01\
+"
+
+qt_resource_name = b"\
+\x00\x04\
+\x00\x06\xc4\xee\
+\x00i\
+\x001\x008\x00n\
+\x00\x0c\
+\x079\x99\x9d\
+\x00a\
+\x00p\x00p\x00_\x00p\x00t\x00_\x00B\x00R\x00.\x00q\x00m\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1S\xe4\xed\xff\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
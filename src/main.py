@@ -1,47 +1,81 @@
 import sys
 import logging
 import os
+import socket
+import time
+from typing import Dict
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QSocketNotifier, QTimer
 from src.ui.main_window import MainWindow
 from src.ui.tray import SystemTray
+from src.ui.theme import theme_manager
 from src.backend.wireguard import WireGuardService
 from src.backend.profiles import ProfileManager
 from src.backend.settings import SettingsManager
 from src.backend.backup import NetworkBackupManager
+from src.backend.killswitch import KillSwitch
+from src.backend.dns import (
+    StubResolver, parse_dns_servers, parse_dns_domains, use_stub_for_interface, set_interface_dns
+)
+from src.backend.config import read_config
+from src.backend.netlink import NetlinkMonitor, RT_TABLE_MAIN, default_route_interfaces
+from src.backend.history import HistoryStore
 from src.utils.i18n import LocalizationManager
-from src.utils.paths import get_assets_dir
+from src.utils.paths import get_assets_dir, get_config_dir
+from src.utils.metrics import metrics
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Interval for status polling when rtnetlink notifications are unavailable
+FALLBACK_POLL_MS = 5000
+# Roaming: debounce bursts of route changes, check handshakes while connected,
+# and give an in-place endpoint refresh this long before a full reconnect
+ROAM_DEBOUNCE_MS = 1000
+HANDSHAKE_CHECK_MS = 30000
+ROAM_VERIFY_MS = 10000
+# Transfer counters are sampled into the history store this often
+SAMPLE_INTERVAL_MS = 60000
+
 class WireGuardApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False) # Keep running for tray
 
-        # I18n
-        self.loc_manager = LocalizationManager(self.app)
-        self.loc_manager.load_language() # Load system language
-
         # Managers
         self.wg_service = WireGuardService()
         self.profile_manager = ProfileManager()
         self.settings_manager = SettingsManager()
+        self.configure_metrics()
+        # Before any window exists, so widgets are polished only once
+        theme_manager.apply(self.settings_manager.get("theme", "dark"), self.app)
+
+        # I18n. Also before any window exists: the source language loads
+        # nothing, others don't trigger a LanguageChange pass at startup.
+        # No language setting means the user hasn't picked one: use the system's
+        self.loc_manager = LocalizationManager(self.app)
+        self.loc_manager.load_language(self.settings_manager.get("language"))
         self.backup_manager = NetworkBackupManager()
+        self.kill_switch = KillSwitch()
+        self.dns_stub = None
+        self.history = HistoryStore()
 
         self.main_window = MainWindow(
             self.wg_service,
             self.profile_manager,
             self.settings_manager,
-            self.backup_manager
+            self.backup_manager,
+            self.history
         )
         self.tray = SystemTray()
 
         # Connect signals
         self.main_window.connect_signal.connect(self.connect_tunnel)
         self.main_window.disconnect_signal.connect(self.disconnect_tunnel)
+        self.main_window.language_signal.connect(self.loc_manager.load_language)
+        self.main_window.kill_switch_signal.connect(self.on_kill_switch_changed)
 
         self.tray.show_window_signal.connect(self.show_window)
         self.tray.quit_signal.connect(self.quit_app)
@@ -49,10 +83,39 @@ class WireGuardApp:
 
         self.tray.show()
 
+        # Tunnel state monitoring
+        self.active_profile = None
+        # ifindex of the active tunnel, once netlink has reported it up
+        self.tunnel_index = 0
+        self.netlink = NetlinkMonitor()
+        self.netlink_notifier = None
+        self.poll_timer = QTimer()
+        self.poll_timer.timeout.connect(self.poll_status)
+        self.start_monitor()
+
+        # Roaming
+        self.roam_timer = QTimer()
+        self.roam_timer.setSingleShot(True)
+        self.roam_timer.timeout.connect(self.roam_tunnel)
+        self.roam_verify_timer = QTimer()
+        self.roam_verify_timer.setSingleShot(True)
+        self.roam_verify_timer.timeout.connect(self.verify_roam)
+        # When the last roam started, and each peer's transfer_rx at that time
+        self.roam_started = 0.0
+        self.roam_rx: Dict[str, int] = {}
+        self.handshake_timer = QTimer()
+        self.handshake_timer.timeout.connect(self.check_handshake)
+
+        # Traffic history
+        self.sample_timer = QTimer()
+        self.sample_timer.timeout.connect(self.sample_traffic)
+
         # Check Privileges
         if not self.check_privileges():
              logger.warning("Not running as root. Functionality will be limited.")
              # We might show a message box here, but let's do it after main window init or rely on logger for now
+        else:
+            self.clear_stale_kill_switch()
 
         # Check if WG is installed
         if not self.wg_service.is_installed():
@@ -88,25 +151,312 @@ class WireGuardApp:
                 self.show_window()
 
     def connect_tunnel(self, profile_name):
+        with metrics.span("connect", profile=profile_name):
+            self._connect_tunnel(profile_name)
+
+    def _connect_tunnel(self, profile_name):
         path = self.profile_manager.get_profile_path(profile_name)
-        success = self.wg_service.connect(str(path))
+        with metrics.span("connect_phase", profile=profile_name, phase="wg_quick"):
+            success = self.wg_service.connect(str(path))
         if success:
-            self.tray.update_status(True, profile_name)
-            self.main_window.detail_view.set_status("connected")
+            self.set_tunnel_state(profile_name, "connected")
+            with metrics.span("connect_phase", profile=profile_name, phase="kill_switch"):
+                self.apply_kill_switch(profile_name)
+            with metrics.span("connect_phase", profile=profile_name, phase="dns"):
+                self.start_dns_stub(profile_name)
         else:
             self.main_window.detail_view.set_status("error")
             self.tray.update_status(False) # Keep disconnected/error icon
 
     def disconnect_tunnel(self, profile_name):
+        with metrics.span("disconnect", profile=profile_name):
+            self._disconnect_tunnel(profile_name)
+
+    def _disconnect_tunnel(self, profile_name):
         path = self.profile_manager.get_profile_path(profile_name)
-        success = self.wg_service.disconnect(str(path))
+        # Counters disappear with the interface, so take a last sample first
+        self.sample_traffic()
+        with metrics.span("disconnect_phase", profile=profile_name, phase="wg_quick"):
+            success = self.wg_service.disconnect(str(path))
+        # Also when down failed: the tunnel may already be gone, and the
+        # user asked to get off it either way. The rules may have been loaded
+        # by an earlier run, so don't rely on is_active() alone.
+        with metrics.span("disconnect_phase", profile=profile_name, phase="kill_switch"):
+            if self.kill_switch.is_active() or self.settings_manager.get("kill_switch", False):
+                self.kill_switch.disable()
         if success:
-            self.tray.update_status(False)
+            with metrics.span("disconnect_phase", profile=profile_name, phase="dns"):
+                self.stop_dns_stub()
+            self.set_tunnel_state(None, "disconnected")
             self.main_window.detail_view.set_status("disconnected")
         else:
             self.main_window.detail_view.set_status("error")
 
+    def apply_kill_switch(self, profile_name):
+        """
+        Load the kill switch for a connected tunnel. It is deliberately left in
+        place if the tunnel drops unexpectedly; disconnect, turning the
+        setting off, or the next start without a tunnel removes it.
+        """
+        if not self.settings_manager.get("kill_switch", False):
+            return
+        path = self.profile_manager.get_profile_path(profile_name)
+        if not self.kill_switch.enable(profile_name, str(path)):
+            logger.error(f"Failed to enable kill switch for {profile_name}")
+
+    def on_kill_switch_changed(self, enabled):
+        if not enabled:
+            # Also clears rules an earlier run left for a tunnel still up
+            self.kill_switch.disable()
+        elif self.active_profile is not None:
+            self.apply_kill_switch(self.active_profile)
+
+    def clear_stale_kill_switch(self):
+        """
+        Remove a kill switch left behind by a previous run (e.g. after a
+        crash), unless one of our tunnels is still up and it protects it.
+        """
+        if any(self.interface_index(name) for name in self.profile_manager.list_profiles()):
+            return
+        self.kill_switch.disable()
+
+    def start_dns_stub(self, profile_name):
+        """
+        Serve DNS for the tunnel from a local caching stub. Upstreams come
+        from the dns_override setting, or else the profile's DNS entry.
+        With caching off, the override goes to the system resolver directly.
+        """
+        self.stop_dns_stub()
+        if not self.settings_manager.get("dns_cache", True):
+            self.apply_dns_override(profile_name)
+            return
+        upstreams = parse_dns_servers(self.settings_manager.get("dns_override", ""))
+        if not upstreams:
+            upstreams = parse_dns_servers(self.tunnel_dns(profile_name))
+        if not upstreams:
+            return
+
+        stub = StubResolver(upstreams)
+        if stub.start():
+            self.dns_stub = stub
+            if not use_stub_for_interface(profile_name, stub.address):
+                self.stop_dns_stub()
+
+    def stop_dns_stub(self):
+        if self.dns_stub is not None:
+            self.dns_stub.stop()
+            self.dns_stub = None
+
+    def tunnel_dns(self, profile_name):
+        """The profile's DNS entry, as given to wg-quick."""
+        config = read_config(str(self.profile_manager.get_profile_path(profile_name)))
+        return config["interface"].get("DNS", "") if config else ""
+
+    def apply_dns_override(self, profile_name):
+        """Give the tunnel the dns_override servers, keeping the profile's search domains."""
+        servers = parse_dns_servers(self.settings_manager.get("dns_override", ""))
+        if servers:
+            set_interface_dns(profile_name, servers, parse_dns_domains(self.tunnel_dns(profile_name)))
+
+    def restore_tunnel_dns(self, profile_name):
+        """Point a tunnel that outlives the stub back at its configured DNS."""
+        dns = self.tunnel_dns(profile_name)
+        set_interface_dns(profile_name, parse_dns_servers(dns), parse_dns_domains(dns))
+
+    def start_monitor(self):
+        """
+        Subscribe to rtnetlink link/address/route events. Falls back to
+        periodic status polling where netlink is not available.
+        """
+        if self.netlink.open():
+            self.netlink_notifier = QSocketNotifier(self.netlink.fileno(), QSocketNotifier.Read)
+            self.netlink_notifier.activated.connect(self.on_netlink_ready)
+            logger.info("Monitoring tunnel state via rtnetlink.")
+        else:
+            logger.info("rtnetlink unavailable, falling back to status polling.")
+            self.poll_timer.start(FALLBACK_POLL_MS)
+
+    def on_netlink_ready(self, *args):
+        for event in self.netlink.read_events():
+            metrics.inc("netlink_events", kind=event.kind)
+            self.handle_network_event(event)
+
+    def handle_network_event(self, event):
+        if event.kind == "overrun":
+            # Events were lost; re-read the real state once
+            self.poll_status()
+            return
+
+        if event.kind.startswith("link_") and event.ifname:
+            if event.ifname == self.active_profile:
+                if event.kind == "link_up":
+                    self.tunnel_index = event.index
+                elif self.is_tunnel_gone(event):
+                    logger.info(f"Interface {event.ifname} went away ({event.kind}).")
+                    self.set_tunnel_state(None, "disconnected")
+            elif event.kind == "link_up" and self.active_profile is None \
+                    and self.profile_manager.get_profile_path(event.ifname).exists():
+                logger.info(f"Interface {event.ifname} brought up externally.")
+                self.set_tunnel_state(event.ifname, "connected")
+                self.tunnel_index = event.index
+        elif event.kind.startswith("route_") and event.is_default_route:
+            logger.info(f"Default route changed ({event.kind}, gateway {event.gateway}).")
+            # Only the main table matters; wg-quick keeps its own default
+            # route in a separate table, which we must not react to.
+            if self.active_profile is not None and event.table == RT_TABLE_MAIN \
+                    and event.index != self.interface_index(self.active_profile):
+                if event.kind == "route_removed" \
+                        and not set(default_route_interfaces()) - {self.active_profile}:
+                    # Nothing to roam onto yet; the next route_added will
+                    logger.info("No default route left, waiting for a new one.")
+                    self.roam_timer.stop()
+                    return
+                self.roam_timer.start(ROAM_DEBOUNCE_MS)
+
+    def is_tunnel_gone(self, event):
+        """
+        Whether a link event for the active profile ends the tunnel. wg-quick
+        creates the link down before raising it, and a reconnect replaces it,
+        so only the removal of the current link or a down on the link we saw
+        come up count.
+        """
+        current = self.interface_index(event.ifname)
+        if event.kind == "link_removed":
+            return current == 0
+        return event.kind == "link_down" and event.index == self.tunnel_index == current
+
+    @staticmethod
+    def interface_index(name):
+        try:
+            return socket.if_nametoindex(name)
+        except OSError:
+            return 0
+
+    def poll_status(self):
+        if self.active_profile is None:
+            return
+        status = self.wg_service.get_status(self.active_profile)
+        if status.get("status") != "connected":
+            self.set_tunnel_state(None, status.get("status", "disconnected"))
+
+    def check_handshake(self):
+        if self.active_profile is None or self.roam_verify_timer.isActive():
+            return
+        if self.wg_service.is_handshake_stale(self.active_profile):
+            logger.info(f"Handshake for {self.active_profile} is stale.")
+            self.roam_tunnel()
+
+    def roam_tunnel(self):
+        """
+        Recover the active tunnel after a network change. Endpoints are
+        refreshed in place first; a full wg-quick cycle is the last resort.
+        """
+        profile_name = self.active_profile
+        if profile_name is None or not self.settings_manager.get("roaming", True):
+            return
+        metrics.inc("roams", profile=profile_name)
+        path = self.profile_manager.get_profile_path(profile_name)
+        self.roam_started = time.time()
+        self.roam_rx = {peer["public_key"]: peer["transfer_rx"]
+                        for peer in self.wg_service.get_peers(profile_name)}
+        if self.wg_service.roam(profile_name, str(path)):
+            logger.info(f"Refreshed endpoints for {profile_name}, waiting for the peers to answer.")
+            if self.kill_switch.is_active():
+                self.apply_kill_switch(profile_name)
+            self.roam_verify_timer.start(ROAM_VERIFY_MS)
+        else:
+            self.reconnect_tunnel(profile_name)
+
+    def verify_roam(self):
+        profile_name = self.active_profile
+        if profile_name is None:
+            return
+        if not self.wg_service.peers_reachable(profile_name, self.roam_started, self.roam_rx):
+            logger.warning(f"No answer from peers after roaming {profile_name}, reconnecting.")
+            self.reconnect_tunnel(profile_name)
+
+    def reconnect_tunnel(self, profile_name):
+        path = str(self.profile_manager.get_profile_path(profile_name))
+        logger.info(f"Reconnecting {profile_name} with wg-quick.")
+        metrics.inc("reconnects", profile=profile_name)
+        self.wg_service.disconnect(path)
+        if self.wg_service.connect(path):
+            self.set_tunnel_state(profile_name, "connected")
+            self.apply_kill_switch(profile_name)
+            # wg-quick up has reset the tunnel's DNS configuration
+            if self.dns_stub is not None:
+                use_stub_for_interface(profile_name, self.dns_stub.address)
+            elif not self.settings_manager.get("dns_cache", True):
+                self.apply_dns_override(profile_name)
+        else:
+            self.set_tunnel_state(None, "error")
+
+    def set_tunnel_state(self, profile_name, status):
+        """Reflect a tunnel state change in the tray, detail view and history."""
+        previous = self.active_profile
+        changed = profile_name or previous
+        self.active_profile = profile_name
+        if profile_name != previous:
+            self.tunnel_index = 0
+            if previous is not None:
+                self.history.end_session(previous)
+            if profile_name is not None:
+                self.history.start_session(profile_name)
+        if profile_name is None:
+            self.handshake_timer.stop()
+            self.roam_verify_timer.stop()
+            self.sample_timer.stop()
+        elif not self.handshake_timer.isActive():
+            self.handshake_timer.start(HANDSHAKE_CHECK_MS)
+            self.sample_timer.start(SAMPLE_INTERVAL_MS)
+        self.tray.update_status(profile_name is not None, profile_name or "")
+        if self.main_window.detail_view.current_profile == changed:
+            self.main_window.detail_view.set_status(status)
+
+    def sample_traffic(self):
+        """Record the active tunnel's transfer counters in the history store."""
+        profile_name = self.active_profile
+        if profile_name is None:
+            return
+        peers = self.wg_service.get_peers(profile_name)
+        if not peers:
+            return
+        rx = sum(peer["transfer_rx"] for peer in peers)
+        tx = sum(peer["transfer_tx"] for peer in peers)
+        self.history.record_sample(profile_name, rx, tx)
+        if self.main_window.detail_view.current_profile == profile_name:
+            self.main_window.detail_view.set_traffic(rx, tx)
+
+    def configure_metrics(self):
+        """
+        Turn on instrumentation if enabled in settings. Metrics are exposed on
+        a loopback HTTP endpoint when metrics_port is set, and written to
+        metrics.prom in the config dir on exit.
+        """
+        metrics.enabled = self.settings_manager.get("metrics_enabled", False)
+        port = self.settings_manager.get("metrics_port", 0)
+        if metrics.enabled and port:
+            metrics.serve(port)
+
     def quit_app(self):
+        self.poll_timer.stop()
+        self.handshake_timer.stop()
+        self.sample_timer.stop()
+        if self.netlink_notifier is not None:
+            # Stop watching the fd before it is closed
+            self.netlink_notifier.setEnabled(False)
+        self.netlink.close()
+        self.sample_traffic()
+        if self.active_profile is not None:
+            self.history.end_session(self.active_profile)
+        self.history.close()
+        if self.dns_stub is not None and self.active_profile is not None:
+            # The tunnel stays up without us; don't leave it resolving via the stub
+            self.restore_tunnel_dns(self.active_profile)
+        self.stop_dns_stub()
+        if metrics.enabled:
+            metrics.write_textfile(get_config_dir() / "metrics.prom")
+        metrics.stop()
         self.app.quit()
 
 if __name__ == "__main__":
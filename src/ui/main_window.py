@@ -1,28 +1,48 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QListWidget, QListWidgetItem,
-    QStackedWidget, QFrame, QCheckBox, QLineEdit, QComboBox, QMessageBox
+    QLabel, QPushButton, QListWidget,
+    QStackedWidget, QFrame, QCheckBox, QLineEdit, QComboBox, QMessageBox,
+    QPlainTextEdit, QMenu, QFileDialog, QDialog, QFormLayout, QSpinBox,
+    QDialogButtonBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QObject, QThread, QLocale
+from PySide6.QtGui import QIcon, QAction, QPalette
 from src.backend.wireguard import WireGuardService
 from src.backend.profiles import ProfileManager
 from src.backend.settings import SettingsManager
 from src.backend.backup import NetworkBackupManager
+from src.backend.provisioning import PeerProvisioner
 from src.utils.paths import get_assets_dir
-
-class MainWindow(QMainWindow):
+from src.utils.metrics import metrics
+from src.ui.theme import theme_manager, set_style_property
+from src.utils.i18n import Translatable, LANGUAGES
+
+# Window of the traffic summary in the detail view
+HISTORY_DAYS = 30
+
+def format_bytes(count: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if count < 1024:
+            break
+        count /= 1024
+    else:
+        unit = "TiB"
+    return f"{count:.0f} {unit}" if unit == "B" else f"{count:.2f} {unit}"
+
+class MainWindow(Translatable, QMainWindow):
     connect_signal = Signal(str)
     disconnect_signal = Signal(str)
+    language_signal = Signal(str)
+    kill_switch_signal = Signal(bool)
 
-    def __init__(self, wg_service: WireGuardService, profile_manager: ProfileManager, settings_manager: SettingsManager, backup_manager: NetworkBackupManager):
+    def __init__(self, wg_service: WireGuardService, profile_manager: ProfileManager, settings_manager: SettingsManager, backup_manager: NetworkBackupManager, history=None):
         super().__init__()
         self.wg_service = wg_service
         self.profile_manager = profile_manager
         self.settings_manager = settings_manager
         self.backup_manager = backup_manager
+        self.history = history
 
-        self.setWindowTitle("WireGuard GUI")
         self.resize(900, 600)
 
         # Central Widget
@@ -37,40 +57,47 @@ class MainWindow(QMainWindow):
         # Sidebar
         self.sidebar = QWidget()
         self.sidebar.setFixedWidth(200)
-        self.sidebar.setStyleSheet("background-color: #2D2D2D; color: white;")
+        self.sidebar.setObjectName("sidebar")
+        # Painted from the palette so theme switches don't need a repolish
+        self.sidebar.setBackgroundRole(QPalette.AlternateBase)
+        self.sidebar.setAutoFillBackground(True)
         sidebar_layout = QVBoxLayout(self.sidebar)
 
         # Profile List
         self.profile_list = QListWidget()
-        self.profile_list.setStyleSheet("""
-            QListWidget { border: none; background: transparent; }
-            QListWidget::item { padding: 10px; }
-            QListWidget::item:selected { background-color: #3D3D3D; }
-        """)
         self.profile_list.itemClicked.connect(self.on_profile_selected)
-        sidebar_layout.addWidget(QLabel("PROFILES"))
+        self.profiles_label = QLabel()
+        sidebar_layout.addWidget(self.profiles_label)
         sidebar_layout.addWidget(self.profile_list)
 
         # Add Profile Button
-        add_btn = QPushButton("+ Add Tunnel")
-        add_btn.setStyleSheet("border: 1px solid #555; padding: 5px; border-radius: 4px;")
-        sidebar_layout.addWidget(add_btn)
+        self.add_btn = QPushButton()
+        add_menu = QMenu(self.add_btn)
+        self.import_action = add_menu.addAction("", self.import_profile)
+        self.provision_action = add_menu.addAction("", self.provision_peers)
+        self.add_btn.setMenu(add_menu)
+        sidebar_layout.addWidget(self.add_btn)
 
         # Settings Button (in Sidebar)
-        settings_btn = QPushButton("⚙ Settings")
-        settings_btn.setStyleSheet("border: 1px solid #555; padding: 5px; border-radius: 4px; margin-top: 10px;")
-        settings_btn.clicked.connect(self.show_settings)
-        sidebar_layout.addWidget(settings_btn)
+        self.settings_btn = QPushButton()
+        self.settings_btn.setObjectName("settingsButton")
+        self.settings_btn.clicked.connect(self.show_settings)
+        sidebar_layout.addWidget(self.settings_btn)
+
+        # Diagnostics Button
+        self.diagnostics_btn = QPushButton()
+        self.diagnostics_btn.clicked.connect(self.show_diagnostics)
+        sidebar_layout.addWidget(self.diagnostics_btn)
 
         main_layout.addWidget(self.sidebar)
 
         # Content Area
         self.content_area = QStackedWidget()
-        self.content_area.setStyleSheet("background-color: #1E1E1E; color: white;")
+        self.content_area.setObjectName("contentArea")
         main_layout.addWidget(self.content_area)
 
         # Default View (No profile selected)
-        self.no_profile_view = QLabel("Select a tunnel to view details")
+        self.no_profile_view = QLabel()
         self.no_profile_view.setAlignment(Qt.AlignCenter)
         self.content_area.addWidget(self.no_profile_view)
 
@@ -80,32 +107,108 @@ class MainWindow(QMainWindow):
         self.detail_view.disconnect_btn.clicked.connect(self.on_disconnect_clicked)
         self.content_area.addWidget(self.detail_view)
 
-        # Settings View
-        self.settings_view = SettingsView(self.settings_manager, self.backup_manager)
-        self.content_area.addWidget(self.settings_view)
+        # Settings and Diagnostics views are built on first use, which
+        # keeps them out of startup
+        self.settings_view = None
+        self.diagnostics_view = None
 
+        self.retranslate_ui()
         self.refresh_profiles()
 
+    def retranslate_ui(self):
+        self.setWindowTitle(self.tr("WireGuard GUI"))
+        self.profiles_label.setText(self.tr("PROFILES"))
+        self.add_btn.setText(self.tr("+ Add Tunnel"))
+        self.import_action.setText(self.tr("Import from File..."))
+        self.provision_action.setText(self.tr("Provision Peers..."))
+        self.settings_btn.setText(self.tr("⚙ Settings"))
+        self.diagnostics_btn.setText(self.tr("⏱ Diagnostics"))
+        self.no_profile_view.setText(self.tr("Select a tunnel to view details"))
+
     def refresh_profiles(self):
-        self.profile_list.clear()
-        profiles = self.profile_manager.list_profiles()
-        for p in profiles:
-            item = QListWidgetItem(p)
-            self.profile_list.addItem(item)
+        with metrics.span("ui_refresh", view="profiles"):
+            self.profile_list.clear()
+            profiles = self.profile_manager.list_profiles()
+            # One bulk insert instead of an item per profile
+            self.profile_list.addItems(profiles)
 
     def on_profile_selected(self, item):
-        profile_name = item.text()
-        self.detail_view.set_profile(profile_name)
+        with metrics.span("ui_refresh", view="detail"):
+            profile_name = item.text()
+            self.detail_view.set_profile(profile_name)
 
-        # Update status in UI
-        status = self.wg_service.get_status(profile_name)
-        self.detail_view.set_status(status.get("status", "disconnected"))
+            # Update status in UI
+            status = self.wg_service.get_status(profile_name)
+            self.detail_view.set_status(status.get("status", "disconnected"))
+            self.detail_view.set_traffic(0, 0)
+            if self.history is not None:
+                self.detail_view.set_history(*self.history.total_traffic(profile_name, HISTORY_DAYS))
 
-        self.content_area.setCurrentWidget(self.detail_view)
+            self.content_area.setCurrentWidget(self.detail_view)
 
     def show_settings(self):
+        if self.settings_view is None:
+            self.settings_view = SettingsView(self.settings_manager, self.backup_manager)
+            self.settings_view.language_signal.connect(self.language_signal.emit)
+            self.settings_view.kill_switch_signal.connect(self.kill_switch_signal.emit)
+            self.content_area.addWidget(self.settings_view)
         self.content_area.setCurrentWidget(self.settings_view)
 
+    def import_profile(self):
+        path, _ = QFileDialog.getOpenFileName(self, self.tr("Import Tunnel"), "", self.tr("WireGuard Config (*.conf)"))
+        if not path:
+            return
+        if self.profile_manager.import_profile(path):
+            self.refresh_profiles()
+        else:
+            QMessageBox.critical(self, self.tr("Import Error"), self.tr("Failed to import {0}").format(path))
+
+    def provision_peers(self):
+        dialog = ProvisionDialog(self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        # Large batches take seconds; keep the UI responsive meanwhile
+        self.provision_action.setEnabled(False)
+        self.provision_progress = QProgressDialog(self.tr("Provisioning peers..."), None, 0, 0, self)
+        self.provision_progress.setWindowModality(Qt.WindowModal)
+        self.provision_progress.show()
+
+        self.provision_thread = QThread(self)
+        self.provision_worker = ProvisionWorker(PeerProvisioner(self.profile_manager), dialog.values())
+        self.provision_worker.moveToThread(self.provision_thread)
+        self.provision_thread.started.connect(self.provision_worker.run)
+        self.provision_worker.done.connect(self.on_provisioned)
+        self.provision_worker.failed.connect(self.on_provision_failed)
+        self.provision_thread.finished.connect(self.provision_worker.deleteLater)
+        self.provision_thread.finished.connect(self.provision_thread.deleteLater)
+        self.provision_thread.start()
+
+    def finish_provisioning(self):
+        self.provision_thread.quit()
+        self.provision_progress.close()
+        self.provision_action.setEnabled(True)
+
+    @Slot(list, str)
+    def on_provisioned(self, names, peers_path):
+        self.finish_provisioning()
+        self.refresh_profiles()
+        QMessageBox.information(
+            self, self.tr("Provisioning"),
+            self.tr("Created {0} client profiles.\nServer [Peer] blocks written to:\n{1}").format(len(names), peers_path)
+        )
+
+    @Slot(str)
+    def on_provision_failed(self, error):
+        self.finish_provisioning()
+        QMessageBox.critical(self, self.tr("Provisioning Error"), error)
+
+    def show_diagnostics(self):
+        if self.diagnostics_view is None:
+            self.diagnostics_view = DiagnosticsView()
+            self.content_area.addWidget(self.diagnostics_view)
+        self.diagnostics_view.refresh()
+        self.content_area.setCurrentWidget(self.diagnostics_view)
+
     def on_connect_clicked(self):
         profile = self.detail_view.current_profile
         if profile:
@@ -118,67 +221,163 @@ class MainWindow(QMainWindow):
             self.disconnect_signal.emit(profile)
             self.detail_view.set_status("disconnecting")
 
-class ProfileDetailView(QWidget):
+class ProfileDetailView(Translatable, QWidget):
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignTop)
 
-        self.name_label = QLabel("Profile Name")
-        self.name_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        self.name_label = QLabel()
+        self.name_label.setObjectName("titleLabel")
         layout.addWidget(self.name_label)
 
-        self.status_label = QLabel("Status: Disconnected")
+        self.status_label = QLabel()
+        self.status_label.setObjectName("statusLabel")
         layout.addWidget(self.status_label)
 
-        self.stats_label = QLabel("Data: 0 B received, 0 B sent")
+        self.stats_label = QLabel()
         layout.addWidget(self.stats_label)
 
+        self.history_label = QLabel()
+        layout.addWidget(self.history_label)
+
         layout.addStretch()
 
-        self.connect_btn = QPushButton("Connect")
-        self.connect_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50; color: white; border: none;
-                padding: 10px 20px; border-radius: 5px; font-weight: bold;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
-        self.disconnect_btn = QPushButton("Disconnect")
-        self.disconnect_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336; color: white; border: none;
-                padding: 10px 20px; border-radius: 5px; font-weight: bold;
-            }
-            QPushButton:hover { background-color: #da190b; }
-        """)
+        self.connect_btn = QPushButton()
+        self.connect_btn.setObjectName("connectButton")
+        self.disconnect_btn = QPushButton()
+        self.disconnect_btn.setObjectName("disconnectButton")
 
         self.disconnect_btn.hide()
 
         layout.addWidget(self.connect_btn)
         layout.addWidget(self.disconnect_btn)
 
+        # Shown values, kept so they can be re-rendered in another language
         self.current_profile = None
+        self.status = "disconnected"
+        self.traffic = (0, 0)
+        self.history = (0, 0)
+        self.retranslate_ui()
+
+    def retranslate_ui(self):
+        self.name_label.setText(self.current_profile or self.tr("Profile Name"))
+        self.connect_btn.setText(self.tr("Connect"))
+        self.disconnect_btn.setText(self.tr("Disconnect"))
+        self.render_status()
+        self.render_traffic()
+
+    def render_status(self):
+        statuses = {
+            "connected": self.tr("Connected"),
+            "connecting": self.tr("Connecting"),
+            "disconnected": self.tr("Disconnected"),
+            "disconnecting": self.tr("Disconnecting"),
+            "error": self.tr("Error"),
+        }
+        self.status_label.setText(self.tr("Status: {0}").format(statuses.get(self.status, self.status.title())))
+
+    def render_traffic(self):
+        self.stats_label.setText(self.tr("Data: {0} received, {1} sent").format(*map(format_bytes, self.traffic)))
+        self.history_label.setText(
+            self.tr("Last {0} days: {1} received, {2} sent").format(HISTORY_DAYS, *map(format_bytes, self.history))
+        )
 
     def set_profile(self, name):
         self.current_profile = name
         self.name_label.setText(name)
 
+    def set_traffic(self, rx, tx):
+        self.traffic = (rx, tx)
+        self.render_traffic()
+
+    def set_history(self, rx, tx):
+        self.history = (rx, tx)
+        self.render_traffic()
+
     def set_status(self, status):
-        self.status_label.setText(f"Status: {status.title()}")
+        self.status = status
+        self.render_status()
+        # Colours come from the theme's statusLabel[status=...] rules
+        set_style_property(self.status_label, "status", status)
         if status == "connected":
             self.connect_btn.hide()
             self.disconnect_btn.show()
-            self.status_label.setStyleSheet("color: #4CAF50;")
         else:
             self.connect_btn.show()
             self.disconnect_btn.hide()
-            if status == "disconnected":
-                self.status_label.setStyleSheet("color: #9E9E9E;")
-            elif status == "error":
-                self.status_label.setStyleSheet("color: #f44336;")
 
-class SettingsView(QWidget):
+class ProvisionWorker(QObject):
+    """Runs PeerProvisioner.provision() off the GUI thread."""
+    done = Signal(list, str)
+    failed = Signal(str)
+
+    def __init__(self, provisioner: PeerProvisioner, values: dict):
+        super().__init__()
+        self.provisioner = provisioner
+        self.values = values
+
+    @Slot()
+    def run(self):
+        try:
+            names = self.provisioner.provision(**self.values)
+        except (ValueError, OSError) as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(names, str(self.provisioner.peers_path(self.values["server"])))
+
+class ProvisionDialog(QDialog):
+    """Collects the parameters for bulk peer provisioning."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Provision Peers"))
+        layout = QFormLayout(self)
+
+        self.server_edit = QLineEdit()
+        self.server_edit.setPlaceholderText(self.tr("e.g. wg-hub"))
+        layout.addRow(self.tr("Server name"), self.server_edit)
+
+        self.pubkey_edit = QLineEdit()
+        layout.addRow(self.tr("Server public key"), self.pubkey_edit)
+
+        self.endpoint_edit = QLineEdit()
+        self.endpoint_edit.setPlaceholderText("vpn.example.com:51820")
+        layout.addRow(self.tr("Endpoint"), self.endpoint_edit)
+
+        self.network_edit = QLineEdit("10.8.0.0/16")
+        layout.addRow(self.tr("Client address pool"), self.network_edit)
+
+        self.dns_edit = QLineEdit()
+        layout.addRow(self.tr("DNS"), self.dns_edit)
+
+        self.allowed_edit = QLineEdit("0.0.0.0/0, ::/0")
+        layout.addRow(self.tr("Allowed IPs"), self.allowed_edit)
+
+        self.count_spin = QSpinBox()
+        self.count_spin.setRange(1, 65534)
+        self.count_spin.setValue(10)
+        layout.addRow(self.tr("Number of peers"), self.count_spin)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def values(self) -> dict:
+        return {
+            "server": self.server_edit.text().strip(),
+            "count": self.count_spin.value(),
+            "server_public_key": self.pubkey_edit.text().strip(),
+            "endpoint": self.endpoint_edit.text().strip(),
+            "network": self.network_edit.text().strip(),
+            "dns": self.dns_edit.text().strip(),
+            "allowed_ips": self.allowed_edit.text().strip(),
+        }
+
+class SettingsView(Translatable, QWidget):
+    language_signal = Signal(str)
+    kill_switch_signal = Signal(bool)
+
     def __init__(self, settings_manager: SettingsManager, backup_manager: NetworkBackupManager):
         super().__init__()
         self.settings_manager = settings_manager
@@ -187,54 +386,182 @@ class SettingsView(QWidget):
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignTop)
 
-        layout.addWidget(QLabel("Settings"))
+        self.title_label = QLabel()
+        layout.addWidget(self.title_label)
+
+        # Language
+        self.language_label = QLabel()
+        layout.addWidget(self.language_label)
+        self.language_combo = QComboBox()
+        for code, name in LANGUAGES.items():
+            # Native names, so they are never translated
+            self.language_combo.addItem(name, code)
+        self.language_combo.setCurrentIndex(max(0, self.language_combo.findData(self.settings_manager.get("language") or QLocale.system().name())))
+        self.language_combo.currentIndexChanged.connect(self.set_language)
+        layout.addWidget(self.language_combo)
+
+        # Theme
+        self.theme_label = QLabel()
+        layout.addWidget(self.theme_label)
+        self.theme_combo = QComboBox()
+        for name in theme_manager.themes():
+            self.theme_combo.addItem("", name)
+        self.theme_combo.setCurrentIndex(max(0, self.theme_combo.findData(self.settings_manager.get("theme", "dark"))))
+        self.theme_combo.currentIndexChanged.connect(self.set_theme)
+        layout.addWidget(self.theme_combo)
 
         # Start on Boot
-        self.boot_check = QCheckBox("Start on Boot")
+        self.boot_check = QCheckBox()
         self.boot_check.setChecked(self.settings_manager.get("start_on_boot", False))
         self.boot_check.stateChanged.connect(lambda s: self.settings_manager.set("start_on_boot", bool(s)))
         layout.addWidget(self.boot_check)
 
         # Kill Switch
-        self.kill_check = QCheckBox("Kill Switch (Block traffic if VPN drops)")
+        self.kill_check = QCheckBox()
         self.kill_check.setChecked(self.settings_manager.get("kill_switch", False))
-        self.kill_check.stateChanged.connect(lambda s: self.settings_manager.set("kill_switch", bool(s)))
+        self.kill_check.stateChanged.connect(self.set_kill_switch)
         layout.addWidget(self.kill_check)
 
+        # Roaming
+        self.roam_check = QCheckBox()
+        self.roam_check.setChecked(self.settings_manager.get("roaming", True))
+        self.roam_check.stateChanged.connect(lambda s: self.settings_manager.set("roaming", bool(s)))
+        layout.addWidget(self.roam_check)
+
+        # DNS
+        self.dns_cache_check = QCheckBox()
+        self.dns_cache_check.setChecked(self.settings_manager.get("dns_cache", True))
+        self.dns_cache_check.stateChanged.connect(lambda s: self.settings_manager.set("dns_cache", bool(s)))
+        layout.addWidget(self.dns_cache_check)
+
+        self.dns_label = QLabel()
+        layout.addWidget(self.dns_label)
+        self.dns_edit = QLineEdit(self.settings_manager.get("dns_override", ""))
+        self.dns_edit.editingFinished.connect(lambda: self.settings_manager.set("dns_override", self.dns_edit.text().strip()))
+        layout.addWidget(self.dns_edit)
+
+        # Metrics
+        self.metrics_check = QCheckBox()
+        self.metrics_check.setChecked(self.settings_manager.get("metrics_enabled", False))
+        self.metrics_check.stateChanged.connect(self.set_metrics_enabled)
+        layout.addWidget(self.metrics_check)
+
         layout.addSpacing(20)
 
         # Network Backup Section
-        layout.addWidget(QLabel("Network Backup & Restore"))
+        self.backup_label = QLabel()
+        layout.addWidget(self.backup_label)
 
-        self.backup_btn = QPushButton("Create Network Backup")
+        self.backup_btn = QPushButton()
         self.backup_btn.clicked.connect(self.create_backup)
-        self.backup_btn.setStyleSheet("background-color: #2196F3; color: white; padding: 8px; border-radius: 4px;")
+        self.backup_btn.setObjectName("backupButton")
         layout.addWidget(self.backup_btn)
 
-        self.restore_btn = QPushButton("Restore Last Backup")
+        self.restore_btn = QPushButton()
         self.restore_btn.clicked.connect(self.restore_backup)
-        self.restore_btn.setStyleSheet("background-color: #FF9800; color: white; padding: 8px; border-radius: 4px;")
+        self.restore_btn.setObjectName("restoreButton")
         layout.addWidget(self.restore_btn)
 
+        self.retranslate_ui()
+
+    def retranslate_ui(self):
+        self.title_label.setText(self.tr("Settings"))
+        self.language_label.setText(self.tr("Language"))
+        self.theme_label.setText(self.tr("Theme"))
+        themes = {"dark": self.tr("Dark"), "light": self.tr("Light")}
+        for index in range(self.theme_combo.count()):
+            name = self.theme_combo.itemData(index)
+            self.theme_combo.setItemText(index, themes.get(name, name.title()))
+        self.boot_check.setText(self.tr("Start on Boot"))
+        self.kill_check.setText(self.tr("Kill Switch (Block traffic if VPN drops)"))
+        self.roam_check.setText(self.tr("Seamless Roaming (Refresh endpoints on network change)"))
+        self.dns_cache_check.setText(self.tr("Cache DNS lookups while connected"))
+        self.dns_label.setText(self.tr("DNS Override (comma separated, empty to use the tunnel's DNS)"))
+        self.dns_edit.setPlaceholderText(self.tr("e.g. 1.1.1.1, 9.9.9.9"))
+        self.metrics_check.setText(self.tr("Collect performance metrics (see Diagnostics)"))
+        self.backup_label.setText(self.tr("Network Backup & Restore"))
+        self.backup_btn.setText(self.tr("Create Network Backup"))
+        self.restore_btn.setText(self.tr("Restore Last Backup"))
+
+    def set_language(self, index):
+        code = self.language_combo.itemData(index)
+        self.settings_manager.set("language", code)
+        self.language_signal.emit(code)
+
+    def set_kill_switch(self, state):
+        self.settings_manager.set("kill_switch", bool(state))
+        self.kill_switch_signal.emit(bool(state))
+
+    def set_theme(self, index):
+        name = self.theme_combo.itemData(index)
+        self.settings_manager.set("theme", name)
+        theme_manager.apply(name)
+
+    def set_metrics_enabled(self, state):
+        metrics.enabled = bool(state)
+        self.settings_manager.set("metrics_enabled", bool(state))
+
     def create_backup(self):
         backup_path = self.backup_manager.create_backup()
         if backup_path:
-            QMessageBox.information(self, "Backup", f"Backup created at:\n{backup_path}")
+            QMessageBox.information(self, self.tr("Backup"), self.tr("Backup created at:\n{0}").format(backup_path))
         else:
-            QMessageBox.critical(self, "Backup Error", "Failed to create backup. Check logs/permissions.")
+            QMessageBox.critical(self, self.tr("Backup Error"), self.tr("Failed to create backup. Check logs/permissions."))
 
     def restore_backup(self):
         backups = self.backup_manager.list_backups()
         if not backups:
-             QMessageBox.information(self, "Restore", "No backups found.")
+             QMessageBox.information(self, self.tr("Restore"), self.tr("No backups found."))
              return
 
         # Just restore the latest for now (Simplicity)
         latest = backups[0]
-        ret = QMessageBox.warning(self, "Restore", f"Restore backup from {latest.name}?\nThis will overwrite current network settings.", QMessageBox.Yes | QMessageBox.No)
+        ret = QMessageBox.warning(self, self.tr("Restore"), self.tr("Restore backup from {0}?\nThis will overwrite current network settings.").format(latest.name), QMessageBox.Yes | QMessageBox.No)
 
         if ret == QMessageBox.Yes:
             if self.backup_manager.restore_backup(latest):
-                 QMessageBox.information(self, "Restore", "Restore successful. Please restart networking or reboot.")
+                 QMessageBox.information(self, self.tr("Restore"), self.tr("Restore successful. Please restart networking or reboot."))
             else:
-                 QMessageBox.critical(self, "Restore Error", "Failed to restore backup.")
+                 QMessageBox.critical(self, self.tr("Restore Error"), self.tr("Failed to restore backup."))
+
+class DiagnosticsView(Translatable, QWidget):
+    """Shows the collected timing spans and counters in OpenMetrics text form."""
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        self.title_label = QLabel()
+        layout.addWidget(self.title_label)
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setObjectName("diagnosticsText")
+        layout.addWidget(self.text)
+
+        buttons = QHBoxLayout()
+        self.refresh_btn = QPushButton()
+        self.refresh_btn.clicked.connect(self.refresh)
+        buttons.addWidget(self.refresh_btn)
+        self.reset_btn = QPushButton()
+        self.reset_btn.clicked.connect(self.reset)
+        buttons.addWidget(self.reset_btn)
+        layout.addLayout(buttons)
+
+        self.retranslate_ui()
+
+    def retranslate_ui(self):
+        self.title_label.setText(self.tr("Diagnostics"))
+        self.refresh_btn.setText(self.tr("Refresh"))
+        self.reset_btn.setText(self.tr("Reset"))
+        if not metrics.enabled:
+            self.refresh()
+
+    def refresh(self):
+        if not metrics.enabled:
+            self.text.setPlainText(self.tr("Metrics collection is disabled. Enable it in Settings."))
+            return
+        self.text.setPlainText(metrics.render())
+
+    def reset(self):
+        metrics.reset()
+        self.refresh()
@@ -0,0 +1,150 @@
+from string import Template
+from typing import Dict, List, Optional, Tuple
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPalette, QColor
+from PySide6.QtWidgets import QApplication, QWidget
+from src.utils.metrics import metrics
+
+DEFAULT_THEME = "dark"
+
+# Theme colours only reach widgets through the palette
+THEMES = {
+    "dark": {
+        "window": "#1E1E1E",
+        "sidebar": "#2D2D2D",
+        "selection": "#3D3D3D",
+        "base": "#252525",
+        "text": "#FFFFFF",
+    },
+    "light": {
+        "window": "#FFFFFF",
+        "sidebar": "#F0F0F0",
+        "selection": "#DADADA",
+        "base": "#FFFFFF",
+        "text": "#202020",
+    },
+}
+
+# Colours used by the stylesheet. They are the same for every theme, so the
+# compiled stylesheets are identical and switching only swaps the palette.
+ACCENTS = {
+    "muted": "#888888",
+    "border": "#888888",
+    "success": "#4CAF50",
+    "success_hover": "#45a049",
+    "danger": "#f44336",
+    "danger_hover": "#da190b",
+    "info": "#2196F3",
+    "warning": "#FF9800",
+    "on_accent": "#FFFFFF",
+}
+
+PALETTE_ROLES = (
+    (QPalette.Window, "window"),
+    (QPalette.WindowText, "text"),
+    (QPalette.Base, "base"),
+    (QPalette.AlternateBase, "sidebar"),
+    (QPalette.Text, "text"),
+    (QPalette.PlaceholderText, "muted"),
+    (QPalette.Button, "sidebar"),
+    (QPalette.ButtonText, "text"),
+    (QPalette.ToolTipBase, "sidebar"),
+    (QPalette.ToolTipText, "text"),
+    (QPalette.Highlight, "selection"),
+    (QPalette.HighlightedText, "text"),
+)
+
+# Widgets are styled by object name and dynamic properties, never inline.
+# Rules must not set theme colours: Qt resolves stylesheet colours (including
+# palette() references) at polish time, so they would only change with a
+# full repolish of every widget.
+STYLESHEET = Template("""
+#sidebar QListWidget { border: none; background: transparent; }
+#sidebar QListWidget::item { padding: 10px; }
+#sidebar QPushButton {
+    background: transparent;
+    border: 1px solid $border; padding: 5px; border-radius: 4px;
+}
+#sidebar QPushButton#settingsButton { margin-top: 10px; }
+QLabel#titleLabel { font-size: 24px; font-weight: bold; }
+QLabel#statusLabel[status="connected"] { color: $success; }
+QLabel#statusLabel[status="disconnected"] { color: $muted; }
+QLabel#statusLabel[status="error"] { color: $danger; }
+QPushButton#connectButton, QPushButton#disconnectButton {
+    color: $on_accent; border: none;
+    padding: 10px 20px; border-radius: 5px; font-weight: bold;
+}
+QPushButton#connectButton { background-color: $success; }
+QPushButton#connectButton:hover { background-color: $success_hover; }
+QPushButton#disconnectButton { background-color: $danger; }
+QPushButton#disconnectButton:hover { background-color: $danger_hover; }
+QPushButton#backupButton, QPushButton#restoreButton {
+    color: $on_accent; padding: 8px; border-radius: 4px;
+}
+QPushButton#backupButton { background-color: $info; }
+QPushButton#restoreButton { background-color: $warning; }
+QPlainTextEdit#diagnosticsText { font-family: monospace; border: 1px solid $border; }
+""")
+
+
+def set_style_property(widget: QWidget, name: str, value):
+    """Set a dynamic property used by the stylesheet and restyle just this widget."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class ThemeManager:
+    """
+    Compiles each theme once into an application stylesheet and palette,
+    and applies them to the whole application. Widgets never set their own
+    stylesheets. The stylesheet is only replaced when it actually differs,
+    which forces Qt to re-polish every widget; switching between the
+    built-in themes is a single application palette update.
+    """
+    def __init__(self):
+        self.current: Optional[str] = None
+        self.compiled: Dict[str, Tuple[str, QPalette]] = {}
+        self.stylesheet: Optional[str] = None
+
+    def themes(self) -> List[str]:
+        return list(THEMES)
+
+    def compile(self, name: str) -> Tuple[str, QPalette]:
+        try:
+            return self.compiled[name]
+        except KeyError:
+            pass
+        if name not in THEMES:
+            raise ValueError(f"Unknown theme {name}")
+        colors = {**ACCENTS, **THEMES[name]}
+        palette = QPalette()
+        for role, key in PALETTE_ROLES:
+            palette.setColor(role, QColor(colors[key]))
+        self.compiled[name] = (STYLESHEET.substitute(colors), palette)
+        return self.compiled[name]
+
+    def apply(self, name: str, app: Optional[QApplication] = None):
+        """Switch the application to a theme. Unknown names fall back to the default."""
+        if name not in THEMES:
+            name = DEFAULT_THEME
+        if name == self.current:
+            return
+        app = app or QApplication.instance()
+        with metrics.span("theme_apply", theme=name):
+            stylesheet, palette = self.compile(name)
+            app.setPalette(palette)
+            if stylesheet != self.stylesheet:
+                # Otherwise the stylesheet pins every widget's palette to
+                # the one current at polish time
+                app.setAttribute(Qt.AA_UseStyleSheetPropagationInWidgetStyles)
+                app.setStyleSheet(stylesheet)
+                self.stylesheet = stylesheet
+        self.current = name
+
+
+# The application has a single stylesheet and palette; this owns them
+theme_manager = ThemeManager()
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QEvent
 from src.utils.icons import IconGenerator
 import sys
 
@@ -12,33 +12,51 @@ class SystemTray(QSystemTrayIcon):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setToolTip("WireGuard GUI")
+        self.connected = False
+        self.profile_name = ""
 
         # Initial Icon (Disconnected)
         self.setIcon(IconGenerator.get_status_icon("disconnected"))
 
         # Create context menu
         self.menu = QMenu()
+        # The tray icon is not a widget; its menu gets LanguageChange for it
+        self.menu.installEventFilter(self)
 
-        self.status_action = self.menu.addAction("Status: Disconnected")
+        self.status_action = self.menu.addAction("")
         self.status_action.setEnabled(False)
         self.menu.addSeparator()
 
-        self.show_action = self.menu.addAction("Show Window")
+        self.show_action = self.menu.addAction("")
         self.show_action.triggered.connect(self.show_window_signal.emit)
 
         self.menu.addSeparator()
-        self.quit_action = self.menu.addAction("Quit")
+        self.quit_action = self.menu.addAction("")
         self.quit_action.triggered.connect(self.quit_signal.emit)
 
         self.setContextMenu(self.menu)
+        self.retranslate_ui()
+
+    def eventFilter(self, obj, event):
+        if obj is self.menu and event.type() == QEvent.LanguageChange:
+            self.retranslate_ui()
+        return super().eventFilter(obj, event)
+
+    def retranslate_ui(self):
+        self.show_action.setText(self.tr("Show Window"))
+        self.quit_action.setText(self.tr("Quit"))
+        self.render_status()
+
+    def render_status(self):
+        if self.connected:
+            self.setToolTip(self.tr("WireGuard GUI: Connected to {0}").format(self.profile_name))
+            self.status_action.setText(self.tr("Connected: {0}").format(self.profile_name))
+        else:
+            self.setToolTip(self.tr("WireGuard GUI: Disconnected"))
+            self.status_action.setText(self.tr("Disconnected"))
 
     def update_status(self, connected: bool, profile_name: str = ""):
-        if connected:
-            self.setToolTip(f"WireGuard GUI: Connected to {profile_name}")
-            self.status_action.setText(f"Connected: {profile_name}")
-            self.setIcon(IconGenerator.get_status_icon("connected"))
-        else:
-            self.setToolTip("WireGuard GUI: Disconnected")
-            self.status_action.setText("Disconnected")
-            self.setIcon(IconGenerator.get_status_icon("disconnected"))
+        self.connected = connected
+        self.profile_name = profile_name
+        self.setIcon(IconGenerator.get_status_icon("connected" if connected else "disconnected"))
+        self.render_status()
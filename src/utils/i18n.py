@@ -1,24 +1,98 @@
-from PySide6.QtCore import QTranslator, QLocale, QCoreApplication
+from PySide6.QtCore import QTranslator, QLocale, QLibraryInfo, QEvent
+from typing import Dict, List, Optional
+import importlib
 import logging
+from src.utils.metrics import metrics
+
+# Language the UI strings are written in; it needs no translator
+SOURCE_LANGUAGE = "en_US"
+# Languages offered in Settings, by native name
+LANGUAGES = {
+    "en_US": "English",
+    "pt_BR": "Português (Brasil)",
+}
+# Compiled .qm files are bundled as Qt resources under RESOURCE_DIR
+# (regenerate with `python -m src.i18n.build`)
+RESOURCE_MODULE = "src.i18n.translations_rc"
+RESOURCE_DIR = ":/i18n"
 
 class LocalizationManager:
+    """
+    Switches the UI language at runtime.
+
+    Translations are read from the bundled Qt resources, never from the
+    working directory. Nothing is loaded for the source language, so the
+    default startup does no translation work; the resource bundle is
+    registered on first use and each locale's translators are cached.
+    Installing a translator makes Qt send LanguageChange to every widget,
+    which retranslates itself in place.
+    """
     def __init__(self, app):
         self.app = app
-        self.translator = QTranslator()
+        self.language = SOURCE_LANGUAGE
+        self.installed: List[QTranslator] = []
+        self.cache: Dict[str, Optional[List[QTranslator]]] = {}
+
+    @staticmethod
+    def is_source_language(locale_name: str) -> bool:
+        return QLocale(locale_name).language() == QLocale(SOURCE_LANGUAGE).language()
+
+    def translators(self, locale_name: str) -> Optional[List[QTranslator]]:
+        """Load (once) the app and Qt translators for a locale. None if there is no app translation."""
+        if locale_name in self.cache:
+            return self.cache[locale_name]
+
+        importlib.import_module(RESOURCE_MODULE)
+        locale = QLocale(locale_name)
+        app_translator = QTranslator()
+        if not app_translator.load(locale, "app", "_", RESOURCE_DIR):
+            self.cache[locale_name] = None
+            return None
+        translators = [app_translator]
+        # Qt's own strings (dialog buttons etc.) ship with Qt
+        qt_translator = QTranslator()
+        if qt_translator.load(locale, "qtbase", "_", QLibraryInfo.path(QLibraryInfo.TranslationsPath)):
+            translators.append(qt_translator)
+        self.cache[locale_name] = translators
+        return translators
 
-    def load_language(self, locale_name: str = None):
+    def load_language(self, locale_name: str = None) -> bool:
         """
         Load a language. If locale_name is None, use system locale.
+        Returns False if no translation exists for it.
         """
         if locale_name is None:
-            locale = QLocale.system()
-        else:
-            locale = QLocale(locale_name)
-
-        # Path to translations. Assuming they are in 'src/i18n' or 'assets/translations'
-        # In a real build, these would be compiled .qm files.
-        if self.translator.load(locale, "app", "_", "src/i18n"):
-            self.app.installTranslator(self.translator)
-            logging.info(f"Loaded translation for {locale.name()}")
-        else:
-            logging.warning(f"Could not load translation for {locale.name()}")
+            locale_name = QLocale.system().name()
+        if locale_name == self.language:
+            return True
+
+        translators = []
+        if not self.is_source_language(locale_name):
+            translators = self.translators(locale_name)
+            if translators is None:
+                logging.warning(f"Could not load translation for {locale_name}")
+                return False
+
+        with metrics.span("language_switch", language=locale_name):
+            for translator in self.installed:
+                self.app.removeTranslator(translator)
+            for translator in translators:
+                self.app.installTranslator(translator)
+        self.installed = translators
+        self.language = locale_name
+        logging.info(f"Loaded translation for {locale_name}")
+        return True
+
+class Translatable:
+    """
+    Mixin for widgets with translatable text. Subclasses set all their
+    strings in retranslate_ui(), call it once when built, and it is called
+    again whenever the application language changes.
+    """
+    def retranslate_ui(self):
+        """Set all translatable text. Does nothing unless overridden."""
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.retranslate_ui()
+        super().changeEvent(event)
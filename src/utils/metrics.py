@@ -0,0 +1,206 @@
+import os
+import re
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "wgui"
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _NullSpan:
+    """Returned while metrics are disabled so instrumented code pays almost nothing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("metrics", "key", "start")
+
+    def __init__(self, metrics, key):
+        self.metrics = metrics
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.metrics._observe(self.key, time.perf_counter() - self.start, exc_type is not None)
+        return False
+
+
+class Metrics:
+    """
+    In-process registry of timing spans and counters.
+
+    Usage:
+        with metrics.span("connect", profile=name):
+            ...
+        metrics.inc("netlink_events", kind=event.kind)
+    """
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        # key -> [count, sum, max, errors]
+        self.spans: Dict[Tuple[str, Labels], list] = {}
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.server = None
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> Tuple[str, Labels]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def span(self, name: str, **labels):
+        """Time the enclosed block. A no-op while disabled."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, self._key(name, labels))
+
+    def command_span(self, cmd):
+        """Span for a subprocess call, labelled with the binary and subcommand."""
+        if not self.enabled:
+            return _NULL_SPAN
+        command = os.path.basename(str(cmd[0]))
+        if len(cmd) > 1 and not str(cmd[1]).startswith("-"):
+            command += f" {cmd[1]}"
+        return _Span(self, self._key("command", {"command": command}))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def _observe(self, key, seconds: float, failed: bool):
+        with self.lock:
+            entry = self.spans.get(key)
+            if entry is None:
+                entry = self.spans[key] = [0, 0.0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+            if failed:
+                entry[3] += 1
+
+    def reset(self):
+        with self.lock:
+            self.spans.clear()
+            self.counters.clear()
+
+    def render(self) -> str:
+        """Render all metrics in the OpenMetrics text format."""
+        with self.lock:
+            spans = sorted(self.spans.items())
+            counters = sorted(self.counters.items())
+
+        lines = []
+        families = {}
+        for (name, labels), (count, total, peak, errors) in spans:
+            families.setdefault(name, []).append((labels, count, total, peak, errors))
+        for name, samples in families.items():
+            family = f"{PREFIX}_{_sanitize(name)}_seconds"
+            lines.append(f"# TYPE {family} summary")
+            lines.append(f"# UNIT {family} seconds")
+            for labels, count, total, _peak, _errors in samples:
+                lines.append(f"{family}_count{_format_labels(labels)} {count}")
+                lines.append(f"{family}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"# TYPE {family}_max gauge")
+            for labels, _count, _total, peak, _errors in samples:
+                lines.append(f"{family}_max{_format_labels(labels)} {peak:.6f}")
+            lines.append(f"# TYPE {PREFIX}_{_sanitize(name)}_errors counter")
+            for labels, _count, _total, _peak, errors in samples:
+                lines.append(f"{PREFIX}_{_sanitize(name)}_errors_total{_format_labels(labels)} {errors}")
+
+        families = {}
+        for (name, labels), value in counters:
+            families.setdefault(name, []).append((labels, value))
+        for name, samples in families.items():
+            family = f"{PREFIX}_{_sanitize(name)}"
+            lines.append(f"# TYPE {family} counter")
+            for labels, value in samples:
+                lines.append(f"{family}_total{_format_labels(labels)} {value:g}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> bool:
+        """Atomically write the current metrics to a text file."""
+        tmp = Path(f"{path}.tmp")
+        try:
+            tmp.write_text(self.render())
+            os.replace(tmp, path)
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to write metrics to {path}: {e}")
+            return False
+
+    def serve(self, port: int, address: str = "127.0.0.1") -> bool:
+        """Expose /metrics over HTTP on a loopback address."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            self.server = ThreadingHTTPServer((address, port), Handler)
+        except OSError as e:
+            logger.error(f"Could not start metrics endpoint on {address}:{port}: {e}")
+            return False
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f"Serving metrics on http://{address}:{self.server.server_address[1]}/metrics")
+        return True
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def _sanitize(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{_sanitize(k)}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared registry, used like a module-level logger
+metrics = Metrics()
@@ -1,11 +1,33 @@
+import subprocess
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch, mock_open
 from pathlib import Path
 from src.backend.wireguard import WireGuardService
 from src.backend.profiles import ProfileManager
+from src.backend.config import parse_config
+from src.backend.runner import runner, CommandRunner
+
+SAMPLE_CONFIG = """
+[Interface]
+PrivateKey = aPrivateKey=
+Address = 10.0.0.2/32
+DNS = 10.0.0.1
+
+[Peer] # home server
+PublicKey = peerPublicKey=
+Endpoint = 127.0.0.1:51820
+AllowedIPs = 0.0.0.0/0
+AllowedIPs = ::/0
+PersistentKeepalive = 25
+"""
 
 class TestWireGuardService(unittest.TestCase):
-    @patch("src.backend.wireguard.shutil.which")
+    def setUp(self):
+        runner.clear_cache()
+
+    @patch("src.backend.runner.shutil.which")
     def test_is_installed(self, mock_which):
         # Test when installed
         mock_which.side_effect = lambda x: "/usr/bin/" + x
@@ -15,11 +37,12 @@ class TestWireGuardService(unittest.TestCase):
         # Test when not installed
         mock_which.side_effect = None # Reset side_effect
         mock_which.return_value = None
+        runner.clear_cache() # Resolved binaries are cached
         service = WireGuardService()
         self.assertFalse(service.is_installed())
 
-    @patch("src.backend.wireguard.subprocess.run")
-    @patch("src.backend.wireguard.shutil.which")
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
     def test_connect(self, mock_which, mock_run):
         mock_which.return_value = "/usr/bin/wg-quick"
         service = WireGuardService()
@@ -29,6 +52,171 @@ class TestWireGuardService(unittest.TestCase):
         self.assertTrue(service.connect("/path/to/config.conf"))
         mock_run.assert_called()
 
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_get_peers(self, mock_which, mock_run):
+        mock_which.return_value = "/usr/bin/wg"
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = (
+            "privkey=\tpubkey=\t51820\toff\n"
+            "peerPublicKey=\t(none)\t203.0.113.5:51820\t0.0.0.0/0\t1700000000\t1024\t2048\t25\n"
+        )
+        peers = WireGuardService().get_peers("wg0")
+        self.assertEqual(len(peers), 1)
+        self.assertEqual(peers[0]["endpoint"], "203.0.113.5:51820")
+        self.assertEqual(peers[0]["latest_handshake"], 1700000000)
+        self.assertEqual(peers[0]["transfer_tx"], 2048)
+        self.assertEqual(peers[0]["persistent_keepalive"], 25)
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_roam_updates_endpoint_in_place(self, mock_which, mock_run):
+        mock_which.side_effect = lambda x: "/usr/bin/" + x
+        service = WireGuardService()
+        with patch("src.backend.wireguard.read_config", return_value=parse_config(SAMPLE_CONFIG)):
+            self.assertTrue(service.roam("wg0", "/path/to/wg0.conf"))
+
+        # Keepalive goes off and back on, so the kernel sends one right away
+        set_peer = ["/usr/bin/wg", "set", "wg0", "peer", "peerPublicKey="]
+        self.assertEqual([c[0][0] for c in mock_run.call_args_list], [
+            set_peer + ["endpoint", "127.0.0.1:51820", "persistent-keepalive", "off"],
+            set_peer + ["persistent-keepalive", "25"],
+        ])
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_roam_keeps_endpoint_that_does_not_resolve(self, mock_which, mock_run):
+        mock_which.side_effect = lambda x: "/usr/bin/" + x
+        service = WireGuardService()
+        with patch("src.backend.wireguard.read_config", return_value=parse_config(SAMPLE_CONFIG)), \
+                patch("src.backend.wireguard.resolve_endpoint", return_value=[]):
+            self.assertTrue(service.roam("wg0", "/path/to/wg0.conf"))
+
+        set_peer = ["/usr/bin/wg", "set", "wg0", "peer", "peerPublicKey="]
+        self.assertEqual([c[0][0] for c in mock_run.call_args_list], [
+            set_peer + ["persistent-keepalive", "off"],
+            set_peer + ["persistent-keepalive", "25"],
+        ])
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_idle_peer_without_keepalive_is_not_stale(self, mock_which, mock_run):
+        mock_which.side_effect = lambda x: "/usr/bin/" + x
+        service = WireGuardService()
+        old = int(time.time()) - 600
+        def dump(tx, keepalive):
+            runner.clear_cache()
+            mock_run.return_value = subprocess.CompletedProcess([], 0, (
+                "privkey=\tpubkey=\t51820\toff\n"
+                f"peerPublicKey=\t(none)\t203.0.113.5:51820\t0.0.0.0/0\t{old}\t100\t{tx}\t{keepalive}\n"
+            ), "")
+
+        dump(200, "off")
+        self.assertFalse(service.is_handshake_stale("wg0"))
+        dump(200, "off")
+        self.assertFalse(service.is_handshake_stale("wg0"))
+        # Sending without getting a handshake is
+        dump(500, "off")
+        self.assertTrue(service.is_handshake_stale("wg0"))
+        dump(500, "25")
+        self.assertTrue(service.is_handshake_stale("wg0"))
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_peers_reachable_after_roam(self, mock_which, mock_run):
+        mock_which.side_effect = lambda x: "/usr/bin/" + x
+        service = WireGuardService()
+        roamed = time.time()
+        def dump(handshake, rx):
+            runner.clear_cache()
+            mock_run.return_value = subprocess.CompletedProcess([], 0, (
+                "privkey=\tpubkey=\t51820\toff\n"
+                f"peerPublicKey=\t(none)\t203.0.113.5:51820\t0.0.0.0/0\t{handshake}\t{rx}\t0\t25\n"
+            ), "")
+
+        # Session old enough to rekey, yet no handshake and nothing received
+        dump(int(roamed) - 300, 1000)
+        self.assertFalse(service.peers_reachable("wg0", roamed, {"peerPublicKey=": 1000}))
+        # Idle on a young session: WireGuard neither rekeys nor answers keepalives
+        dump(int(roamed) - 60, 1000)
+        self.assertTrue(service.peers_reachable("wg0", roamed, {"peerPublicKey=": 1000}))
+        dump(int(roamed) - 300, 1100)
+        self.assertTrue(service.peers_reachable("wg0", roamed, {"peerPublicKey=": 1000}))
+        dump(int(roamed) + 1, 1000)
+        self.assertTrue(service.peers_reachable("wg0", roamed, {"peerPublicKey=": 1000}))
+
+class TestCommandRunner(unittest.TestCase):
+    @patch("src.backend.runner.subprocess.run")
+    def test_concurrent_reads_are_coalesced(self, mock_run):
+        started = threading.Event()
+        release = threading.Event()
+        def slow_run(cmd, **kwargs):
+            started.set()
+            release.wait(2)
+            return subprocess.CompletedProcess(cmd, 0, "wg0\n", "")
+        mock_run.side_effect = slow_run
+
+        cmd_runner = CommandRunner()
+        results = []
+        def read():
+            results.append(cmd_runner.run(["wg", "show", "interfaces"], coalesce=True,
+                                          capture_output=True, text=True))
+        threads = [threading.Thread(target=read) for _ in range(5)]
+        threads[0].start()
+        started.wait(2)
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual([r.stdout for r in results], ["wg0\n"] * 5)
+
+    @patch("src.backend.runner.subprocess.run")
+    def test_cache_ttl_and_invalidation(self, mock_run):
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+        cmd_runner = CommandRunner()
+        read = ["wg", "show", "interfaces"]
+        cmd_runner.run(read, coalesce=True, cache_ttl=60, capture_output=True)
+        cmd_runner.run(read, coalesce=True, cache_ttl=60, capture_output=True)
+        self.assertEqual(mock_run.call_count, 1)
+
+        # A mutating command drops cached reads
+        cmd_runner.run(["wg-quick", "up", "wg0"], check=True)
+        cmd_runner.run(read, coalesce=True, cache_ttl=60, capture_output=True)
+        self.assertEqual(mock_run.call_count, 3)
+
+    @patch("src.backend.runner.subprocess.run")
+    def test_errors_reach_caller(self, mock_run):
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["wg"], stderr="boom")
+        with self.assertRaises(subprocess.CalledProcessError):
+            CommandRunner().run(["wg", "show"], coalesce=True, check=True)
+
+    @patch("src.backend.runner.shutil.which")
+    def test_which_is_cached(self, mock_which):
+        mock_which.return_value = "/usr/bin/wg"
+        cmd_runner = CommandRunner()
+        cmd_runner.which("wg")
+        cmd_runner.which("wg")
+        self.assertEqual(mock_which.call_count, 1)
+
+    @patch("src.backend.runner.shutil.which")
+    def test_which_misses_are_not_cached(self, mock_which):
+        mock_which.return_value = None
+        cmd_runner = CommandRunner()
+        self.assertIsNone(cmd_runner.which("nft"))
+        mock_which.return_value = "/usr/sbin/nft"
+        self.assertEqual(cmd_runner.which("nft"), "/usr/sbin/nft")
+
+class TestConfigParser(unittest.TestCase):
+    def test_parse_config(self):
+        config = parse_config(SAMPLE_CONFIG)
+        self.assertEqual(config["interface"]["DNS"], "10.0.0.1")
+        self.assertEqual(len(config["peers"]), 1)
+        self.assertEqual(config["peers"][0]["AllowedIPs"], "0.0.0.0/0, ::/0")
+
 class TestProfileManager(unittest.TestCase):
     @patch("src.backend.profiles.get_profiles_dir")
     def test_list_profiles(self, mock_get_dir):
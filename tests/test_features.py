@@ -1,8 +1,31 @@
+import base64
+import os
+import socket
+import tempfile
+import struct
+import subprocess
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch, mock_open
 from pathlib import Path
 from src.backend.settings import SettingsManager
 from src.backend.backup import NetworkBackupManager
+from src.backend.profiles import ProfileManager
+from src.backend.runner import runner
+from src.backend.killswitch import KillSwitch, TABLE_NAME
+from src.backend.dns import StubResolver, DnsCache, parse_dns_servers, parse_dns_domains, set_interface_dns
+from src.utils.metrics import Metrics
+from src.backend import provisioning
+from src.backend.provisioning import AddressPool, PeerProvisioner, public_key
+from src.backend.config import parse_config
+from src.backend.history import HistoryStore
+from src.backend.netlink import (
+    parse_messages, default_route_interfaces, NetlinkEvent, RTM_NEWLINK, RTM_DELLINK, RTM_NEWROUTE, RTM_NEWADDR, RT_TABLE_MAIN
+)
+
+# rtnetlink notifications recorded from a live kernel (see TestNetlinkDecoder)
+CAPTURE = Path(__file__).parent / "data" / "rtnetlink_veth.bin"
 
 class TestSettingsManager(unittest.TestCase):
     def setUp(self):
@@ -16,7 +39,7 @@ class TestSettingsManager(unittest.TestCase):
     def test_default_settings(self):
         with patch("builtins.open", side_effect=FileNotFoundError):
             manager = SettingsManager()
-            self.assertEqual(manager.get("language"), "en_US")
+            self.assertIsNone(manager.get("language"))
             self.assertFalse(manager.get("start_on_boot"))
 
     def test_save_load(self):
@@ -29,7 +52,7 @@ class TestSettingsManager(unittest.TestCase):
 
 class TestNetworkBackupManager(unittest.TestCase):
     @patch("src.backend.backup.shutil")
-    @patch("src.backend.backup.subprocess.run")
+    @patch("src.backend.runner.subprocess.run")
     def test_create_backup(self, mock_run, mock_shutil):
         # Mock paths
         with patch("pathlib.Path.exists", return_value=True):
@@ -42,5 +65,654 @@ class TestNetworkBackupManager(unittest.TestCase):
                 self.assertTrue(mock_shutil.copytree.called or mock_shutil.copy2.called)
                 self.assertIsNotNone(backup_path)
 
+class TestKillSwitch(unittest.TestCase):
+    ENDPOINTS = [("203.0.113.5", 51820), ("2001:db8::1", 51820), ("198.51.100.7", 443)]
+
+    def test_nft_ruleset_uses_sets(self):
+        ruleset = KillSwitch.build_nft_ruleset("wg0", self.ENDPOINTS)
+        # Replaces any previous table in the same transaction
+        self.assertTrue(ruleset.startswith(f"table inet {TABLE_NAME}\ndelete table inet {TABLE_NAME}\n"))
+        self.assertIn('elements = { "lo", "wg0" }', ruleset)
+        self.assertIn("elements = { 198.51.100.7 . 443, 203.0.113.5 . 51820 }", ruleset)
+        self.assertIn("elements = { 2001:db8::1 . 51820 }", ruleset)
+        self.assertIn("policy drop;", ruleset)
+        # Rule count doesn't grow with the number of endpoints
+        many = [(f"10.0.{i // 256}.{i % 256}", 51820) for i in range(500)]
+        self.assertEqual(KillSwitch.build_nft_ruleset("wg0", many).count("accept"), 3)
+
+    def test_nft_ruleset_without_endpoints(self):
+        ruleset = KillSwitch.build_nft_ruleset("wg0", [])
+        self.assertNotIn("elements = {  }", ruleset)
+        self.assertIn("type ipv6_addr . inet_service\n", ruleset)
+
+    def test_iptables_rules(self):
+        rules = KillSwitch.build_iptables_rules("wg0", self.ENDPOINTS)
+        self.assertIn("-A WGUI_KILLSWITCH -d 203.0.113.5 -p udp --dport 51820 -j ACCEPT", rules)
+        self.assertNotIn("2001:db8::1", rules)
+        self.assertTrue(rules.rstrip().endswith("COMMIT"))
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_enable_disable_single_transaction(self, mock_which, mock_run):
+        runner.clear_cache()
+        mock_which.side_effect = lambda x: "/usr/sbin/" + x
+        ks = KillSwitch()
+        with patch.object(KillSwitch, "get_endpoints", return_value=self.ENDPOINTS):
+            self.assertTrue(ks.enable("wg0", "/path/to/wg0.conf"))
+        self.assertEqual(mock_run.call_count, 1)
+        args, kwargs = mock_run.call_args
+        self.assertEqual(args[0], ["/usr/sbin/nft", "-f", "-"])
+        self.assertIn("@endpoints_v4", kwargs["input"])
+        self.assertTrue(ks.is_active())
+
+        self.assertTrue(ks.disable())
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertIn(f"delete table inet {TABLE_NAME}", mock_run.call_args[1]["input"])
+        self.assertFalse(ks.is_active())
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_enable_needs_resolved_endpoints(self, mock_which, mock_run):
+        runner.clear_cache()
+        mock_which.side_effect = lambda x: "/usr/sbin/" + x
+        ks = KillSwitch()
+        with patch.object(KillSwitch, "get_endpoints", return_value=[]):
+            self.assertFalse(ks.enable("wg0", "/path/to/wg0.conf"))
+        mock_run.assert_not_called()
+        with patch("src.backend.killswitch.read_config", return_value=parse_config(
+                "[Peer]\nEndpoint = a.example:51820\n[Peer]\nEndpoint = b.example:51820\n")), \
+                patch("src.backend.killswitch.resolve_endpoint", side_effect=[[("203.0.113.5", 51820)], []]):
+            self.assertEqual(ks.get_endpoints("/path/to/wg0.conf"), [])
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_falls_back_to_iptables_when_nft_fails(self, mock_which, mock_run):
+        runner.clear_cache()
+        mock_which.side_effect = lambda x: "/usr/sbin/" + x
+        def run(cmd, **kwargs):
+            if cmd[0].endswith("nft"):
+                raise subprocess.CalledProcessError(1, cmd, stderr="Protocol not supported")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+        mock_run.side_effect = run
+        ks = KillSwitch()
+        with patch.object(KillSwitch, "get_endpoints", return_value=self.ENDPOINTS):
+            self.assertTrue(ks.enable("wg0", "/path/to/wg0.conf"))
+        self.assertEqual(ks.backend, "iptables")
+        self.assertIn("-j WGUI_KILLSWITCH", mock_run.call_args_list[-2][1]["input"])
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_disable_without_known_backend(self, mock_which, mock_run):
+        # e.g. a fresh process after a restart with the rules still loaded
+        runner.clear_cache()
+        mock_which.side_effect = lambda x: "/usr/sbin/" + x
+        self.assertTrue(KillSwitch().disable())
+        self.assertEqual(mock_run.call_args_list[0][0][0], ["/usr/sbin/nft", "-f", "-"])
+        self.assertIn(f"delete table inet {TABLE_NAME}", mock_run.call_args_list[0][1]["input"])
+
+def _dns_query(name, qid, qtype=1):
+    qname = b"".join(bytes([len(p)]) + p.encode() for p in name.split(".")) + b"\0"
+    return struct.pack("!HHHHHH", qid, 0x0100, 1, 0, 0, 0) + qname + struct.pack("!HH", qtype, 1)
+
+class FakeUpstream:
+    """Answers A queries for *.example with TTL 300 and NXDOMAIN otherwise."""
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.address = "127.0.0.1:%d" % self.sock.getsockname()[1]
+        self.queries = 0
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while True:
+            try:
+                query, addr = self.sock.recvfrom(512)
+            except OSError:
+                return
+            self.queries += 1
+            qid = query[:2]
+            question = query[12:]
+            if b"\x07example\x00" in question:
+                header = qid + struct.pack("!HHHHH", 0x8180, 1, 1, 0, 0)
+                answer = b"\xc0\x0c" + struct.pack("!HHIH", 1, 1, 300, 4) + socket.inet_aton("192.0.2.1")
+            else:
+                header = qid + struct.pack("!HHHHH", 0x8183, 1, 0, 1, 0)
+                soa_rdata = b"\0\0" + struct.pack("!IIIII", 1, 3600, 600, 86400, 30)
+                answer = b"\0" + struct.pack("!HHIH", 6, 1, 900, len(soa_rdata)) + soa_rdata
+            self.sock.sendto(header + question + answer, addr)
+
+    def close(self):
+        self.sock.close()
+
+class TestDnsStub(unittest.TestCase):
+    def setUp(self):
+        self.upstream = FakeUpstream()
+        self.stub = StubResolver([self.upstream.address], address="127.0.0.1", port=0)
+        self.assertTrue(self.stub.start())
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.client.settimeout(2)
+
+    def tearDown(self):
+        self.client.close()
+        self.stub.stop()
+        self.upstream.close()
+
+    def ask(self, name, qid):
+        self.client.sendto(_dns_query(name, qid), ("127.0.0.1", self.stub.port))
+        return self.client.recv(512)
+
+    def test_repeat_lookups_are_cached(self):
+        first = self.ask("host.example", 1)
+        second = self.ask("HOST.example", 2)
+        self.assertEqual(self.upstream.queries, 1)
+        self.assertEqual(struct.unpack("!H", second[:2])[0], 2)
+        self.assertEqual(first[2:], second[2:])
+        self.assertEqual(self.stub.cache.hits, 1)
+
+    def test_negative_answers_are_cached(self):
+        response = self.ask("missing.invalid", 3)
+        self.assertEqual(struct.unpack("!H", response[2:4])[0] & 0xF, 3)
+        self.ask("missing.invalid", 4)
+        self.assertEqual(self.upstream.queries, 1)
+
+    def test_cache_expiry_and_lru(self):
+        cache = DnsCache(max_entries=2)
+        packet = _dns_query("a.example", 1)
+        cache.put(b"a", packet, 10, [], now=0)
+        cache.put(b"b", packet, 10, [], now=0)
+        cache.get(b"a", 5, now=1)
+        cache.put(b"c", packet, 10, [], now=1)
+        self.assertIsNone(cache.get(b"b", 5, now=2))
+        self.assertIsNotNone(cache.get(b"a", 5, now=2))
+        self.assertIsNone(cache.get(b"a", 5, now=11))
+
+    def test_parse_dns_servers(self):
+        self.assertEqual(parse_dns_servers("10.0.0.1, corp.example, fd00::1"), ["10.0.0.1", "fd00::1"])
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_set_interface_dns(self, mock_which, mock_run):
+        runner.clear_cache()
+        mock_which.side_effect = lambda x: "/usr/bin/resolvectl" if x == "resolvectl" else None
+        dns = "10.0.0.1, corp.example"
+        self.assertEqual(parse_dns_domains(dns), ["corp.example"])
+        self.assertTrue(set_interface_dns("wg0", parse_dns_servers(dns), parse_dns_domains(dns)))
+        self.assertEqual([c[0][0] for c in mock_run.call_args_list], [
+            ["/usr/bin/resolvectl", "dns", "wg0", "10.0.0.1"],
+            ["/usr/bin/resolvectl", "domain", "wg0", "corp.example"],
+        ])
+        runner.clear_cache()
+
+    @patch("src.backend.runner.subprocess.run")
+    @patch("src.backend.runner.shutil.which")
+    def test_set_interface_dns_resolvconf(self, mock_which, mock_run):
+        runner.clear_cache()
+        mock_which.side_effect = lambda x: "/sbin/resolvconf" if x == "resolvconf" else None
+        self.assertTrue(set_interface_dns("wg0", ["1.1.1.1", "9.9.9.9"], ["corp.example"]))
+        args, kwargs = mock_run.call_args
+        self.assertEqual(args[0], ["/sbin/resolvconf", "-a", "tun.wg0", "-m", "0", "-x"])
+        self.assertEqual(kwargs["input"], "nameserver 1.1.1.1\nnameserver 9.9.9.9\nsearch corp.example\n")
+        runner.clear_cache()
+
+class TestMetrics(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        m = Metrics()
+        with m.span("connect", profile="wg0"):
+            pass
+        m.inc("roams")
+        self.assertEqual(m.render(), "# EOF\n")
+
+    def test_render_openmetrics(self):
+        m = Metrics()
+        m.enabled = True
+        with m.span("connect", profile="wg0"):
+            pass
+        with self.assertRaises(RuntimeError):
+            with m.command_span(["/usr/bin/wg-quick", "up", "/etc/wg0.conf"]):
+                raise RuntimeError
+        m.inc("netlink_events", kind="link_up")
+        m.inc("netlink_events", kind="link_up")
+
+        text = m.render()
+        self.assertIn("# TYPE wgui_connect_seconds summary", text)
+        self.assertIn('wgui_connect_seconds_count{profile="wg0"} 1', text)
+        self.assertIn('wgui_command_errors_total{command="wg-quick up"} 1', text)
+        self.assertIn('wgui_netlink_events_total{kind="link_up"} 2', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+class TestAddressPool(unittest.TestCase):
+    def test_allocate_skips_reserved(self):
+        pool = AddressPool("10.8.0.0/29", reserved=["10.8.0.1"])
+        allocated = [pool.allocate() for _ in range(5)]
+        self.assertEqual(allocated, ["10.8.0.2", "10.8.0.3", "10.8.0.4", "10.8.0.5", "10.8.0.6"])
+        with self.assertRaises(ValueError):
+            pool.allocate()
+
+    def test_free_and_reuse(self):
+        pool = AddressPool("10.8.0.0/24")
+        first = pool.allocate()
+        pool.allocate()
+        pool.free(first)
+        self.assertFalse(pool.is_allocated(first))
+        self.assertEqual(pool.allocate(), first)
+
+    def test_persistence_round_trip(self):
+        pool = AddressPool("fd00::/120")
+        addresses = [pool.allocate() for _ in range(10)]
+        pool.free(addresses[3])
+        loaded = AddressPool.from_dict(pool.to_dict())
+        self.assertEqual(loaded.available, pool.available)
+        self.assertEqual(loaded.allocate(), addresses[3])
+        self.assertNotIn(loaded.allocate(), addresses)
+
+class TestPeerProvisioner(unittest.TestCase):
+    def test_rfc7748_public_key(self):
+        private = base64.b64encode(bytes.fromhex(
+            "77076d0a7318a57d3c16c17251b26645df4c2f87ebc0992ab177fba51db92c2a")).decode()
+        self.assertEqual(base64.b64decode(public_key(private)).hex(),
+                         "8520f0098930a754748b7ddcb43ef75a0dbf3a0d26381af4eba4a98eaa9b4e6a")
+
+    def test_provision(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profiles_dir = Path(tmp) / "profiles"
+            profiles_dir.mkdir()
+            with patch("src.backend.profiles.get_profiles_dir", return_value=profiles_dir):
+                manager = ProfileManager()
+            provisioner = PeerProvisioner(manager, Path(tmp) / "servers")
+
+            names = provisioner.provision("hub", 3, "c2VydmVy", "vpn.example.com:51820", "10.8.0.0/24")
+            self.assertEqual(names, ["hub-0001", "hub-0002", "hub-0003"])
+            more = provisioner.provision("hub", 2, "c2VydmVy", "vpn.example.com:51820", "10.8.0.0/24")
+            self.assertEqual(more, ["hub-0004", "hub-0005"])
+
+            client = parse_config((profiles_dir / "hub-0001.conf").read_text())
+            self.assertEqual(client["interface"]["Address"], "10.8.0.2/32")
+            self.assertEqual(client["peers"][0]["Endpoint"], "vpn.example.com:51820")
+
+            server = parse_config(provisioner.peers_path("hub").read_text())
+            self.assertEqual(len(server["peers"]), 5)
+            self.assertEqual(server["peers"][4]["AllowedIPs"], "10.8.0.6/32")
+            self.assertEqual(server["peers"][0]["PublicKey"], public_key(client["interface"]["PrivateKey"]))
+            self.assertEqual(server["peers"][0]["PresharedKey"], client["peers"][0]["PresharedKey"])
+            self.assertEqual(list(profiles_dir.glob(".*")), [])
+
+            # Names must fit in an interface name
+            with self.assertRaises(ValueError):
+                provisioner.provision("wg-concentrator-1", 1, "c2VydmVy", "vpn.example.com:51820", "10.9.0.0/24")
+            self.assertFalse(provisioner.pool_path("wg-concentrator-1").exists())
+
+    def test_failed_write_never_reuses_addresses(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profiles_dir = Path(tmp) / "profiles"
+            profiles_dir.mkdir()
+            with patch("src.backend.profiles.get_profiles_dir", return_value=profiles_dir):
+                manager = ProfileManager()
+            provisioner = PeerProvisioner(manager, Path(tmp) / "servers")
+            args = ("hub", 2, "c2VydmVy", "vpn.example.com:51820", "10.8.0.0/24")
+
+            real_write = provisioning.write_atomic
+            def write(path, content, *rest):
+                if path.name.endswith(".peers.conf"):
+                    raise OSError("disk full")
+                real_write(path, content, *rest)
+            with patch("src.backend.provisioning.write_atomic", side_effect=write):
+                with self.assertRaises(OSError):
+                    provisioner.provision(*args)
+            # No client profile survives, and its addresses are not handed out again
+            self.assertEqual(list(profiles_dir.iterdir()), [])
+            provisioner.provision(*args)
+            client = parse_config((profiles_dir / "hub-0001.conf").read_text())
+            self.assertEqual(client["interface"]["Address"], "10.8.0.4/32")
+
+            # A failed rename removes the profiles already moved into place
+            real_replace = os.replace
+            def replace(src, dst):
+                if str(dst).endswith("c.conf"):
+                    raise OSError("rename failed")
+                real_replace(src, dst)
+            with patch("src.backend.profiles.os.replace", side_effect=replace):
+                self.assertFalse(manager.create_profiles({"a": "x", "b": "y", "c": "z"}))
+            self.assertEqual(sorted(p.name for p in profiles_dir.iterdir()), ["hub-0001.conf", "hub-0002.conf"])
+
+    def test_worker_reports_result(self):
+        from src.ui.main_window import ProvisionWorker
+        provisioner = MagicMock()
+        provisioner.provision.side_effect = [["hub-0001"], ValueError("pool exhausted")]
+        provisioner.peers_path.return_value = Path("/srv/hub.peers.conf")
+        worker = ProvisionWorker(provisioner, {"server": "hub", "count": 1})
+        done, failed = [], []
+        worker.done.connect(lambda names, path: done.append((names, path)))
+        worker.failed.connect(failed.append)
+        worker.run()
+        worker.run()
+        self.assertEqual(done, [(["hub-0001"], "/srv/hub.peers.conf")])
+        self.assertEqual(failed, ["pool exhausted"])
+
+def _rtattr(rta_type, payload):
+    length = 4 + len(payload)
+    return struct.pack("=HH", length, rta_type) + payload + b"\0" * ((4 - length % 4) % 4)
+
+def _nlmsg(msg_type, body):
+    return struct.pack("=IHHII", 16 + len(body), msg_type, 0, 0, 0) + body
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(Path(self.tmp.name) / "history.db")
+        self.day = int(time.time()) // 86400 * 86400
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_wal_mode(self):
+        mode = self.store.reader.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_samples_roll_up_as_deltas(self):
+        start = self.day - 86400 + 100
+        self.store.start_session("wg0", start)
+        self.store.record_sample("wg0", 1000, 100, start + 60)
+        self.store.record_sample("wg0", 3000, 300, start + 3700)
+        # Tunnel recreated: counters restart from zero
+        self.store.record_sample("wg0", 500, 50, self.day + 10)
+        self.store.end_session("wg0", self.day + 20)
+        self.store.flush()
+
+        days = self.store.traffic("wg0", 30, now=self.day + 30)
+        self.assertEqual(days, [(self.day - 86400, 3000, 300), (self.day, 500, 50)])
+        self.assertEqual(self.store.total_traffic("wg0", 30, now=self.day + 30), (3500, 350))
+        self.assertEqual(len(self.store.traffic("wg0", 30, "traffic_hour", now=self.day + 30)), 3)
+        self.assertEqual(self.store.sessions("wg0"), [("wg0", start, self.day + 20, 3500, 350)])
+
+    def test_retention(self):
+        old = self.day - 10 * 86400
+        self.store.start_session("wg0", old)
+        self.store.record_sample("wg0", 1000, 100, old)
+        self.store.record_sample("wg0", 2000, 200, self.day)
+        self.store.prune(self.day + 1)
+        self.store.flush()
+
+        # Minute rows and raw samples from 10 days ago are gone, coarser rollups stay
+        self.assertEqual(len(self.store.traffic("wg0", 30, "traffic_minute", now=self.day)), 1)
+        self.assertEqual(len(self.store.traffic("wg0", 30, "traffic_day", now=self.day)), 2)
+        samples = self.store.reader.execute("SELECT COUNT(*) FROM samples").fetchone()[0]
+        self.assertEqual(samples, 1)
+
+    def test_first_sample_without_session_is_baseline(self):
+        self.store.record_sample("wg0", 5000, 500, self.day + 10)
+        self.store.record_sample("wg0", 6000, 600, self.day + 70)
+        self.store.flush()
+        self.assertEqual(self.store.total_traffic("wg0", 30, now=self.day + 80), (1000, 100))
+
+class TestThemeManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from PySide6.QtWidgets import QApplication
+        # Qt tests run without a display
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.ui.theme import ThemeManager
+        self.manager = ThemeManager()
+
+    def test_compile_is_cached(self):
+        self.assertIs(self.manager.compile("dark"), self.manager.compile("dark"))
+        with self.assertRaises(ValueError):
+            self.manager.compile("sepia")
+
+    def test_switch_only_updates_palette(self):
+        from PySide6.QtGui import QPalette
+        self.manager.apply("dark", self.app)
+        stylesheet = self.app.styleSheet()
+        with patch.object(self.app, "setStyleSheet") as set_stylesheet:
+            self.manager.apply("light", self.app)
+            set_stylesheet.assert_not_called()
+        self.assertEqual(self.app.styleSheet(), stylesheet)
+        self.assertEqual(self.app.palette().color(QPalette.Window).name(), "#ffffff")
+        self.assertEqual(self.manager.current, "light")
+
+        # Unknown names fall back to the default theme
+        self.manager.apply("sepia", self.app)
+        self.assertEqual(self.manager.current, "dark")
+
+class TestLocalizationManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from PySide6.QtWidgets import QApplication
+        # Qt tests run without a display
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.utils.i18n import LocalizationManager
+        self.manager = LocalizationManager(self.app)
+
+    def tearDown(self):
+        self.manager.load_language("en_US")
+        self.app.processEvents()
+
+    def test_source_language_loads_nothing(self):
+        self.assertTrue(self.manager.load_language("en_US"))
+        self.assertTrue(self.manager.load_language("en_GB"))
+        self.assertEqual(self.manager.cache, {})
+        self.assertEqual(self.manager.installed, [])
+
+    def test_no_language_follows_system_locale(self):
+        from PySide6.QtCore import QLocale
+        with patch("src.utils.i18n.QLocale.system", return_value=QLocale("pt_BR")):
+            self.assertTrue(self.manager.load_language(None))
+        self.assertEqual(self.manager.language, "pt_BR")
+
+    def test_translations_come_from_bundle_and_are_cached(self):
+        from src.utils.i18n import LANGUAGES
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                for code in LANGUAGES:
+                    self.assertTrue(self.manager.load_language(code), code)
+            finally:
+                os.chdir(cwd)
+        translators = self.manager.translators("pt_BR")
+        self.assertIs(self.manager.translators("pt_BR"), translators)
+
+        # A missing translation leaves the current language in place
+        self.assertFalse(self.manager.load_language("xx_XX"))
+        self.assertEqual(self.manager.language, "pt_BR")
+
+    def test_widgets_retranslate_on_language_change(self):
+        from src.ui.main_window import DiagnosticsView
+        view = DiagnosticsView()
+        self.assertEqual(view.title_label.text(), "Diagnostics")
+        self.manager.load_language("pt_BR")
+        self.app.processEvents()
+        self.assertEqual(view.title_label.text(), "Diagnóstico")
+        self.manager.load_language("en_US")
+        self.app.processEvents()
+        self.assertEqual(view.title_label.text(), "Diagnostics")
+
+class TestNetlinkDecoder(unittest.TestCase):
+    # Hand-built with struct.pack to mirror the notifications for a wg-quick tunnel
+    LINK_UP = _nlmsg(RTM_NEWLINK, struct.pack("=BxHiII", 0, 65534, 7, 0x1 | 0x40 | 0x80, 0)
+                     + _rtattr(3, b"wg0\0"))
+    LINK_DEL = _nlmsg(RTM_DELLINK, struct.pack("=BxHiII", 0, 65534, 7, 0x80, 0)
+                      + _rtattr(3, b"wg0\0"))
+    DEFAULT_ROUTE = _nlmsg(RTM_NEWROUTE, struct.pack("=BBBBBBBBI", socket.AF_INET, 0, 0, 0, 254, 3, 0, 1, 0)
+                           + _rtattr(15, struct.pack("=I", 254))
+                           + _rtattr(5, socket.inet_aton("192.168.1.1"))
+                           + _rtattr(4, struct.pack("=i", 2)))
+    ADDR = _nlmsg(RTM_NEWADDR, struct.pack("=BBBBi", socket.AF_INET, 24, 0, 0, 7)
+                  + _rtattr(2, socket.inet_aton("10.0.0.2"))
+                  + _rtattr(3, b"wg0\0"))
+
+    def test_link_events(self):
+        events = parse_messages(self.LINK_UP + self.LINK_DEL)
+        self.assertEqual([e.kind for e in events], ["link_up", "link_removed"])
+        self.assertEqual(events[0].ifname, "wg0")
+        self.assertEqual(events[0].index, 7)
+        self.assertTrue(events[0].up)
+
+    def test_route_event(self):
+        event, = parse_messages(self.DEFAULT_ROUTE)
+        self.assertEqual(event.kind, "route_added")
+        self.assertTrue(event.is_default_route)
+        self.assertEqual(event.gateway, "192.168.1.1")
+        self.assertEqual(event.index, 2)
+        self.assertEqual(event.table, 254)
+
+    def test_addr_event(self):
+        event, = parse_messages(self.ADDR)
+        self.assertEqual(event.kind, "addr_added")
+        self.assertEqual(event.address, "10.0.0.2")
+        self.assertEqual(event.prefixlen, 24)
+        self.assertEqual(event.ifname, "wg0")
+
+    def test_captured_veth_lifecycle(self):
+        # Real kernel notifications: `ip link add wgtest0 type veth ...`,
+        # `ip link set wgtest0 up`, a default route via it added and removed
+        # in the main table, then `ip link del wgtest0`
+        events = parse_messages(CAPTURE.read_bytes())
+        self.assertEqual([e.kind for e in events], [
+            "link_down", "link_up", "link_up", "route_added", "route_removed", "link_down", "link_removed"
+        ])
+        self.assertEqual({e.index for e in events}, {8})
+        self.assertEqual({e.ifname for e in events if e.kind.startswith("link_")}, {"wgtest0"})
+        route = events[3]
+        self.assertTrue(route.is_default_route)
+        self.assertEqual(route.table, RT_TABLE_MAIN)
+
+    def test_default_route_interfaces(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            route, route6 = Path(tmp) / "route", Path(tmp) / "ipv6_route"
+            route.write_text(
+                "Iface\tDestination\tGateway\tFlags\tRefCnt\tUse\tMetric\tMask\tMTU\tWindow\tIRTT\n"
+                "wlan0\t00000000\t0101A8C0\t0003\t0\t0\t600\t00000000\t0\t0\t0\n"
+                "wlan0\t0001A8C0\t00000000\t0001\t0\t0\t600\t00FFFFFF\t0\t0\t0\n"
+            )
+            route6.write_text(
+                f"{'0' * 32} 00 {'0' * 32} 00 {'0' * 32} 00000000 00000001 00000000 00000001 wg0\n"
+                f"{'0' * 32} 00 {'0' * 32} 00 {'0' * 32} ffffffff 00000001 00000000 00200200 lo\n"
+            )
+            with patch("src.backend.netlink.PROC_ROUTE", str(route)), \
+                    patch("src.backend.netlink.PROC_IPV6_ROUTE", str(route6)):
+                self.assertEqual(default_route_interfaces(), ["wlan0", "wg0"])
+
+    def test_truncated_and_unknown(self):
+        done = struct.pack("=IHHII", 20, 3, 0, 0, 0) + b"\0" * 4
+        events = parse_messages(done + self.LINK_UP + self.LINK_DEL[:10])
+        self.assertEqual([e.kind for e in events], ["link_up"])
+
+class TestTunnelStateTracking(unittest.TestCase):
+    """Netlink event sequences fed to the app, with the UI and backends mocked."""
+    def setUp(self):
+        from src.main import WireGuardApp
+        app = WireGuardApp.__new__(WireGuardApp)
+        app.active_profile = None
+        app.tunnel_index = 0
+        for name in ("profile_manager", "settings_manager", "wg_service", "history", "tray", "main_window",
+                     "poll_timer", "roam_timer", "roam_verify_timer", "handshake_timer", "sample_timer"):
+            setattr(app, name, MagicMock())
+        self.app = app
+        self.current_index = 0
+        patcher = patch("src.main.socket.if_nametoindex", side_effect=self.if_nametoindex)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def if_nametoindex(self, name):
+        if not self.current_index:
+            raise OSError("No such device")
+        return self.current_index
+
+    def feed(self, *events):
+        for event in events:
+            self.app.handle_network_event(event)
+
+    def test_connect_flap_keeps_session(self):
+        # wg-quick up returned; its link down-then-up notifications follow
+        self.current_index = 8
+        self.app.set_tunnel_state("wgtest0", "connected")
+        self.feed(*[e for e in parse_messages(CAPTURE.read_bytes()) if e.kind in ("link_down", "link_up")][:3])
+        self.assertEqual(self.app.active_profile, "wgtest0")
+        self.assertEqual(self.app.tunnel_index, 8)
+        self.app.history.start_session.assert_called_once_with("wgtest0")
+        self.app.history.end_session.assert_not_called()
+
+    def test_external_removal_ends_session(self):
+        self.current_index = 8
+        self.app.set_tunnel_state("wgtest0", "connected")
+        events = parse_messages(CAPTURE.read_bytes())
+        self.feed(*events[:3])
+        # `ip link del`: the link is already gone when its events are read
+        self.current_index = 0
+        self.feed(*events[-2:])
+        self.assertIsNone(self.app.active_profile)
+        self.app.history.end_session.assert_called_once_with("wgtest0")
+
+    def test_admin_down_ends_session(self):
+        self.current_index = 8
+        self.app.set_tunnel_state("wg0", "connected")
+        self.feed(NetlinkEvent("link_up", 8, "wg0", up=True), NetlinkEvent("link_down", 8, "wg0"))
+        self.assertIsNone(self.app.active_profile)
+
+    def test_reconnect_keeps_session(self):
+        self.current_index = 8
+        self.app.set_tunnel_state("wg0", "connected")
+        self.feed(NetlinkEvent("link_up", 8, "wg0", up=True))
+        # reconnect_tunnel replaced the link before these are read
+        self.current_index = 9
+        self.feed(NetlinkEvent("link_down", 8, "wg0"), NetlinkEvent("link_removed", 8, "wg0"),
+                  NetlinkEvent("link_down", 9, "wg0"), NetlinkEvent("link_up", 9, "wg0", up=True))
+        self.assertEqual(self.app.active_profile, "wg0")
+        self.assertEqual(self.app.tunnel_index, 9)
+        self.app.history.end_session.assert_not_called()
+
+    def test_roam_waits_for_a_new_default_route(self):
+        self.current_index = 8
+        self.app.set_tunnel_state("wg0", "connected")
+        removed, added = NetlinkEvent("route_removed", 2, table=RT_TABLE_MAIN), \
+            NetlinkEvent("route_added", 3, table=RT_TABLE_MAIN)
+        with patch("src.main.default_route_interfaces", return_value=["wg0"]):
+            self.feed(removed)
+        self.app.roam_timer.start.assert_not_called()
+        self.feed(added)
+        self.app.roam_timer.start.assert_called_once()
+        # Switching between uplinks with one still up roams right away
+        with patch("src.main.default_route_interfaces", return_value=["eth0"]):
+            self.feed(removed)
+        self.assertEqual(self.app.roam_timer.start.call_count, 2)
+
+    def test_disconnect_clears_kill_switch_from_earlier_run(self):
+        self.app.kill_switch = MagicMock()
+        self.app.kill_switch.is_active.return_value = False
+        self.app.settings_manager.get.side_effect = lambda key, default=None: key == "kill_switch" or default
+        self.app.dns_stub = None
+        self.app.set_tunnel_state("wg0", "connected")
+        self.app.wg_service.disconnect.return_value = False
+        self.app._disconnect_tunnel("wg0")
+        self.app.kill_switch.disable.assert_called_once()
+
+        self.app.on_kill_switch_changed(False)
+        self.assertEqual(self.app.kill_switch.disable.call_count, 2)
+
+    def test_dns_override_without_cache(self):
+        settings = {"dns_cache": False, "dns_override": "1.1.1.1"}
+        self.app.settings_manager.get.side_effect = lambda key, default=None: settings.get(key, default)
+        self.app.dns_stub = None
+        with patch("src.main.read_config", return_value=parse_config("[Interface]\nDNS = 10.0.0.1, corp.example\n")), \
+                patch("src.main.set_interface_dns") as set_dns:
+            self.app.start_dns_stub("wg0")
+        set_dns.assert_called_once_with("wg0", ["1.1.1.1"], ["corp.example"])
+        self.assertIsNone(self.app.dns_stub)
+
+    def test_external_tunnel_is_adopted(self):
+        self.current_index = 5
+        self.app.profile_manager.get_profile_path.return_value.exists.return_value = True
+        self.feed(NetlinkEvent("link_up", 5, "wg0", up=True))
+        self.assertEqual(self.app.active_profile, "wg0")
+        self.assertEqual(self.app.tunnel_index, 5)
+
 if __name__ == '__main__':
     unittest.main()